@@ -0,0 +1,137 @@
+# app/api/async_boards.py
+# Async twin of app/api/boards.py, mounted when ASYNC_DB_ENABLED
+from typing import Literal
+from uuid import UUID
+from fastapi import APIRouter, Depends, status, Body, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.board_schema import BoardCreateSchema, BoardUpdateSchema, BoardResponseSchema
+from app.schemas.pagination import PaginationParams, PaginatedResponse, CursorPaginatedResponse, SortParams
+from app.core.dependencies import get_async_db, require_project_roles_async, require_board_scope_async
+from app.core.etag import etag_matches, list_etag_async, not_modified, object_etag, with_etag
+from app.core.fast_json import fast_json
+from app.core.sparse_fields import parse_fields, select_schema, sparse_page, trim
+from app.core.rate_limit import limiter
+from app.models.membership import UserRole
+from app.services import async_board_service
+
+BoardPage = PaginatedResponse[BoardResponseSchema] | CursorPaginatedResponse[BoardResponseSchema]
+
+router = APIRouter(tags=["boards"])
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=BoardResponseSchema)
+@limiter.limit("20/minute")
+async def create_board(
+    request: Request,
+    project_id: UUID,
+    board_data: BoardCreateSchema = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Create a new board in the project."""
+    return await async_board_service.create_board(project_id, board_data, db)
+
+
+@router.get("/", response_model=BoardPage)
+@limiter.limit("100/minute")
+async def get_boards(
+    request: Request,
+    response: Response,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    # Pagination
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    mode: Literal["page", "cursor"] = Query("page", description="page (default) or cursor (keyset) pagination"),
+    cursor: str | None = Query(None, description="next_cursor/prev_cursor of a previous response"),
+    include_total: bool = Query(True, description="Count matching rows (false: has_next only)"),
+    total_mode: Literal["exact", "estimate", "cached"] = Query("exact", description="exact, estimate (planner) or cached (short TTL)"),
+    # Sorting
+    sort_by: str | None = Query(None, description="Sort by: name, position, created_at, updated_at"),
+    sort_order: str = Query("asc", description="asc or desc"),
+    # Filters
+    name: str | None = Query(None, description="Filter by name"),
+    archived: bool = Query(False, description="Include archived boards"),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,position"),
+    response_format: Literal["json", "columnar"] = Query(
+        "json", alias="format", description="json (default) or columnar (one array per field)"
+    )
+):
+    """List boards (paginated, sortable, filterable); 304 when If-None-Match holds the current ETag."""
+    selected = parse_fields(BoardResponseSchema, fields)
+    columnar = response_format == "columnar"
+    etag = await list_etag_async(request, "boards", project_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        mode=mode,
+        cursor=cursor,
+        include_total=include_total,
+        total_mode=total_mode,
+    )
+    sort_params = SortParams(sort_by=sort_by, sort_order=sort_order)
+
+    boards = await async_board_service.get_boards(
+        project_id=project_id,
+        include_archived=archived,
+        pagination=pagination,
+        sort_params=sort_params,
+        name_filter=name,
+        db=db,
+        fields=selected,
+        columnar=columnar,
+    )
+    model = BoardPage if selected is None else sparse_page(BoardResponseSchema, selected)
+    # Sparse and columnar pages don't match the response_model
+    return fast_json(model, with_etag(request, response, etag, boards), response, always=selected is not None or columnar)
+
+
+@router.get("/{board_id}", response_model=BoardResponseSchema)
+@limiter.limit("120/minute")
+async def get_board(
+    request: Request,
+    response: Response,
+    project_id: UUID,
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,position")
+):
+    """Get a specific board."""
+    selected = parse_fields(BoardResponseSchema, fields)
+    board = await async_board_service.get_cached_board(project_id, board_id, db)
+    etag = object_etag("board", board, selected)
+    content = with_etag(request, response, etag, trim(board, selected))
+    return fast_json(select_schema(BoardResponseSchema, selected), content, response, always=selected is not None)
+
+
+@router.patch("/{board_id}", response_model=BoardResponseSchema)
+@limiter.limit("60/minute")
+async def update_board(
+    request: Request,
+    project_id: UUID,
+    board_id: UUID,
+    board_data: BoardUpdateSchema,
+    db: AsyncSession = Depends(get_async_db),
+    scope=Depends(require_board_scope_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Update a board."""
+    return await async_board_service.update_board(project_id, board_id, board_data, db, board=scope["board"])
+
+
+@router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit("20/minute")
+async def delete_board(
+    request: Request,
+    project_id: UUID,
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    scope=Depends(require_board_scope_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Delete a board and all its tasks."""
+    await async_board_service.delete_board(project_id, board_id, db, board=scope["board"])
@@ -0,0 +1,128 @@
+# app/api/async_projects.py
+# Async twin of app/api/projects.py (project CRUD), mounted when ASYNC_DB_ENABLED
+from typing import Literal
+from uuid import UUID
+from fastapi import APIRouter, Depends, status, Body, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.project_schema import ProjectCreateSchema, ProjectUpdateSchema, ProjectResponseSchema
+from app.schemas.pagination import PaginationParams, PaginatedResponse, CursorPaginatedResponse, SortParams
+from app.core.dependencies import get_async_db, get_current_user_async, require_project_roles_async
+from app.core.etag import etag_matches, list_etag_async, not_modified, object_etag, with_etag
+from app.core.fast_json import fast_json
+from app.core.sparse_fields import parse_fields, select_schema, sparse_page, trim
+from app.core.rate_limit import limiter
+from app.models.membership import UserRole
+from app.services import async_projects_service
+
+ProjectPage = PaginatedResponse[ProjectResponseSchema] | CursorPaginatedResponse[ProjectResponseSchema]
+
+router = APIRouter(tags=["projects"])
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=ProjectResponseSchema)
+@limiter.limit("10/minute")
+async def create_project(
+    request: Request,
+    project_data: ProjectCreateSchema = Body(...),
+    current_user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create a new project. Creator becomes OWNER automatically."""
+    return await async_projects_service.create_project_membership(
+        project_details=project_data,
+        user_id=current_user["id"],
+        db=db,
+    )
+
+
+@router.get("/", response_model=ProjectPage)
+@limiter.limit("60/minute")
+async def get_projects(
+    request: Request,
+    response: Response,
+    current_user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+    # Pagination
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    mode: Literal["page", "cursor"] = Query("page", description="page (default) or cursor (keyset) pagination"),
+    cursor: str | None = Query(None, description="next_cursor/prev_cursor of a previous response"),
+    include_total: bool = Query(True, description="Count matching rows (false: has_next only)"),
+    total_mode: Literal["exact", "estimate", "cached"] = Query("exact", description="exact, estimate (planner) or cached (short TTL)"),
+    # Sorting
+    sort_by: str | None = Query(None, description="Sort by: name, created_at"),
+    sort_order: str = Query("asc", description="Sort order: asc, desc"),
+    # Filters
+    name: str | None = Query(None, description="Filter by project name (case-insensitive)"),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name")
+):
+    """List all projects where user is a member (paginated, sortable, filterable); 304 when If-None-Match holds the current ETag."""
+    selected = parse_fields(ProjectResponseSchema, fields)
+    etag = await list_etag_async(request, "projects", current_user["id"])
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        mode=mode,
+        cursor=cursor,
+        include_total=include_total,
+        total_mode=total_mode,
+    )
+    sort_params = SortParams(sort_by=sort_by, sort_order=sort_order)
+
+    projects = await async_projects_service.get_projects(
+        user_id=current_user["id"],
+        pagination=pagination,
+        sort_params=sort_params,
+        name_filter=name,
+        db=db,
+        fields=selected,
+    )
+    model = ProjectPage if selected is None else sparse_page(ProjectResponseSchema, selected)
+    return fast_json(model, with_etag(request, response, etag, projects), response, always=selected is not None)
+
+
+@router.get("/{project_id}", response_model=ProjectResponseSchema)
+@limiter.limit("120/minute")
+async def get_project(
+    request: Request,
+    response: Response,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name")
+):
+    """Get a specific project."""
+    selected = parse_fields(ProjectResponseSchema, fields)
+    project = await async_projects_service.get_cached_project(project_id, db)
+    etag = object_etag("project", project, selected)
+    content = with_etag(request, response, etag, trim(project, selected))
+    return fast_json(select_schema(ProjectResponseSchema, selected), content, response, always=selected is not None)
+
+
+@router.patch("/{project_id}", response_model=ProjectResponseSchema)
+@limiter.limit("30/minute")
+async def update_project(
+    request: Request,
+    project_id: UUID,
+    project_data: ProjectUpdateSchema,
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Update project name."""
+    return await async_projects_service.update_project(project_id, project_data, db)
+
+
+@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit("10/minute")
+async def delete_project(
+    request: Request,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER]))
+):
+    """Delete project (only OWNER)."""
+    await async_projects_service.delete_project(project_id, db)
@@ -0,0 +1,156 @@
+# app/api/async_tasks.py
+# Async twin of app/api/tasks.py, mounted when ASYNC_DB_ENABLED
+from typing import Literal
+from uuid import UUID
+from fastapi import APIRouter, Depends, status, Body, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskResponseSchema
+from app.schemas.pagination import PaginationParams, PaginatedResponse, CursorPaginatedResponse, SortParams
+from app.core.dependencies import (
+    get_async_db,
+    require_project_roles_async,
+    require_board_scope_async,
+    require_task_scope_async,
+)
+from app.core.etag import etag_matches, list_etag_async, not_modified, object_etag, with_etag
+from app.core.fast_json import fast_json
+from app.core.sparse_fields import parse_fields, select_schema, sparse_page, trim
+from app.core.rate_limit import limiter
+from app.models.membership import UserRole
+from app.models.task import TaskStatus, PriorityLevel
+from app.services import async_board_service, async_task_service
+
+TaskPage = PaginatedResponse[TaskResponseSchema] | CursorPaginatedResponse[TaskResponseSchema]
+
+router = APIRouter(tags=["tasks"])
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=TaskResponseSchema)
+@limiter.limit("50/minute")
+async def create_task(
+    request: Request,
+    project_id: UUID,
+    board_id: UUID,
+    task_data: TaskCreateSchema = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    scope=Depends(require_board_scope_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Create a new task in the board."""
+    return await async_task_service.create_task(project_id, board_id, task_data, db)
+
+
+@router.get("/", response_model=TaskPage)
+@limiter.limit("120/minute")
+async def get_tasks(
+    request: Request,
+    response: Response,
+    project_id: UUID,
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    scope=Depends(require_board_scope_async([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    # Pagination
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    mode: Literal["page", "cursor"] = Query("page", description="page (default) or cursor (keyset) pagination"),
+    cursor: str | None = Query(None, description="next_cursor/prev_cursor of a previous response"),
+    include_total: bool = Query(True, description="Count matching rows (false: has_next only)"),
+    total_mode: Literal["exact", "estimate", "cached"] = Query("exact", description="exact, estimate (planner) or cached (short TTL)"),
+    # Sorting
+    sort_by: str | None = Query(
+        None,
+        description="Sort by: name, position, created_at, updated_at, due_date, status, priority"
+    ),
+    sort_order: str = Query("asc", description="asc or desc"),
+    # Filters
+    archived: bool = Query(False, description="Include archived tasks"),
+    status: TaskStatus | None = Query(None, description="Filter by status"),
+    priority: PriorityLevel | None = Query(None, description="Filter by priority"),
+    assignee_id: UUID | None = Query(None, description="Filter by assignee"),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,position,status"),
+    response_format: Literal["json", "columnar"] = Query(
+        "json", alias="format", description="json (default) or columnar (one array per field)"
+    )
+):
+    """List tasks (paginated, sortable, filterable)."""
+    selected = parse_fields(TaskResponseSchema, fields)
+    columnar = response_format == "columnar"
+    etag = await list_etag_async(request, "tasks", board_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        mode=mode,
+        cursor=cursor,
+        include_total=include_total,
+        total_mode=total_mode,
+    )
+    sort_params = SortParams(sort_by=sort_by, sort_order=sort_order)
+
+    tasks = await async_task_service.get_tasks(
+        board_id=board_id,
+        include_archived=archived,
+        pagination=pagination,
+        sort_params=sort_params,
+        status_filter=status,
+        priority_filter=priority,
+        assignee_filter=assignee_id,
+        db=db,
+        fields=selected,
+        columnar=columnar,
+    )
+    model = TaskPage if selected is None else sparse_page(TaskResponseSchema, selected)
+    # Sparse and columnar pages don't match the response_model
+    return fast_json(model, with_etag(request, response, etag, tasks), response, always=selected is not None or columnar)
+
+
+@router.get("/{task_id}", response_model=TaskResponseSchema)
+@limiter.limit("150/minute")
+async def get_task(
+    request: Request,
+    response: Response,
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    membership=Depends(require_project_roles_async([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,position,status")
+):
+    """Get a specific task."""
+    selected = parse_fields(TaskResponseSchema, fields)
+    await async_board_service.get_cached_board(project_id, board_id, db)
+    task = await async_task_service.get_cached_task(board_id, task_id, db)
+    etag = object_etag("task", task, selected)
+    content = with_etag(request, response, etag, trim(task, selected))
+    return fast_json(select_schema(TaskResponseSchema, selected), content, response, always=selected is not None)
+
+
+@router.patch("/{task_id}", response_model=TaskResponseSchema)
+@limiter.limit("100/minute")
+async def update_task(
+    request: Request,
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID,
+    task_data: TaskUpdateSchema,
+    db: AsyncSession = Depends(get_async_db),
+    scope=Depends(require_task_scope_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Update a task (changing board_id moves it to another board of the same project)."""
+    return await async_task_service.update_task(project_id, board_id, task_id, task_data, db, task=scope["task"])
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit("30/minute")
+async def delete_task(
+    request: Request,
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    scope=Depends(require_task_scope_async([UserRole.OWNER, UserRole.EDITOR]))
+):
+    """Delete a task."""
+    await async_task_service.delete_task(board_id, task_id, db, task=scope["task"])
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, status, Body, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from slowapi.util import get_remote_address
 from app.core.rate_limit import limiter
 from app.schemas.user_schema import UserRegisterSchema, UserResponseSchema
 from app.core.dependencies import get_db, get_current_user, oauth2_scheme
@@ -11,17 +12,20 @@ router = APIRouter(tags=["auth"])
 
 @router.post("/register", status_code=status.HTTP_201_CREATED,response_model=UserResponseSchema)
 @limiter.limit("5/minute")
-def register(request: Request,user_data: UserRegisterSchema, db: Session = Depends(get_db)):
-    return auth_service.register_user(user_data, db)
+async def register(request: Request,user_data: UserRegisterSchema, db: Session = Depends(get_db)):
+    return await auth_service.register_user(user_data, db)
 
 @router.post("/login")
 @limiter.limit("10/minute")
-def login(request: Request,credentials: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    return auth_service.authenticate_user(credentials.username, credentials.password, db)
+async def login(request: Request,credentials: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    # async: argon2 is awaited on the hashing pool instead of holding a threadpool thread
+    return await auth_service.authenticate_user(
+        credentials.username, credentials.password, db, client_ip=get_remote_address(request)
+    )
 
 @router.post("/refresh")
-def refresh(refresh_token: str = Body(..., embed=True)):
-    return auth_service.refresh_access_token(refresh_token)
+def refresh(refresh_token: str = Body(..., embed=True), db: Session = Depends(get_db)):
+    return auth_service.refresh_access_token(refresh_token, db)
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 def logout(
@@ -35,3 +39,15 @@ def logout(
     until it naturally expires.
     """
     auth_service.logout(token)
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+def logout_all(
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Logout from every device.
+
+    Revokes all access and refresh tokens issued to the current user.
+    """
+    auth_service.logout_all(current_user["id"], db)
@@ -1,17 +1,25 @@
 # app/api/projects.py
+from typing import Literal
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, Body, Query, Request
+from fastapi import APIRouter, Depends, status, Body, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.schemas.project_schema import ProjectCreateSchema, ProjectUpdateSchema, ProjectResponseSchema
 from app.schemas.membership_schema import AddMemberSchema, ChangeRoleMemberSchema, MemberResponseSchema
-from app.schemas.pagination import PaginationParams, PaginatedResponse, SortParams
-from app.core.dependencies import get_db, get_current_user, require_project_roles
+from app.schemas.pagination import PaginationParams, PaginatedResponse, CursorPaginatedResponse, SortParams
+from app.core.dependencies import get_db, get_read_db, get_current_user, require_project_roles
+from app.core.etag import etag_matches, list_etag, not_modified, object_etag, with_etag
+from app.core.fast_json import fast_json
+from app.core.sparse_fields import parse_fields, select_schema, sparse_page, trim
 from app.core.rate_limit import limiter
 from app.models.membership import UserRole
 from app.services import projects_service, membership_service
 
+ProjectPage = PaginatedResponse[ProjectResponseSchema] | CursorPaginatedResponse[ProjectResponseSchema]
+
 router = APIRouter(tags=["projects"])
+# Membership endpoints stay on the sync stack when ASYNC_DB_ENABLED swaps `router`
+members_router = APIRouter(tags=["projects"])
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=ProjectResponseSchema)
 @limiter.limit("10/minute")  
@@ -29,44 +37,71 @@ def create_project(
     )
 
 
-@router.get("/", response_model=PaginatedResponse[ProjectResponseSchema])
+@router.get("/", response_model=ProjectPage)
 @limiter.limit("60/minute")
 def get_projects(
     request: Request,
+    response: Response,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     # Pagination
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    mode: Literal["page", "cursor"] = Query("page", description="page (default) or cursor (keyset) pagination"),
+    cursor: str | None = Query(None, description="next_cursor/prev_cursor of a previous response"),
+    include_total: bool = Query(True, description="Count matching rows (false: has_next only)"),
+    total_mode: Literal["exact", "estimate", "cached"] = Query("exact", description="exact, estimate (planner) or cached (short TTL)"),
     # Sorting
     sort_by: str | None = Query(None, description="Sort by: name, created_at"),
     sort_order: str = Query("asc", description="Sort order: asc, desc"),
     # Filters
-    name: str | None = Query(None, description="Filter by project name (case-insensitive)")
+    name: str | None = Query(None, description="Filter by project name (case-insensitive)"),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name")
 ):
-    """List all projects where user is a member (paginated, sortable, filterable)."""
-    pagination = PaginationParams(page=page, page_size=page_size)
+    """List all projects where user is a member (paginated, sortable, filterable); 304 when If-None-Match holds the current ETag."""
+    selected = parse_fields(ProjectResponseSchema, fields)
+    etag = list_etag(request, "projects", current_user["id"], db)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        mode=mode,
+        cursor=cursor,
+        include_total=include_total,
+        total_mode=total_mode,
+    )
     sort_params = SortParams(sort_by=sort_by, sort_order=sort_order)
     
-    return projects_service.get_projects(
+    projects = projects_service.get_projects(
         user_id=current_user["id"],
         pagination=pagination,
         sort_params=sort_params,
         name_filter=name,
-        db=db
+        db=db,
+        fields=selected,
     )
+    model = ProjectPage if selected is None else sparse_page(ProjectResponseSchema, selected)
+    return fast_json(model, with_etag(request, response, etag, projects), response, always=selected is not None)
 
 
 @router.get("/{project_id}", response_model=ProjectResponseSchema)
 @limiter.limit("120/minute")
 def get_project(
     request: Request,
+    response: Response,
     project_id: UUID,
-    db: Session = Depends(get_db),
-    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER]))
+    db: Session = Depends(get_read_db),
+    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name")
 ):
     """Get a specific project."""
-    return projects_service.get_project_by_id(project_id, db)
+    selected = parse_fields(ProjectResponseSchema, fields)
+    project = projects_service.get_cached_project(project_id, db)
+    etag = object_etag("project", project, selected)
+    content = with_etag(request, response, etag, trim(project, selected))
+    return fast_json(select_schema(ProjectResponseSchema, selected), content, response, always=selected is not None)
 
 
 @router.patch("/{project_id}", response_model=ProjectResponseSchema)
@@ -96,19 +131,19 @@ def delete_project(
 
 # --- Membership endpoints ---
 
-@router.get("/{project_id}/members", response_model=list[MemberResponseSchema])
+@members_router.get("/{project_id}/members", response_model=list[MemberResponseSchema])
 @limiter.limit("60/minute")
 def list_members(
     request: Request,
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER]))
 ):
     """List all project members."""
     return projects_service.get_project_members(project_id, db)
 
 
-@router.post("/{project_id}/members/add/{user_id}", status_code=status.HTTP_201_CREATED, response_model=MemberResponseSchema)
+@members_router.post("/{project_id}/members/add/{user_id}", status_code=status.HTTP_201_CREATED, response_model=MemberResponseSchema)
 @limiter.limit("20/minute")
 def add_member(
     request: Request,
@@ -125,7 +160,7 @@ def add_member(
     )
 
 
-@router.delete("/{project_id}/members/remove/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@members_router.delete("/{project_id}/members/remove/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 @limiter.limit("20/minute")
 def remove_member(
     request: Request,
@@ -138,7 +173,7 @@ def remove_member(
     membership_service.remove_member(project_id, user_id, db)
 
 
-@router.patch("/{project_id}/members/change-role/{user_id}")
+@members_router.patch("/{project_id}/members/change-role/{user_id}")
 @limiter.limit("30/minute")
 def change_member_role(
     request: Request,
@@ -1,15 +1,21 @@
 # app/api/tasks.py
+from typing import Literal
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, Body, Query, Request
+from fastapi import APIRouter, Depends, status, Body, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskResponseSchema
-from app.schemas.pagination import PaginationParams, PaginatedResponse, SortParams
-from app.core.dependencies import get_db, require_project_roles
+from app.schemas.pagination import PaginationParams, PaginatedResponse, CursorPaginatedResponse, SortParams
+from app.core.dependencies import get_db, get_read_db, require_project_roles, require_board_scope, require_task_scope
+from app.core.etag import etag_matches, list_etag, not_modified, object_etag, with_etag
+from app.core.fast_json import fast_json
+from app.core.sparse_fields import parse_fields, select_schema, sparse_page, trim
 from app.core.rate_limit import limiter
 from app.models.membership import UserRole
 from app.models.task import TaskStatus, PriorityLevel
-from app.services import task_service
+from app.services import board_service, task_service
+
+TaskPage = PaginatedResponse[TaskResponseSchema] | CursorPaginatedResponse[TaskResponseSchema]
 
 router = APIRouter(tags=["tasks"])
 
@@ -22,23 +28,28 @@ def create_task(
     board_id: UUID,
     task_data: TaskCreateSchema = Body(...),
     db: Session = Depends(get_db),
-    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR]))
+    scope=Depends(require_board_scope([UserRole.OWNER, UserRole.EDITOR]))
 ):
     """Create a new task in the board."""
     return task_service.create_task(project_id, board_id, task_data, db)
 
 
-@router.get("/", response_model=PaginatedResponse[TaskResponseSchema])
+@router.get("/", response_model=TaskPage)
 @limiter.limit("120/minute")
 def get_tasks(
     request: Request,
+    response: Response,
     project_id: UUID,
     board_id: UUID,
-    db: Session = Depends(get_db),
-    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    db: Session = Depends(get_read_db),
+    scope=Depends(require_board_scope([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
     # Pagination
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    mode: Literal["page", "cursor"] = Query("page", description="page (default) or cursor (keyset) pagination"),
+    cursor: str | None = Query(None, description="next_cursor/prev_cursor of a previous response"),
+    include_total: bool = Query(True, description="Count matching rows (false: has_next only)"),
+    total_mode: Literal["exact", "estimate", "cached"] = Query("exact", description="exact, estimate (planner) or cached (short TTL)"),
     # Sorting
     sort_by: str | None = Query(
         None, 
@@ -49,7 +60,11 @@ def get_tasks(
     archived: bool = Query(False, description="Include archived tasks"),
     status: TaskStatus | None = Query(None, description="Filter by status"),
     priority: PriorityLevel | None = Query(None, description="Filter by priority"),
-    assignee_id: UUID | None = Query(None, description="Filter by assignee")
+    assignee_id: UUID | None = Query(None, description="Filter by assignee"),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,position,status"),
+    response_format: Literal["json", "columnar"] = Query(
+        "json", alias="format", description="json (default) or columnar (one array per field)"
+    )
 ):
     """
     List tasks (paginated, sortable, filterable).
@@ -61,11 +76,26 @@ def get_tasks(
     - assignee_id: UUID of assigned user
     
     **Sort by:** name, position, created_at, updated_at, due_date, status, priority
+
+    Answers 304 when If-None-Match holds the current ETag.
     """
-    pagination = PaginationParams(page=page, page_size=page_size)
+    selected = parse_fields(TaskResponseSchema, fields)
+    columnar = response_format == "columnar"
+    etag = list_etag(request, "tasks", board_id, db)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    pagination = PaginationParams(
+        page=page,
+        page_size=page_size,
+        mode=mode,
+        cursor=cursor,
+        include_total=include_total,
+        total_mode=total_mode,
+    )
     sort_params = SortParams(sort_by=sort_by, sort_order=sort_order)
     
-    return task_service.get_tasks(
+    tasks = task_service.get_tasks(
         board_id=board_id,
         include_archived=archived,
         pagination=pagination,
@@ -73,22 +103,35 @@ def get_tasks(
         status_filter=status,
         priority_filter=priority,
         assignee_filter=assignee_id,
-        db=db
+        db=db,
+        fields=selected,
+        columnar=columnar,
     )
+    model = TaskPage if selected is None else sparse_page(TaskResponseSchema, selected)
+    # Sparse and columnar pages don't match the response_model
+    return fast_json(model, with_etag(request, response, etag, tasks), response, always=selected is not None or columnar)
 
 
 @router.get("/{task_id}", response_model=TaskResponseSchema)
 @limiter.limit("150/minute")
 def get_task(
     request: Request,
+    response: Response,
     project_id: UUID,
     board_id: UUID,
     task_id: UUID,
-    db: Session = Depends(get_db),
-    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER]))
+    db: Session = Depends(get_read_db),
+    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR, UserRole.VIEWER])),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,position,status")
 ):
     """Get a specific task."""
-    return task_service.get_task_by_id(board_id, task_id, db)
+    selected = parse_fields(TaskResponseSchema, fields)
+    # Cached payloads: the board check replaces the scope query, the task check its join
+    board_service.get_cached_board(project_id, board_id, db)
+    task = task_service.get_cached_task(board_id, task_id, db)
+    etag = object_etag("task", task, selected)
+    content = with_etag(request, response, etag, trim(task, selected))
+    return fast_json(select_schema(TaskResponseSchema, selected), content, response, always=selected is not None)
 
 
 @router.patch("/{task_id}", response_model=TaskResponseSchema)
@@ -100,7 +143,7 @@ def update_task(
     task_id: UUID,
     task_data: TaskUpdateSchema,
     db: Session = Depends(get_db),
-    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR]))
+    scope=Depends(require_task_scope([UserRole.OWNER, UserRole.EDITOR]))
 ):
     """
     Update a task.
@@ -108,7 +151,7 @@ def update_task(
     Note: Changing board_id will move the task to another board
     (must be in the same project).
     """
-    return task_service.update_task(project_id, board_id, task_id, task_data, db)
+    return task_service.update_task(project_id, board_id, task_id, task_data, db, task=scope["task"])
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -119,7 +162,7 @@ def delete_task(
     board_id: UUID,
     task_id: UUID,
     db: Session = Depends(get_db),
-    membership=Depends(require_project_roles([UserRole.OWNER, UserRole.EDITOR]))
+    scope=Depends(require_task_scope([UserRole.OWNER, UserRole.EDITOR]))
 ):
     """Delete a task."""
-    task_service.delete_task(board_id, task_id, db)
\ No newline at end of file
+    task_service.delete_task(board_id, task_id, db, task=scope["task"])
\ No newline at end of file
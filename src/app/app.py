@@ -2,7 +2,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.exceptions_handlers import setup_exception_handlers
+from app.core.hashing import get_hashing_metrics
+from app.core.login_throttle import get_login_throttle_metrics
+from app.core.msgpack_negotiation import MsgpackMiddleware
+from app.core.membership_cache import get_membership_cache_stats
+from app.core.object_cache import get_object_cache_stats
+from app.core.principal import get_principal_cache_stats
+from app.core.token_filter import get_token_filter_metrics
+from app.db.pool import get_pool_metrics
 from app.api import auth, projects, boards, tasks
+from app.api import async_projects, async_boards, async_tasks
 
 app = FastAPI(
     title="Task Management API",
@@ -21,11 +30,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Accept / Content-Type: application/msgpack on every route
+app.add_middleware(MsgpackMiddleware)
+
+
+# ASYNC_DB_ENABLED selects the AsyncSession-based project/board/task routes
+if settings.ASYNC_DB_ENABLED:
+    projects_routes, boards_routes, tasks_routes = async_projects, async_boards, async_tasks
+else:
+    projects_routes, boards_routes, tasks_routes = projects, boards, tasks
 
 app.include_router(auth.router, prefix="/auth")
-app.include_router(projects.router, prefix="/projects")
-app.include_router(boards.router, prefix="/projects/{project_id}/boards")
-app.include_router(tasks.router, prefix="/projects/{project_id}/boards/{board_id}/tasks")
+app.include_router(projects_routes.router, prefix="/projects")
+app.include_router(projects.members_router, prefix="/projects")
+app.include_router(boards_routes.router, prefix="/projects/{project_id}/boards")
+app.include_router(tasks_routes.router, prefix="/projects/{project_id}/boards/{board_id}/tasks")
 
 
 @app.get("/")
@@ -34,4 +53,32 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/db-pool")
+def db_pool_health():
+    """Connection pool gauges and checkout wait histogram of the worker serving the request."""
+    return get_pool_metrics()
+
+
+@app.get("/health/cache")
+def cache_health():
+    """Per-tier (L1 worker LRU / L2 Redis) counters and the revoked-token filter of the worker serving the request."""
+    return {
+        "objects": get_object_cache_stats(),
+        "membership": get_membership_cache_stats(),
+        "principal": get_principal_cache_stats(),
+        "token_filter": get_token_filter_metrics(),
+    }
+
+
+@app.get("/health/hashing")
+def hashing_health():
+    """Argon2 pool gauges (in flight, rejections, queue wait and hash time histograms) of the worker serving the request."""
+    return get_hashing_metrics()
+
+
+@app.get("/health/login-throttle")
+def login_throttle_health():
+    """Logins refused by the throttle and the argon2 time they saved, for the worker serving the request."""
+    return get_login_throttle_metrics()
@@ -0,0 +1,53 @@
+# app/core/columnar.py
+"""
+Columnar list pages (`format=columnar` on GET /boards and GET /tasks).
+
+Instead of one object per item, the page carries one array per field, so
+keys aren't repeated for every row. Low-cardinality columns (enums, parent
+and assignee UUIDs) are dictionary-encoded: the column holds indexes into
+`dictionaries[name]`, null stays null.
+
+Services select plain columns for these pages (no ORM instances) and hand
+the rows, one tuple per item, to `columnar_payload`.
+"""
+from typing import Any, Collection, Sequence
+from pydantic_core import to_jsonable_python
+from sqlalchemy import inspect
+from app.schemas.pagination import CursorPaginatedResponse, PaginatedResponse
+
+
+def row_columns(model, names: Sequence[str], *extra: str | None) -> list:
+    """Columns to select: `names`, then the `extra` columns (e.g. sort keys) not among them."""
+    columns = inspect(model).column_attrs.keys()
+    more = [name for name in dict.fromkeys(extra) if name in columns and name not in names]
+    return [getattr(model, name) for name in (*names, *more)]
+
+
+def _dictionary_encode(values: list) -> tuple[list, list]:
+    """(indexes, distinct values in order of first appearance)."""
+    index: dict[Any, int] = {}
+    encoded = [None if value is None else index.setdefault(value, len(index)) for value in values]
+    return encoded, list(index)
+
+
+def columnar_payload(
+    page: PaginatedResponse | CursorPaginatedResponse,
+    names: Sequence[str],
+    dictionary: Collection[str] = (),
+) -> dict:
+    """
+    Serialize a page whose items are rows starting with the `names` columns
+    (selected with row_columns); `dictionary` names are dictionary-encoded.
+    """
+    columns, dictionaries = {}, {}
+    for position, name in enumerate(names):
+        values = [row[position] for row in page.items]
+        if name in dictionary:
+            values, dictionaries[name] = _dictionary_encode(values)
+        columns[name] = values
+    return {
+        **page.model_dump(mode="json", exclude={"items"}),
+        "format": "columnar",
+        "columns": to_jsonable_python(columns),
+        "dictionaries": to_jsonable_python(dictionaries),
+    }
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     MAX_PROJECTS_PER_USER: int
     DEFAULT_PAGE_SIZE: int
     MAX_PAGE_SIZE: int
+    PAGINATION_COUNT_CACHE_TTL_SECONDS: int = 30
+    PAGINATION_ESTIMATE_MIN_ROWS: int = 10_000
 
     # CORS
     ALLOWED_ORIGINS: list[str]
@@ -25,11 +27,71 @@ class Settings(BaseSettings):
     APP_NAME: str
     DEBUG: bool
 
+    # Read replicas (JSON list of URLs, empty = primary only)
+    DATABASE_REPLICA_URLS: list[str] = []
+    REPLICA_STICKINESS_SECONDS: int = 5
+
+    # Connection pool, per engine and per uvicorn worker
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Database stack: async routes for projects/boards/tasks (psycopg3 async)
+    ASYNC_DB_ENABLED: bool = False
+
+    # Read routes render JSON themselves instead of re-validating through response_model
+    FAST_JSON_ENABLED: bool = False
+
     # Redis
     REDIS_URL: str
     RATE_LIMIT_ENABLED: bool
     CACHE_TTL_DEFAULT: int
     REDIS_PASSWORD: str
+    # After a failed connect, skip reconnecting (and its timeout) for this long
+    REDIS_RETRY_SECONDS: float = 5.0
+    # Object cache: serve expired entries this long while one request recomputes
+    CACHE_STALE_SECONDS: int = 30
+    # Object cache: cross-worker recompute lock (single-flight across workers)
+    CACHE_LOCK_ENABLED: bool = False
+    CACHE_LOCK_TIMEOUT_SECONDS: float = 5.0
+
+    # In-process caches
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_REDIS_ENABLED: bool = False
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 60
+    # Per-worker L1 in front of Redis (object and membership caches; bytes also bound the principal L1)
+    LOCAL_CACHE_MAX_SIZE: int = 10_000
+    LOCAL_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    LOCAL_CACHE_TTL_SECONDS: int = 30
+    ROLES_IN_TOKEN_ENABLED: bool = False
+    ROLES_IN_TOKEN_MAX_PROJECTS: int = 20
+
+    # Revoked token Bloom filter
+    TOKEN_FILTER_CAPACITY: int = 100_000
+    TOKEN_FILTER_ERROR_RATE: float = 0.001
+    TOKEN_FILTER_RESYNC_SECONDS: int = 60
+
+    # Password hashing pool (0 workers = hash inline)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 16
+
+    # Argon2 cost (unset = passlib defaults), see app/scripts/calibrate_argon2.py
+    ARGON2_TIME_COST: int | None = None
+    ARGON2_MEMORY_COST: int | None = None
+    ARGON2_PARALLELISM: int | None = None
+
+    # Login throttle (checked before any password hashing)
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_THROTTLE_EMAIL_FREE_ATTEMPTS: int = 5
+    LOGIN_THROTTLE_IP_FREE_ATTEMPTS: int = 20
+    LOGIN_THROTTLE_BASE_DELAY_SECONDS: int = 1
+    LOGIN_THROTTLE_MAX_DELAY_SECONDS: int = 900
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = 900
 
     model_config = SettingsConfigDict(
         env_file=".env",
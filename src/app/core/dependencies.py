@@ -1,13 +1,27 @@
 # app/core/dependencies.py
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import SessionLocal, AsyncSessionLocal, next_replica
+from app.db.routing import is_sticky
 from app.core.security import verify_token
+from app.core.principal import get_principal, get_principal_async
 from uuid import UUID
+from sqlalchemy import and_, select
 from app.models.membership import Membership, UserRole
-from app.core.exceptions import InsufficientPermissionsError, ResourceNotFoundError
+from app.models.board import Board
+from app.models.task import Task
+from app.core.membership_cache import get_member_role, get_member_role_async
+from app.core.token_roles import role_from_claims, role_from_claims_async
+from app.schemas.membership_schema import ProjectAccessSchema
+from app.core.exceptions import (
+    InsufficientPermissionsError,
+    ResourceNotFoundError,
+    BoardNotFoundError,
+    TaskNotFoundError,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -18,10 +32,8 @@ def get_db():
     finally:
         db.close()
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), 
-    db: Session = Depends(get_db)
-) -> dict:
+
+def _token_subject(token: str) -> tuple[UUID, dict]:
     payload = verify_token(token, "access")
     if payload is None:
         raise HTTPException(
@@ -44,8 +56,10 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload"
         )
-    
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id, payload
+
+
+def _current_user(user, payload: dict) -> dict:
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -54,8 +68,43 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is inactive"
         )
+
+    # Tokens issued before the user's last "log out everywhere"
+    if payload.get("ver", 0) != user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    return {"id": user.id, "instance": user}
+    return {"id": user.id, "instance": user, "claims": payload}
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme), 
+    db: Session = Depends(get_db)
+) -> dict:
+    user_id, payload = _token_subject(token)
+    # Lets a commit on this session start the user's read-your-writes window
+    db.info["user_id"] = user_id
+    # Cached principal: the session only touches the DB on a cache miss
+    return _current_user(get_principal(user_id, db), payload)
+
+
+def get_read_db(current_user=Depends(get_current_user)):
+    """
+    Session for read-only routes: reads go to a replica (round-robin) unless
+    the user wrote within the stickiness window. Falls back to the primary
+    when no replicas are configured.
+    """
+    db = SessionLocal()
+    replica = next_replica()
+    if replica is not None and not is_sticky(current_user["id"]):
+        db.info["replica"] = replica
+    try:
+        yield db
+    finally:
+        db.close()
 
 
 def require_project_roles(
@@ -65,18 +114,176 @@ def require_project_roles(
         project_id: UUID,
         current_user=Depends(get_current_user),
         db: Session = Depends(get_db),
-    ):
-        membership = (
-            db.query(Membership)
-            .filter(
-                Membership.user_id == current_user["id"],
-                Membership.project_id == project_id,
-            )
-            .first()
-        )
-        if not membership:
+    ) -> ProjectAccessSchema:
+        # Roles embedded in the token, if enabled and still current
+        usable, role = role_from_claims(current_user["claims"], current_user["id"], project_id)
+        if not usable:
+            role = get_member_role(current_user["id"], project_id, db)
+        if not role:
             raise ResourceNotFoundError("You are not a member of this project")
-        if membership.role not in allowed_roles:
+        if role not in allowed_roles:
             raise InsufficientPermissionsError(f"You need one of these roles: {[r.value for r in allowed_roles]}")
-        return membership
+        return ProjectAccessSchema(user_id=current_user["id"], project_id=project_id, role=role)
+    return dependency
+
+
+def _scope_query(
+    user_id: UUID,
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID | None,
+):
+    """
+    Membership role, board-in-project and (optionally) task-in-board in a
+    single query.
+
+    Outer joins keep the membership row even when the board or task doesn't
+    match, so each failure still maps to its own error.
+    """
+    entities = [Membership.role, Board]
+    if task_id is not None:
+        entities.append(Task)
+
+    query = (
+        select(*entities)
+        .select_from(Membership)
+        .outerjoin(Board, and_(Board.project_id == Membership.project_id, Board.id == board_id))
+    )
+    if task_id is not None:
+        query = query.outerjoin(Task, and_(Task.board_id == Board.id, Task.id == task_id))
+
+    return query.where(
+        Membership.user_id == user_id,
+        Membership.project_id == project_id,
+    ).limit(1)
+
+
+def _check_scope(
+    row,
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID | None,
+    allowed_roles: list[UserRole],
+) -> dict:
+    if not row:
+        raise ResourceNotFoundError("You are not a member of this project")
+    if row.role not in allowed_roles:
+        raise InsufficientPermissionsError(f"You need one of these roles: {[r.value for r in allowed_roles]}")
+    if row.Board is None:
+        raise BoardNotFoundError(f"Board {board_id} not found in project {project_id}")
+
+    scope = {"role": row.role, "board": row.Board, "task": None}
+    if task_id is not None:
+        if row.Task is None:
+            raise TaskNotFoundError(f"Task {task_id} not found in board {board_id}")
+        scope["task"] = row.Task
+    return scope
+
+
+def _resolve_scope(
+    user_id: UUID,
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID | None,
+    allowed_roles: list[UserRole],
+    db: Session,
+) -> dict:
+    row = db.execute(_scope_query(user_id, project_id, board_id, task_id)).first()
+    return _check_scope(row, project_id, board_id, task_id, allowed_roles)
+
+
+def require_board_scope(
+    allowed_roles: list[UserRole],
+):
+    """Like require_project_roles, but also loads the board and checks it belongs to the project."""
+    def dependency(
+        project_id: UUID,
+        board_id: UUID,
+        current_user=Depends(get_current_user),
+        db: Session = Depends(get_db),
+    ) -> dict:
+        return _resolve_scope(current_user["id"], project_id, board_id, None, allowed_roles, db)
+    return dependency
+
+
+def require_task_scope(
+    allowed_roles: list[UserRole],
+):
+    """Like require_board_scope, but also loads the task and checks it belongs to the board."""
+    def dependency(
+        project_id: UUID,
+        board_id: UUID,
+        task_id: UUID,
+        current_user=Depends(get_current_user),
+        db: Session = Depends(get_db),
+    ) -> dict:
+        return _resolve_scope(current_user["id"], project_id, board_id, task_id, allowed_roles, db)
+    return dependency
+
+
+# --- Async stack (ASYNC_DB_ENABLED) ---
+# Same checks as above, but the DB work on cache misses is awaited instead of
+# holding a threadpool slot. Redis is reached through the blocking redis-py
+# client, so token checks and cache lookups that miss the local tiers run in
+# the threadpool: a slow or unreachable Redis never stalls the event loop.
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> dict:
+    # Blacklist check (Bloom filter resync, Redis confirmation) may block
+    user_id, payload = await run_in_threadpool(_token_subject, token)
+    return _current_user(await get_principal_async(user_id, db), payload)
+
+
+def require_project_roles_async(
+    allowed_roles: list[UserRole],
+):
+    async def dependency(
+        project_id: UUID,
+        current_user=Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ) -> ProjectAccessSchema:
+        usable, role = await role_from_claims_async(current_user["claims"], current_user["id"], project_id)
+        if not usable:
+            role = await get_member_role_async(current_user["id"], project_id, db)
+        if not role:
+            raise ResourceNotFoundError("You are not a member of this project")
+        if role not in allowed_roles:
+            raise InsufficientPermissionsError(f"You need one of these roles: {[r.value for r in allowed_roles]}")
+        return ProjectAccessSchema(user_id=current_user["id"], project_id=project_id, role=role)
+    return dependency
+
+
+def require_board_scope_async(
+    allowed_roles: list[UserRole],
+):
+    async def dependency(
+        project_id: UUID,
+        board_id: UUID,
+        current_user=Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ) -> dict:
+        row = (await db.execute(_scope_query(current_user["id"], project_id, board_id, None))).first()
+        return _check_scope(row, project_id, board_id, None, allowed_roles)
+    return dependency
+
+
+def require_task_scope_async(
+    allowed_roles: list[UserRole],
+):
+    async def dependency(
+        project_id: UUID,
+        board_id: UUID,
+        task_id: UUID,
+        current_user=Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ) -> dict:
+        row = (await db.execute(_scope_query(current_user["id"], project_id, board_id, task_id))).first()
+        return _check_scope(row, project_id, board_id, task_id, allowed_roles)
     return dependency
@@ -0,0 +1,78 @@
+# app/core/etag.py
+"""
+Weak ETags and If-None-Match handling for project/board/task reads.
+
+List ETags come from the scope's generation counter (see object_cache) and
+the query string, so a poll whose ETag still matches is answered 304 after
+one generation lookup (usually an L1 hit) without fetching or serializing a
+row. Lists only get ETags while Redis is available (without it writes can't
+be tracked) and when read from the primary: a replica may lag behind the
+generation.
+
+Board and task ETags come from `id` + `updated_at` of the cached payload;
+projects have no `updated_at`, so theirs hash the payload (which embeds the
+memberships).
+"""
+import hashlib
+import json
+from typing import Any
+from uuid import UUID
+from fastapi import Request, Response, status
+from sqlalchemy.orm import Session
+from app.core.object_cache import list_generation, list_generation_async
+
+
+def weak_etag(*parts: Any) -> str:
+    digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def list_etag(request: Request, kind: str, scope_id: UUID, db: Session) -> str | None:
+    """ETag of a list response read through `db`; None while generations are unavailable or `db` reads from a replica."""
+    if db.info.get("replica") is not None:
+        # A lagging replica can return the rows from before the write that
+        # started the current generation: they must not carry (or match) its ETag
+        return None
+    return _list_etag(request, kind, scope_id, list_generation(kind, scope_id))
+
+
+async def list_etag_async(request: Request, kind: str, scope_id: UUID) -> str | None:
+    """list_etag for the async stack."""
+    return _list_etag(request, kind, scope_id, await list_generation_async(kind, scope_id))
+
+
+def _list_etag(request: Request, kind: str, scope_id: UUID, generation: int | None) -> str | None:
+    if generation is None:
+        return None
+    return weak_etag(kind, scope_id, generation, sorted(request.query_params.multi_items()))
+
+
+def object_etag(kind: str, payload: dict, *variant: Any) -> str:
+    """ETag of a serialized project/board/task; `variant` tells representations apart (e.g. sparse fields)."""
+    if "updated_at" in payload:
+        return weak_etag(kind, payload["id"], payload["updated_at"], *variant)
+    return weak_etag(kind, payload, *variant)
+
+
+def etag_matches(request: Request, etag: str | None) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)."""
+    header = request.headers.get("if-none-match")
+    if etag is None or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def with_etag(request: Request, response: Response, etag: str | None, payload: Any) -> Any:
+    """`payload` with its ETag header, or a 304 when the client's copy is current."""
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return payload
@@ -22,6 +22,13 @@ class InvalidCredentialsError(AuthenticationError):
     pass
 
 
+class LoginThrottledError(AuthenticationError):
+    """Raised when login attempts are refused because of repeated failures."""
+    def __init__(self, message: str = "Too many failed login attempts", retry_after: float = 1):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
 class UserAlreadyExistsError(DomainException):
     """Raised when trying to register an existing user."""
     pass
@@ -87,4 +94,9 @@ class ResourceNotFoundError(DomainException):
 
 class ValidationError(DomainException):
     """Raised when business validation fails."""
+    pass
+
+
+class ServiceUnavailableError(DomainException):
+    """Raised when a bounded resource is saturated and the request is shed."""
     pass
\ No newline at end of file
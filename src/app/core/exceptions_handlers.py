@@ -1,10 +1,12 @@
 # app/core/exception_handlers.py
+import math
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 from app.core.exceptions import (
     DomainException,
     InvalidCredentialsError,
+    LoginThrottledError,
     UserAlreadyExistsError,
     ProjectNotFoundError,
     ResourceNotFoundError,
@@ -14,7 +16,8 @@ from app.core.exceptions import (
     TaskNotFoundError,
     LastOwnerError,
     ValidationError,
-    InvalidAssigneeError
+    InvalidAssigneeError,
+    ServiceUnavailableError
 )
 from app.core.logger import logger
 
@@ -29,6 +32,14 @@ def setup_exception_handlers(app):
             content={"detail": exc.message or "Invalid credentials"}
         )
     
+    @app.exception_handler(LoginThrottledError)
+    async def login_throttled_handler(request: Request, exc: LoginThrottledError):
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": exc.message},
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+        )
+    
     @app.exception_handler(InvalidAssigneeError)
     async def invalid_assignee_handler(request: Request, exc: InvalidAssigneeError):
         logger.warning(f"Invalid assignee: {exc.message}")
@@ -83,6 +94,14 @@ def setup_exception_handlers(app):
             content={"detail": exc.message}
         )
     
+    @app.exception_handler(ServiceUnavailableError)
+    async def service_unavailable_handler(request: Request, exc: ServiceUnavailableError):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message or "Service temporarily unavailable"},
+            headers={"Retry-After": "1"}
+        )
+    
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException):
         logger.error(f"Unhandled domain exception: {exc.message}", exc_info=True)
@@ -0,0 +1,78 @@
+# app/core/fast_json.py
+"""
+Fast JSON responses for the read routes (opt-in, FAST_JSON_ENABLED).
+
+With `response_model`, FastAPI validates whatever a route returns against
+the model before dumping it: cached payloads, which are already JSON-shaped,
+are parsed back into UUIDs/datetimes only to be dumped again, and sync routes
+pay an extra threadpool hop for it. `fast_json()` renders the bytes itself:
+
+- payloads from the object cache were dumped through the same schema, so
+  they are trusted and encoded as they are (orjson when installed, the
+  pydantic-core encoder otherwise);
+- ORM results go through a TypeAdapter built once per model, validated with
+  `from_attributes` and dumped straight to bytes, as FastAPI would.
+
+The output is byte-identical to FastAPI's (see tests/load/bench_fast_json.py).
+Requests that negotiated MessagePack (core/msgpack_negotiation.py) get the
+same content packed instead.
+Routes keep declaring `response_model` for validation when the fast path is
+off and for the OpenAPI schema.
+"""
+from functools import lru_cache
+from typing import Any
+import pydantic_core
+from fastapi import Response
+from pydantic import TypeAdapter
+from app.core.config import settings
+from app.core.msgpack_negotiation import MEDIA_TYPE as MSGPACK_MEDIA_TYPE, pack, wants_msgpack
+
+try:
+    import orjson
+except ImportError:  # optional: pip install ".[fast-json]"
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON of plain (already serialized) data."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return pydantic_core.to_json(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def render(model: Any, content: Any, packed: bool = False) -> bytes:
+    """
+    JSON (MessagePack when `packed`) bytes of `content` as `model`;
+    dicts/lists are cached payloads and are not re-validated.
+    """
+    if not isinstance(content, (dict, list)):
+        adapter = _adapter(model)
+        content = adapter.validate_python(content, from_attributes=True)
+        if not packed:
+            return adapter.dump_json(content)
+        content = adapter.dump_python(content, mode="json")
+    return pack(content) if packed else dumps(content)
+
+
+def fast_json(model: Any, content: Any, response: Response, always: bool = False) -> Any:
+    """
+    `content` rendered as a JSON response carrying the headers set on the
+    route's `response`; returned unchanged when the fast path is off or
+    `content` already is a response (e.g. a 304). `always` renders even with
+    the fast path off, for a `model` other than the route's response_model
+    (sparse fieldsets).
+    """
+    if not (settings.FAST_JSON_ENABLED or always) or isinstance(content, Response):
+        return content
+    if wants_msgpack():
+        # Negotiated by MsgpackMiddleware: packed here rather than re-encoded from JSON there
+        rendered = Response(content=render(model, content, packed=True), media_type=MSGPACK_MEDIA_TYPE)
+    else:
+        rendered = Response(content=render(model, content), media_type="application/json")
+    rendered.headers.raw.extend(response.headers.raw)
+    return rendered
@@ -0,0 +1,216 @@
+# app/core/hashing.py
+"""
+Argon2 hashing offloaded to a dedicated, bounded process pool.
+
+Argon2 is CPU and memory hard on purpose. Running it inline holds one of
+uvicorn's sync threadpool slots for the whole hash, so a burst of logins or
+registrations could starve every other endpoint.
+Here at most PASSWORD_HASH_WORKERS hashes run at once and at most
+PASSWORD_HASH_QUEUE_SIZE more may wait; anything beyond that is rejected
+immediately with ServiceUnavailableError (HTTP 503).
+
+The login and register routes await the pool from the event loop
+(`run_async`), so no threadpool thread is held while a hash runs either.
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from passlib.context import CryptContext
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.core.logger import logger
+from app.core.metrics import Histogram
+
+
+def build_pwd_context(
+    time_cost: int | None = None,
+    memory_cost: int | None = None,
+    parallelism: int | None = None,
+) -> CryptContext:
+    """Argon2 context; unset parameters keep passlib's defaults."""
+    params = {}
+    if time_cost:
+        params["argon2__rounds"] = time_cost
+    if memory_cost:
+        params["argon2__memory_cost"] = memory_cost
+    if parallelism:
+        params["argon2__parallelism"] = parallelism
+    return CryptContext(schemes=["argon2"], deprecated="auto", **params)
+
+
+pwd_context = build_pwd_context(
+    settings.ARGON2_TIME_COST,
+    settings.ARGON2_MEMORY_COST,
+    settings.ARGON2_PARALLELISM,
+)
+
+
+# --- Functions executed inside pool processes ---
+
+def _timed_hash(password: str) -> tuple[str, float, float]:
+    started = time.monotonic()
+    result = pwd_context.hash(password)
+    return result, started, time.monotonic()
+
+
+def _timed_verify(password: str, hashed: str) -> tuple[bool, float, float]:
+    started = time.monotonic()
+    result = pwd_context.verify(password, hashed)
+    return result, started, time.monotonic()
+
+
+# --- Pool management (parent process) ---
+
+class HashingPool:
+    """Process pool with a bounded number of in-flight jobs."""
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.max_in_flight = workers + queue_size
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        self.queue_wait = Histogram()
+        self.hash_time = Histogram()
+        self.in_flight = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._counter_lock:
+                self.rejected += 1
+            logger.warning("Password hashing pool saturated, rejecting request")
+            raise ServiceUnavailableError("Server is busy, please retry shortly")
+        with self._counter_lock:
+            self.in_flight += 1
+
+    def _release(self) -> None:
+        with self._counter_lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def _broken(self, e: BrokenProcessPool) -> ServiceUnavailableError:
+        logger.error(f"Password hashing pool broken: {e}")
+        self._reset_executor()
+        return ServiceUnavailableError("Server is busy, please retry shortly")
+
+    def _observe(self, submitted: float, started: float, finished: float) -> None:
+        self.queue_wait.observe(max(0.0, started - submitted))
+        self.hash_time.observe(finished - started)
+
+    def _submit(self, fn, *args) -> Future:
+        """Take a slot and start `fn`; the slot is freed when the job ends, not when its caller stops waiting."""
+        self._acquire()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool as e:
+            self._release()
+            raise self._broken(e) from e
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def run(self, fn, *args):
+        """Run `fn` in the pool, blocking the calling thread until it's done."""
+        if self.workers <= 0:
+            result, started, finished = fn(*args)
+            self.hash_time.observe(finished - started)
+            return result
+
+        submitted = time.monotonic()
+        future = self._submit(fn, *args)
+        try:
+            result, started, finished = future.result()
+        except BrokenProcessPool as e:
+            raise self._broken(e) from e
+        self._observe(submitted, started, finished)
+        return result
+
+    async def run_async(self, fn, *args):
+        """run() for coroutines: the event loop awaits the pool, no thread waits on it."""
+        if self.workers <= 0:
+            result, started, finished = await asyncio.to_thread(fn, *args)
+            self.hash_time.observe(finished - started)
+            return result
+
+        submitted = time.monotonic()
+        # A cancelled (disconnected) request keeps the slot until the hash ends,
+        # so abandoned jobs still count against PASSWORD_HASH_QUEUE_SIZE
+        future = self._submit(fn, *args)
+        try:
+            result, started, finished = await asyncio.wrap_future(future)
+        except BrokenProcessPool as e:
+            raise self._broken(e) from e
+        self._observe(submitted, started, finished)
+        return result
+
+    def shutdown(self) -> None:
+        self._reset_executor()
+
+    def metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "queue_wait_seconds": self.queue_wait.snapshot(),
+            "hash_seconds": self.hash_time.snapshot(),
+        }
+
+
+_pool: HashingPool | None = None
+
+
+def get_hashing_pool() -> HashingPool:
+    """Get or create the hashing pool singleton."""
+    global _pool
+    if _pool is None:
+        _pool = HashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
+    return _pool
+
+
+def hash_password(password: str) -> str:
+    return get_hashing_pool().run(_timed_hash, password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return get_hashing_pool().run(_timed_verify, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    return await get_hashing_pool().run_async(_timed_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await get_hashing_pool().run_async(_timed_verify, plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True if the hash was made with other parameters than the configured ones."""
+    return pwd_context.needs_update(hashed_password)
+
+
+def get_hashing_metrics() -> dict:
+    return get_hashing_pool().metrics()
@@ -0,0 +1,142 @@
+# app/core/login_throttle.py
+"""
+Pre-authentication login throttle.
+
+Failed logins are counted per email and per client IP. After a few free
+attempts each further failure blocks the key for an exponentially growing
+delay. Blocked attempts are refused before the user lookup and before any
+argon2 work, which is what makes credential stuffing expensive for the
+attacker instead of for us.
+
+Counters live in Redis so all workers agree; each worker also remembers
+known blocks locally, so a burst against a blocked key never leaves the
+process. Without Redis the counters are per worker.
+"""
+import time
+import redis
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.exceptions import LoginThrottledError
+from app.core.hashing import get_hashing_pool
+from app.core.logger import logger
+from app.core.redis import get_redis_client
+
+
+class LoginThrottle:
+    def __init__(self):
+        self._blocked = TTLCache(max_size=100_000, ttl=settings.LOGIN_THROTTLE_MAX_DELAY_SECONDS)
+        self._failures = TTLCache(max_size=100_000, ttl=settings.LOGIN_THROTTLE_WINDOW_SECONDS)
+        self.refused = 0
+
+    @staticmethod
+    def _keys(email: str, client_ip: str | None) -> list[tuple[str, int]]:
+        """(key, free attempts) pairs; IPs get more room because of NAT."""
+        keys = [(f"email:{email.strip().lower()}", settings.LOGIN_THROTTLE_EMAIL_FREE_ATTEMPTS)]
+        if client_ip:
+            keys.append((f"ip:{client_ip}", settings.LOGIN_THROTTLE_IP_FREE_ATTEMPTS))
+        return keys
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"login_throttle:{key}"
+
+    def _delay_for(self, failures: int, free_attempts: int) -> float:
+        if failures <= free_attempts:
+            return 0
+        delay = settings.LOGIN_THROTTLE_BASE_DELAY_SECONDS * 2 ** (failures - free_attempts - 1)
+        return min(delay, settings.LOGIN_THROTTLE_MAX_DELAY_SECONDS)
+
+    def check(self, email: str, client_ip: str | None) -> None:
+        """Raise LoginThrottledError if the email or IP is currently blocked."""
+        if not settings.LOGIN_THROTTLE_ENABLED:
+            return
+
+        now = time.time()
+        keys = [key for key, _ in self._keys(email, client_ip)]
+        blocked_until = [self._blocked.get(key) or 0 for key in keys]
+
+        if max(blocked_until) <= now:
+            redis_client = get_redis_client()
+            if redis_client:
+                try:
+                    pipe = redis_client.pipeline()
+                    for key in keys:
+                        pipe.hget(self._redis_key(key), "blocked_until")
+                    remote = pipe.execute()
+                    for i, value in enumerate(remote):
+                        if value and float(value) > now:
+                            blocked_until[i] = float(value)
+                            self._blocked.set(keys[i], float(value), ttl=float(value) - now)
+                except redis.RedisError as e:
+                    logger.warning(f"Login throttle check failed: {e}")
+
+        retry_after = max(blocked_until) - now
+        if retry_after > 0:
+            self.refused += 1
+            logger.warning("Login attempt throttled", extra={"email": email, "client_ip": client_ip})
+            raise LoginThrottledError("Too many failed login attempts. Please try again later.", retry_after=retry_after)
+
+    def record_failure(self, email: str, client_ip: str | None) -> None:
+        if not settings.LOGIN_THROTTLE_ENABLED:
+            return
+
+        now = time.time()
+        redis_client = get_redis_client()
+        for key, free_attempts in self._keys(email, client_ip):
+            failures = None
+            if redis_client:
+                try:
+                    pipe = redis_client.pipeline()
+                    pipe.hincrby(self._redis_key(key), "failures", 1)
+                    pipe.expire(self._redis_key(key), settings.LOGIN_THROTTLE_WINDOW_SECONDS)
+                    failures = pipe.execute()[0]
+                except redis.RedisError as e:
+                    logger.warning(f"Login throttle update failed: {e}")
+            if failures is None:
+                failures = (self._failures.get(key) or 0) + 1
+                self._failures.set(key, failures)
+
+            delay = self._delay_for(failures, free_attempts)
+            if delay:
+                self._blocked.set(key, now + delay, ttl=delay)
+                if redis_client:
+                    try:
+                        redis_client.hset(self._redis_key(key), "blocked_until", now + delay)
+                    except redis.RedisError as e:
+                        logger.warning(f"Login throttle update failed: {e}")
+
+    def record_success(self, email: str) -> None:
+        """A correct password clears the email's failures (not the IP's)."""
+        if not settings.LOGIN_THROTTLE_ENABLED:
+            return
+
+        key = self._keys(email, None)[0][0]
+        self._failures.delete(key)
+        self._blocked.delete(key)
+        redis_client = get_redis_client()
+        if redis_client:
+            try:
+                redis_client.delete(self._redis_key(key))
+            except redis.RedisError as e:
+                logger.warning(f"Login throttle reset failed: {e}")
+
+    def reset(self) -> None:
+        self._blocked.clear()
+        self._failures.clear()
+        self.refused = 0
+
+    def metrics(self) -> dict:
+        """Refusals and the argon2 time they saved (estimated from the average verify time)."""
+        avg_hash_seconds = get_hashing_pool().hash_time.snapshot()["avg"]
+        return {
+            "refused": self.refused,
+            "avg_hash_seconds": avg_hash_seconds,
+            "estimated_hash_cpu_seconds_saved": round(self.refused * avg_hash_seconds, 3),
+        }
+
+
+login_throttle = LoginThrottle()
+
+
+def get_login_throttle_metrics() -> dict:
+    return login_throttle.metrics()
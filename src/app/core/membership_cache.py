@@ -0,0 +1,130 @@
+# app/core/membership_cache.py
+"""
+Shared cache of (user_id, project_id) -> role decisions.
+
+Two tiers: a per-worker LRU in front of one Redis hash per project, so every
+uvicorn worker sees the same data: membership writes invalidate a single
+field, deleting a project drops the whole hash, and both are broadcast to
+every worker's LRU. When Redis is unavailable every lookup goes to the DB.
+"""
+import time
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.tiered_cache import TieredCache
+from app.models.membership import Membership, UserRole
+
+# Cached marker for "user is not a member of this project"
+_NO_ROLE = "-"
+
+
+def _redis_key(project_id: str) -> str:
+    return f"membership_roles:{project_id}"
+
+
+def _cache_key(user_id: UUID, project_id: UUID) -> str:
+    # Project first, so a project's entries share a prefix
+    return f"{project_id}:{user_id}"
+
+
+class _MembershipRoleCache(TieredCache):
+    """L2 is a hash per project whose fields carry their own expiry."""
+
+    def _l2_get(self, redis_client, key: str) -> str | None:
+        project_id, user_id = key.split(":")
+        raw = redis_client.hget(_redis_key(project_id), user_id)
+        if not raw:
+            return None
+        value, _, expires_at = raw.rpartition(":")
+        if float(expires_at) <= time.time():
+            return None
+        return value
+
+    def _l2_set(self, redis_client, key: str, raw: str, ttl: float) -> None:
+        project_id, user_id = key.split(":")
+        hash_key = _redis_key(project_id)
+        pipe = redis_client.pipeline()
+        # Each field carries its own expiry, the key TTL only garbage-collects the hash
+        pipe.hset(hash_key, user_id, f"{raw}:{time.time() + ttl}")
+        pipe.expire(hash_key, int(ttl))
+        pipe.execute()
+
+    def _l2_delete(self, redis_client, keys: tuple[str, ...]) -> None:
+        pipe = redis_client.pipeline()
+        for key in keys:
+            project_id, user_id = key.split(":")
+            pipe.hdel(_redis_key(project_id), user_id)
+        pipe.execute()
+
+    def _l2_delete_prefix(self, redis_client, prefix: str) -> None:
+        redis_client.delete(_redis_key(prefix.rstrip(":")))
+
+
+role_cache = _MembershipRoleCache(
+    "membership_roles",
+    max_size=settings.LOCAL_CACHE_MAX_SIZE,
+    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+    ttl=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+    dumps=str,
+    loads=str,
+)
+
+
+def _cached_role(user_id: UUID, project_id: UUID) -> tuple[bool, UserRole | None]:
+    """(hit, role) from the cache; a hit with role None means "not a member"."""
+    return _decode_role(role_cache.get(_cache_key(user_id, project_id)))
+
+
+def _decode_role(cached: str | None) -> tuple[bool, UserRole | None]:
+    if cached is None:
+        return False, None
+    try:
+        return True, None if cached == _NO_ROLE else UserRole(cached)
+    except ValueError:
+        return False, None
+
+
+def _role_query(user_id: UUID, project_id: UUID):
+    return select(Membership.role).where(
+        Membership.user_id == user_id,
+        Membership.project_id == project_id,
+    )
+
+
+def _store_role(user_id: UUID, project_id: UUID, role: UserRole | None) -> UserRole | None:
+    role_cache.set(_cache_key(user_id, project_id), role.value if role else _NO_ROLE)
+    return role
+
+
+def get_member_role(user_id: UUID, project_id: UUID, db: Session) -> UserRole | None:
+    """Return the user's role in the project, or None if not a member."""
+    hit, role = _cached_role(user_id, project_id)
+    if hit:
+        return role
+    return _store_role(user_id, project_id, db.execute(_role_query(user_id, project_id)).scalar())
+
+
+async def get_member_role_async(user_id: UUID, project_id: UUID, db: AsyncSession) -> UserRole | None:
+    """get_member_role for the async stack (Redis is only reached from the threadpool)."""
+    hit, role = _decode_role(await role_cache.get_async(_cache_key(user_id, project_id)))
+    if hit:
+        return role
+    role = (await db.execute(_role_query(user_id, project_id))).scalar()
+    return await run_in_threadpool(_store_role, user_id, project_id, role)
+
+
+def invalidate_member_role(user_id: UUID, project_id: UUID) -> None:
+    """Forget the cached role of one member (add/remove/change role)."""
+    role_cache.delete(_cache_key(user_id, project_id))
+
+
+def invalidate_project_roles(project_id: UUID) -> None:
+    """Forget every cached role in a project (project deletion)."""
+    role_cache.delete_prefix(f"{project_id}:")
+
+
+def get_membership_cache_stats() -> dict:
+    return role_cache.stats()
@@ -0,0 +1,54 @@
+# app/core/metrics.py
+import threading
+
+
+class Histogram:
+    """
+    Minimal thread-safe histogram with fixed upper bounds (in seconds).
+
+    Each process keeps its own numbers; with several uvicorn workers every
+    worker reports separately.
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            self.max = max(self.max, value)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.bucket_counts[i] += 1
+                    break
+            else:
+                self.overflow += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+            self.bucket_counts = [0] * len(self.buckets)
+            self.overflow = 0
+
+    def snapshot(self) -> dict:
+        """Cumulative bucket counts, Prometheus style."""
+        with self._lock:
+            cumulative, running = {}, 0
+            for bound, n in zip(self.buckets, self.bucket_counts):
+                running += n
+                cumulative[str(bound)] = running
+            cumulative["+Inf"] = running + self.overflow
+            return {
+                "count": self.count,
+                "sum": round(self.sum, 6),
+                "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+                "max": round(self.max, 6),
+                "buckets": cumulative,
+            }
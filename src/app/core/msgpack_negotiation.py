@@ -0,0 +1,174 @@
+# app/core/msgpack_negotiation.py
+"""
+MessagePack for clients that ask for it (optional: pip install ".[msgpack]").
+
+`MsgpackMiddleware` negotiates both directions for every route:
+
+- bodies sent as `Content-Type: application/msgpack` (or `x-msgpack`) are
+  decoded and handed on as JSON, so they are validated by the same schemas
+  (app/schemas) as JSON bodies; msgpack timestamps arrive as datetimes;
+- JSON responses to requests whose `Accept` ranks `application/msgpack` at
+  least as high as JSON are re-encoded, with the same shape (UUIDs and
+  datetimes stay strings). Responses carry `Vary: Accept`.
+
+Read routes rendered by `fast_json` skip the re-encoding: they check
+`wants_msgpack()` and pack their content directly. Without msgpack
+installed `Accept` is ignored (JSON is returned) and msgpack bodies get 415.
+"""
+from contextvars import ContextVar
+from typing import Any
+import pydantic_core
+from fastapi import status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+try:
+    import msgpack
+except ImportError:  # optional: pip install ".[msgpack]"
+    msgpack = None
+
+MEDIA_TYPE = "application/msgpack"
+MEDIA_TYPES = {MEDIA_TYPE, "application/x-msgpack"}
+_JSON_RANGES = {"application/json", "application/*", "*/*"}
+
+_wants_msgpack: ContextVar[bool] = ContextVar("wants_msgpack", default=False)
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """Whether `accept` ranks msgpack at least as high as JSON; wildcards only count for JSON."""
+    packed = plain = 0.0
+    for media_range in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type.lower() in MEDIA_TYPES:
+            packed = max(packed, quality)
+        elif media_type.lower() in _JSON_RANGES:
+            plain = max(plain, quality)
+    return packed > 0 and packed >= plain
+
+
+def wants_msgpack() -> bool:
+    """Whether the response to the current request is to be MessagePack."""
+    return _wants_msgpack.get()
+
+
+def pack(content: Any) -> bytes:
+    """MessagePack of plain (already JSON-shaped) data."""
+    return msgpack.packb(content)
+
+
+def _media_type(headers: Headers) -> str:
+    return headers.get("content-type", "").split(";")[0].strip().lower()
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks, more_body = [], True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _as_json_request(scope: Scope, receive: Receive) -> tuple[Scope, Receive]:
+    """The request with its msgpack body re-encoded as JSON; ValueError if it doesn't decode."""
+    body = await _read_body(receive)
+    if body:
+        body = pydantic_core.to_json(msgpack.unpackb(body, timestamp=3))
+    headers = [(name, value) for name, value in scope["headers"] if name not in (b"content-type", b"content-length")]
+    headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return {**scope, "headers": headers}, replay
+
+
+def _negotiated_send(send: Send, packed: bool) -> Send:
+    """`send` adding Vary: Accept, and re-encoding JSON bodies when `packed`."""
+    start: Message | None = None
+    chunks: list[bytes] = []
+
+    async def negotiated(message: Message) -> None:
+        nonlocal start
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message.setdefault("headers", []))
+            headers.add_vary_header("Accept")
+            if packed and _media_type(headers) == "application/json":
+                start = message  # held back until the body is re-encoded
+            else:
+                await send(message)
+            return
+        if start is None or message["type"] != "http.response.body":
+            await send(message)
+            return
+        chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+        body = b"".join(chunks)
+        if body:
+            body = pack(loads(body))
+            headers = MutableHeaders(raw=start["headers"])
+            headers["content-type"] = MEDIA_TYPE
+            headers["content-length"] = str(len(body))
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    return negotiated
+
+
+class MsgpackMiddleware:
+    """Accept/Content-Type negotiation of application/msgpack (see module docstring)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        if msgpack is None:
+            if _media_type(headers) in MEDIA_TYPES:
+                response = JSONResponse(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    content={"detail": "MessagePack is not supported"},
+                )
+                return await response(scope, receive, send)
+            return await self.app(scope, receive, send)
+
+        packed = prefers_msgpack(headers.get("accept"))
+        send = _negotiated_send(send, packed)
+        if _media_type(headers) in MEDIA_TYPES:
+            try:
+                scope, receive = await _as_json_request(scope, receive)
+            except (ValueError, msgpack.UnpackException):
+                response = JSONResponse(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                    content={"detail": "Invalid MessagePack body"},
+                )
+                return await response(scope, receive, send)
+
+        token = _wants_msgpack.set(packed)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _wants_msgpack.reset(token)
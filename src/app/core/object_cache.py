@@ -0,0 +1,362 @@
+# app/core/object_cache.py
+"""
+Read-through cache of serialized project/board/task payloads.
+
+Entries are the JSON of the response schemas, stored in Redis for
+CACHE_TTL_DEFAULT seconds behind a per-worker LRU (see tiered_cache), so a
+hit skips both the query and the ORM -> pydantic conversion, and an L1 hit
+also the network hop. Single objects live under `cache:{kind}:{id}`.
+
+First pages of list queries are keyed by their scope (user for projects,
+project for boards, board for tasks), the scope's generation counter and a
+hash of their parameters. A write bumps the generation with one INCR, which
+orphans every filter/sort/page variant of that scope at once; orphaned pages
+age out through their TTL. Generations are cached in the L1 too and the
+bump is broadcast like any other invalidation. Counters start from the clock,
+so a scope never returns to an earlier generation and list ETags (see
+app.core.etag) can be built on them.
+
+Misses are single-flight: one computation per key and worker, concurrent
+requests wait for it. Entries stay in Redis for CACHE_STALE_SECONDS after
+they stop being fresh; meanwhile one request recomputes while the others
+are served the stale copy (stale-while-revalidate). With CACHE_LOCK_ENABLED
+a Redis lock extends this across workers: only the lock holder recomputes,
+the rest serve the stale copy or wait for the holder's result.
+
+Service write paths invalidate explicitly after committing (invalidated
+entries are never served stale). Entries loaded through a replica session
+are only fresh for REPLICA_STICKINESS_SECONDS (see `fill_ttl`): right after
+a write the replica may still return the old row, and only the writer is
+sticky to the primary. When Redis is unavailable every read goes
+to the DB, still coalesced per worker.
+
+The `*_async` helpers are for the async stack: they answer L1 hits on the
+event loop and make every Redis call (redis-py blocks) from the threadpool.
+"""
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+import redis
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.redis import connected_redis_client, get_redis_client
+from app.core.single_flight import AsyncSingleFlight, SingleFlight
+from app.core.tiered_cache import TieredCache
+from app.schemas.pagination import CursorPaginatedResponse, PaginatedResponse
+
+payload_cache = TieredCache(
+    "cache",
+    max_size=settings.LOCAL_CACHE_MAX_SIZE,
+    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+    ttl=settings.LOCAL_CACHE_TTL_SECONDS,
+)
+
+generation_cache = TieredCache(
+    "cache:gen",
+    max_size=settings.LOCAL_CACHE_MAX_SIZE,
+    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+    ttl=settings.LOCAL_CACHE_TTL_SECONDS,
+    dumps=str,
+    loads=int,
+)
+
+stats = {"evictions": 0, "generation_bumps": 0, "stale_served": 0, "lock_waits": 0}
+
+_flights = SingleFlight()
+_async_flights = AsyncSingleFlight()
+
+_LOCK_POLL_SECONDS = 0.05
+
+# Generation keys outlive the (stale) pages written under them, so a counter only
+# expires once no page of any older generation can still exist
+_GENERATION_TTL_MARGIN = 60
+
+
+def _generation_ttl() -> int:
+    return settings.CACHE_TTL_DEFAULT + settings.CACHE_STALE_SECONDS + _GENERATION_TTL_MARGIN
+
+
+def _generation_seed() -> int:
+    # Missing counters start from the clock (ms) rather than 0, so a counter
+    # never repeats a value after expiring: generations double as list ETags
+    return time.time_ns() // 1_000_000
+
+
+def object_key(kind: str, object_id: UUID) -> str:
+    return f"{kind}:{object_id}"
+
+
+def _generation_key(kind: str, scope_id: UUID) -> str:
+    return f"{kind}:{scope_id}"
+
+
+def _generation(kind: str, scope_id: UUID) -> int:
+    key = _generation_key(kind, scope_id)
+    generation = generation_cache.get(key)
+    if generation is None:
+        generation = _start_generation(key)
+    return generation
+
+
+async def _generation_async(kind: str, scope_id: UUID) -> int:
+    key = _generation_key(kind, scope_id)
+    generation = await generation_cache.get_async(key)
+    if generation is None:
+        generation = await run_in_threadpool(_start_generation, key)
+    return generation
+
+
+def _start_generation(key: str) -> int:
+    """Create a missing counter (unless another worker just did) and remember it locally."""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return 0
+    generation = _generation_seed()
+    redis_key = generation_cache.redis_key(key)
+    try:
+        if not redis_client.set(redis_key, generation, nx=True, ex=_generation_ttl()):
+            generation = int(redis_client.get(redis_key) or generation)
+    except (redis.RedisError, ValueError) as e:
+        logger.warning(f"Object cache read failed: {e}")
+        return 0
+    generation_cache.set_local(key, generation)
+    return generation
+
+
+def list_generation(kind: str, scope_id: UUID) -> int | None:
+    """Current generation of a list scope; None while the cache (Redis) is unavailable."""
+    if not payload_cache.available():
+        return None
+    return _generation(kind, scope_id)
+
+
+async def list_generation_async(kind: str, scope_id: UUID) -> int | None:
+    """list_generation for the async stack."""
+    if connected_redis_client() is None:
+        # Availability means (re)connecting first
+        return await run_in_threadpool(list_generation, kind, scope_id)
+    return await _generation_async(kind, scope_id)
+
+
+def _list_key(kind: str, scope_id: UUID, generation: int, params: dict) -> str:
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:32]
+    return f"list:{kind}:{scope_id}:{generation}:{digest}"
+
+
+def list_key(kind: str, scope_id: UUID, **params) -> str:
+    """Key of one cached list page in the scope's current generation; `params` are every filter/sort/page option."""
+    return _list_key(kind, scope_id, _generation(kind, scope_id), params)
+
+
+async def list_key_async(kind: str, scope_id: UUID, **params) -> str:
+    """list_key for the async stack."""
+    return _list_key(kind, scope_id, await _generation_async(kind, scope_id), params)
+
+
+def to_payload(schema: type[BaseModel], obj) -> dict:
+    """Serialize an ORM object (or a page of them) through its response schema."""
+    return schema.model_validate(obj, from_attributes=True).model_dump(mode="json")
+
+
+def page_payload(page: PaginatedResponse | CursorPaginatedResponse, item_schema: type[BaseModel]) -> dict:
+    """Serialize a page from paginate()/paginate_cursor() with `item_schema` items."""
+    page_class = CursorPaginatedResponse if isinstance(page, CursorPaginatedResponse) else PaginatedResponse
+    return to_payload(page_class[item_schema], page)
+
+
+def fill_ttl(db) -> int:
+    """Freshness of entries loaded through `db`: capped at the stickiness window when it reads from a replica."""
+    if db.info.get("replica") is not None:
+        return min(settings.CACHE_TTL_DEFAULT, settings.REPLICA_STICKINESS_SECONDS)
+    return settings.CACHE_TTL_DEFAULT
+
+
+def get_cached(key: str) -> tuple[Any | None, Any | None]:
+    """(fresh payload, stale payload) for `key`; at most one is set."""
+    return _split_entry(payload_cache.get(key))
+
+
+async def get_cached_async(key: str) -> tuple[Any | None, Any | None]:
+    """get_cached for the async stack."""
+    return _split_entry(await payload_cache.get_async(key))
+
+
+def _split_entry(entry: dict | None) -> tuple[Any | None, Any | None]:
+    if entry is None:
+        return None, None
+    if entry["fresh_until"] > time.time():
+        return entry["payload"], None
+    return None, entry["payload"]
+
+
+def set_cached(
+    key: str,
+    payload: Any,
+    list_scope: tuple[str, UUID] | None = None,
+    ttl: int | None = None,
+) -> None:
+    """Store a payload, fresh for `ttl` (default CACHE_TTL_DEFAULT); `list_scope` (kind, scope_id) marks a list page of that scope."""
+    ttl = settings.CACHE_TTL_DEFAULT if ttl is None else ttl
+    entry = {"fresh_until": time.time() + ttl, "payload": payload}
+    payload_cache.set(key, entry, ttl=ttl + settings.CACHE_STALE_SECONDS)
+    redis_client = get_redis_client()
+    if redis_client and list_scope is not None:
+        try:
+            redis_client.expire(generation_cache.redis_key(_generation_key(*list_scope)), _generation_ttl())
+        except redis.RedisError as e:
+            logger.warning(f"Object cache write failed: {e}")
+
+
+def _acquire_lock(key: str):
+    """
+    The cross-worker recompute lock for `key`: the lock when acquired, False
+    when another worker holds it, None when locking is off or Redis is down.
+    """
+    if not settings.CACHE_LOCK_ENABLED:
+        return None
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return None
+    lock = redis_client.lock(f"lock:{payload_cache.redis_key(key)}", timeout=settings.CACHE_LOCK_TIMEOUT_SECONDS)
+    try:
+        return lock if lock.acquire(blocking=False) else False
+    except redis.RedisError as e:
+        logger.warning(f"Object cache lock failed: {e}")
+        return None
+
+
+def _release_lock(lock) -> None:
+    if lock:
+        try:
+            lock.release()
+        except redis.RedisError as e:
+            # Expired while we were loading: another worker may hold it now
+            logger.warning(f"Object cache unlock failed: {e}")
+
+
+def _serve_stale(stale: Any) -> Any:
+    stats["stale_served"] += 1
+    return stale
+
+
+def _refresh(key: str, load: Callable[[], Any], list_scope, stale: Any | None, ttl: int | None) -> Any:
+    lock = _acquire_lock(key)
+    if lock is False:
+        if stale is not None:
+            return _serve_stale(stale)
+        # Wait for the lock holder's result, then give up and load ourselves
+        stats["lock_waits"] += 1
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(_LOCK_POLL_SECONDS)
+            fresh, _ = get_cached(key)
+            if fresh is not None:
+                return fresh
+    try:
+        payload = load()
+        set_cached(key, payload, list_scope, ttl)
+        return payload
+    finally:
+        _release_lock(lock)
+
+
+def read_through(
+    key: str,
+    load: Callable[[], Any],
+    list_scope: tuple[str, UUID] | None = None,
+    ttl: int | None = None,
+) -> Any:
+    """Cached payload for `key`, or `load()` (single-flight, stored for `ttl`, see fill_ttl)."""
+    fresh, stale = get_cached(key)
+    if fresh is not None:
+        return fresh
+    if stale is not None and _flights.in_flight(key):
+        return _serve_stale(stale)
+    return _flights.do(key, lambda: _refresh(key, load, list_scope, stale, ttl))
+
+
+async def _refresh_async(key: str, load: Callable[[], Awaitable[Any]], list_scope, stale: Any | None) -> Any:
+    lock = await run_in_threadpool(_acquire_lock, key) if settings.CACHE_LOCK_ENABLED else None
+    if lock is False:
+        if stale is not None:
+            return _serve_stale(stale)
+        stats["lock_waits"] += 1
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+            fresh, _ = await get_cached_async(key)
+            if fresh is not None:
+                return fresh
+    try:
+        payload = await load()
+        await run_in_threadpool(set_cached, key, payload, list_scope)
+        return payload
+    finally:
+        if lock:
+            await run_in_threadpool(_release_lock, lock)
+
+
+async def read_through_async(
+    key: str,
+    load: Callable[[], Awaitable[Any]],
+    list_scope: tuple[str, UUID] | None = None,
+) -> Any:
+    """read_through for the async stack."""
+    fresh, stale = await get_cached_async(key)
+    if fresh is not None:
+        return fresh
+    if stale is not None and _async_flights.in_flight(key):
+        return _serve_stale(stale)
+    return await _async_flights.do(key, lambda: _refresh_async(key, load, list_scope, stale))
+
+
+def invalidate_objects(*keys: str) -> None:
+    """Drop cached single objects (after update/delete) from Redis and every worker."""
+    if keys and payload_cache.available():
+        payload_cache.delete(*keys)
+        stats["evictions"] += len(keys)
+
+
+def bump_list_generation(kind: str, *scope_ids: UUID) -> None:
+    """Invalidate every cached list page of the given scopes (after create/update/delete)."""
+    redis_client = get_redis_client()
+    if redis_client and scope_ids:
+        keys = [_generation_key(kind, scope_id) for scope_id in scope_ids]
+        try:
+            ttl = _generation_ttl()
+            pipe = redis_client.pipeline()
+            for key in keys:
+                pipe.set(generation_cache.redis_key(key), _generation_seed(), nx=True, ex=ttl)
+                pipe.incr(generation_cache.redis_key(key))
+                pipe.expire(generation_cache.redis_key(key), ttl)
+            pipe.execute()
+            stats["generation_bumps"] += len(scope_ids)
+        except redis.RedisError as e:
+            logger.warning(f"Object cache invalidation failed: {e}")
+        generation_cache.invalidate_local(*keys)
+
+
+def reset_object_cache_stats() -> None:
+    """Drop this worker's L1 entries and zero the counters."""
+    payload_cache.clear()
+    generation_cache.clear()
+    for name in stats:
+        stats[name] = 0
+    _flights.coalesced = 0
+    _async_flights.coalesced = 0
+
+
+def get_object_cache_stats() -> dict:
+    """Per-tier counters of this worker; evictions are objects dropped by writes, generation_bumps list invalidations."""
+    return {
+        **payload_cache.stats(),
+        **stats,
+        "coalesced": _flights.coalesced + _async_flights.coalesced,
+        "generations": generation_cache.stats(),
+        "redis_available": get_redis_client() is not None,
+    }
@@ -1,7 +1,23 @@
 # app/core/pagination.py
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from enum import Enum
+import redis
 from sqlalchemy.orm import Query
-from sqlalchemy import asc, desc
-from app.schemas.pagination import PaginationParams, PaginatedResponse, SortParams
+from sqlalchemy import and_, asc, bindparam, desc, func, or_, select, tuple_, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from starlette.concurrency import run_in_threadpool
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.core.logger import logger
+from app.core.redis import get_redis_client
+from app.schemas.pagination import PaginationParams, PaginatedResponse, CursorPaginatedResponse, SortParams
 from typing import TypeVar
 
 T = TypeVar('T')
@@ -31,29 +47,363 @@ def apply_sorting(query: Query, sort_params: SortParams, model, allowed_fields:
         return query.order_by(asc(sort_column))
 
 
+# --- Totals ---
+#
+# total_mode=exact runs COUNT(*) on every call; "cached" keeps that exact
+# count for PAGINATION_COUNT_CACHE_TTL_SECONDS keyed by the filtered query
+# (so by user, board and filters); "estimate" reads the planner's row
+# estimate on Postgres and only counts exactly below
+# PAGINATION_ESTIMATE_MIN_ROWS. include_total=false skips counting and
+# has_next comes from fetching one extra row.
+
+_count_cache = TTLCache(max_size=10_000, ttl=settings.PAGINATION_COUNT_CACHE_TTL_SECONDS)
+
+
+class explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>, with normal bind processing."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _count_statement(statement: Select) -> Select:
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+
+def _count_cache_key(statement: Select) -> str:
+    compiled = statement.compile()
+    digest = hashlib.sha256(f"{compiled}|{sorted(compiled.params.items())!r}".encode()).hexdigest()
+    return f"page_count:{digest}"
+
+
+def _get_cached_count(key: str) -> int | None:
+    total = _count_cache.get(key)
+    if total is not None:
+        return total
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            raw = redis_client.get(key)
+            if raw is not None:
+                _count_cache.set(key, int(raw))
+                return int(raw)
+        except redis.RedisError as e:
+            logger.warning(f"Count cache read failed: {e}")
+    return None
+
+
+async def _get_cached_count_async(key: str) -> int | None:
+    # Local hits stay on the event loop, redis-py blocks
+    total = _count_cache.get(key)
+    if total is not None:
+        return total
+    return await run_in_threadpool(_get_cached_count, key)
+
+
+def _set_cached_count(key: str, total: int) -> None:
+    _count_cache.set(key, total)
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            redis_client.setex(key, settings.PAGINATION_COUNT_CACHE_TTL_SECONDS, total)
+        except redis.RedisError as e:
+            logger.warning(f"Count cache write failed: {e}")
+
+
+def reset_count_cache() -> None:
+    _count_cache.clear()
+
+
+def _plan_rows(plan) -> int:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _fetch_page(rows: list, pagination: PaginationParams) -> tuple[list, bool]:
+    """Split a limit+1 fetch into (page items, has_next)."""
+    return rows[:pagination.limit], len(rows) > pagination.limit
+
+
+def _split_window_rows(rows: list, as_rows: bool = False) -> tuple[list, int | None]:
+    """(entities, total) from rows of (entity, count(*) OVER ()); `as_rows` keeps column rows whole."""
+    items = rows if as_rows else [row[0] for row in rows]
+    return items, rows[0][-1] if rows else None
+
+
 def paginate(
     query: Query,
     pagination: PaginationParams,
-    model_class: type[T]
+    model_class: type[T],
+    as_rows: bool = False
 ) -> PaginatedResponse[T]:
     """
     Apply pagination to a query and return paginated response.
+
+    Exact totals come from `count(*) OVER ()` on the page query itself, so
+    page and total cost one statement (a separate COUNT only runs when the
+    requested page is past the end).
     
     Args:
         query: SQLAlchemy query (already filtered and sorted)
-        pagination: Pagination parameters
+        pagination: Pagination parameters (include_total / total_mode)
         model_class: Type hint for response items
+        as_rows: `query` selects columns, not an entity: items are its rows
+            (with the count as an extra trailing column)
     
     Returns:
         PaginatedResponse with items and metadata
     """
-    total = query.count()
-    
-    items = query.offset(pagination.offset).limit(pagination.limit).all()
-    
+    db, statement = query.session, query.statement
+    total, estimated, key = None, False, None
+    if pagination.include_total:
+        key = _count_cache_key(statement) if pagination.total_mode == "cached" else None
+        total = _get_cached_count(key) if key else None
+        if total is None and pagination.total_mode == "estimate" and db.get_bind().dialect.name == "postgresql":
+            total = _plan_rows(db.execute(explain(statement)).scalar())
+            estimated = total >= settings.PAGINATION_ESTIMATE_MIN_ROWS
+            if not estimated:
+                total = None
+
+    page = query.offset(pagination.offset).limit(pagination.limit + 1)
+    if pagination.include_total and total is None:
+        rows, total = _split_window_rows(page.add_columns(func.count().over()).all(), as_rows)
+        if total is None:
+            total = db.execute(_count_statement(statement)).scalar_one() if pagination.offset else 0
+        if key:
+            _set_cached_count(key, total)
+    else:
+        rows = page.all()
+    items, has_next = _fetch_page(rows, pagination)
+
+    return PaginatedResponse.create(
+        items=items,
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        has_next=has_next,
+        total_estimated=estimated,
+    )
+
+
+async def paginate_async(
+    db: AsyncSession,
+    statement: Select,
+    pagination: PaginationParams,
+    model_class: type[T],
+    as_rows: bool = False
+) -> PaginatedResponse[T]:
+    """
+    paginate() for the async stack: `statement` is a 2.0 style select()
+    (already filtered and sorted) executed on an AsyncSession.
+    """
+    total, estimated, key = None, False, None
+    if pagination.include_total:
+        key = _count_cache_key(statement) if pagination.total_mode == "cached" else None
+        total = await _get_cached_count_async(key) if key else None
+        if total is None and pagination.total_mode == "estimate" and db.get_bind().dialect.name == "postgresql":
+            total = _plan_rows((await db.execute(explain(statement))).scalar())
+            estimated = total >= settings.PAGINATION_ESTIMATE_MIN_ROWS
+            if not estimated:
+                total = None
+
+    page = statement.offset(pagination.offset).limit(pagination.limit + 1)
+    if pagination.include_total and total is None:
+        rows, total = _split_window_rows((await db.execute(page.add_columns(func.count().over()))).all(), as_rows)
+        if total is None:
+            total = (await db.execute(_count_statement(statement))).scalar_one() if pagination.offset else 0
+        if key:
+            await run_in_threadpool(_set_cached_count, key, total)
+    else:
+        result = await db.execute(page)
+        rows = result.all() if as_rows else result.scalars().all()
+    items, has_next = _fetch_page(rows, pagination)
+
     return PaginatedResponse.create(
         items=items,
         total=total,
         page=pagination.page,
-        page_size=pagination.page_size
-    )
\ No newline at end of file
+        page_size=pagination.page_size,
+        has_next=has_next,
+        total_estimated=estimated,
+    )
+
+
+# --- Cursor (keyset) mode ---
+#
+# Rows are ordered by (sort column, id) and a cursor holds that pair for the
+# last (next_cursor) or first (prev_cursor) row of a page. The next page is
+# "rows after the pair", which an index on the sort column can seek to
+# directly, so deep pages cost the same as the first one and concurrent
+# inserts don't shift results. NULLs (due_date) always sort last.
+
+def _sign(body: bytes) -> bytes:
+    return hmac.new(settings.SECRET_KEY.encode(), body, hashlib.sha256).digest()[:16]
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def encode_cursor(payload: dict) -> str:
+    """Opaque, signed cursor: base64(json).base64(hmac)"""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return f"{_b64encode(body)}.{_b64encode(_sign(body))}"
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        body_part, signature_part = cursor.split(".")
+        body = _b64decode(body_part)
+        if not hmac.compare_digest(_b64decode(signature_part), _sign(body)):
+            raise ValueError("bad signature")
+        return json.loads(body)
+    except ValueError:
+        raise ValidationError("Invalid cursor")
+
+
+def _dump_key(value):
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _load_key(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if issubclass(python_type, Enum):
+        return python_type[value]
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _keyset_statement(query, pagination: PaginationParams, sort_params: SortParams, model, sort_field: str | None):
+    """Order and seek `query` (Query or select()) for this cursor; returns (statement, backwards)."""
+    column = getattr(model, sort_field).expression if sort_field else None
+    ascending = sort_params.sort_order != "desc"
+    cursor = decode_cursor(pagination.cursor) if pagination.cursor else None
+    if cursor and (cursor.get("s") != sort_field or cursor.get("o") != sort_params.sort_order):
+        raise ValidationError("Cursor does not match the requested sorting")
+
+    backwards = bool(cursor) and cursor.get("d") == "prev"
+    # Walking backwards = reading the reversed order, then flipping the page
+    forward = ascending != backwards
+
+    def after(a, b):
+        return a > b if forward else a < b
+
+    if cursor:
+        last_id = model.id.type.python_type(cursor["id"])
+        key = _load_key(column, cursor["k"]) if column is not None else None
+        if column is None:
+            query = query.filter(after(model.id, last_id))
+        elif not column.nullable:
+            # Row-value comparison: a single index range seek on (column, id)
+            bound = tuple_(bindparam(None, key, type_=column.type), bindparam(None, last_id, type_=model.id.type))
+            query = query.filter(after(tuple_(column, model.id), bound))
+        elif key is None:
+            # Inside the trailing NULL block
+            tail = and_(column.is_(None), after(model.id, last_id))
+            query = query.filter(tail if not backwards else or_(column.isnot(None), tail))
+        else:
+            seek = or_(after(column, key), and_(column == key, after(model.id, last_id)))
+            query = query.filter(or_(seek, column.is_(None)) if not backwards else and_(column.isnot(None), seek))
+
+    direction = asc if forward else desc
+    order = [direction(model.id)]
+    if column is not None:
+        sort = direction(column)
+        order.insert(0, sort.nulls_last() if not backwards else sort.nulls_first())
+    statement = query.order_by(*order).limit(pagination.limit + 1)
+    return statement, backwards
+
+
+def _cursor_page(
+    items: list,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    sort_field: str | None,
+    backwards: bool,
+) -> CursorPaginatedResponse:
+    has_more = len(items) > pagination.limit
+    items = items[:pagination.limit]
+    if backwards:
+        items.reverse()
+
+    def cursor_for(item, direction: str) -> str:
+        return encode_cursor({
+            "s": sort_field,
+            "o": sort_params.sort_order,
+            "k": _dump_key(getattr(item, sort_field)) if sort_field else None,
+            "id": str(item.id),
+            "d": direction,
+        })
+
+    has_next = has_more if not backwards else True
+    has_previous = has_more if backwards else pagination.cursor is not None
+    return CursorPaginatedResponse(
+        items=items,
+        page_size=pagination.page_size,
+        next_cursor=cursor_for(items[-1], "next") if items and has_next else None,
+        prev_cursor=cursor_for(items[0], "prev") if items and has_previous else None,
+        has_next=has_next and bool(items),
+        has_previous=has_previous and bool(items),
+    )
+
+
+def _keyset_sort_field(sort_params: SortParams, allowed_fields: list[str], default_field: str | None) -> str | None:
+    if sort_params.sort_by in allowed_fields:
+        return sort_params.sort_by
+    return default_field
+
+
+def paginate_cursor(
+    query: Query,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    model,
+    allowed_fields: list[str],
+    default_field: str | None = None,
+) -> CursorPaginatedResponse:
+    """
+    Keyset pagination of an unsorted, filtered query.
+
+    Sorts by `sort_params` (falling back to `default_field`, then id only)
+    with id as tiebreaker, so it must be called instead of apply_sorting.
+    On a query of columns the items are its rows.
+    """
+    sort_field = _keyset_sort_field(sort_params, allowed_fields, default_field)
+    statement, backwards = _keyset_statement(query, pagination, sort_params, model, sort_field)
+    return _cursor_page(statement.all(), pagination, sort_params, sort_field, backwards)
+
+
+async def paginate_cursor_async(
+    db: AsyncSession,
+    statement: Select,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    model,
+    allowed_fields: list[str],
+    default_field: str | None = None,
+    as_rows: bool = False,
+) -> CursorPaginatedResponse:
+    """paginate_cursor() for the async stack; `as_rows` as in paginate()."""
+    sort_field = _keyset_sort_field(sort_params, allowed_fields, default_field)
+    statement, backwards = _keyset_statement(statement, pagination, sort_params, model, sort_field)
+    result = await db.execute(statement)
+    items = list(result.all() if as_rows else result.scalars().all())
+    return _cursor_page(items, pagination, sort_params, sort_field, backwards)
@@ -0,0 +1,106 @@
+# app/core/principal.py
+"""
+Authenticated principal cache.
+
+Keeps the handful of user fields `get_current_user` needs (id, is_active,
+full_name, token_version) in a two-tier cache: a per-worker LRU, optionally
+backed by Redis, so authenticated requests don't SELECT the full users row
+(password hash included). Invalidations reach every worker's LRU through
+the tiered cache's pub/sub channel; while Redis is down the cache is
+bypassed and every request reads the user from the database.
+"""
+from uuid import UUID
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.tiered_cache import TieredCache
+from app.models.user import User
+from app.schemas.user_schema import PrincipalSchema
+
+principal_cache = TieredCache(
+    "principal",
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    dumps=lambda principal: principal.model_dump_json(),
+    loads=PrincipalSchema.model_validate_json,
+    redis_enabled=lambda: settings.PRINCIPAL_CACHE_REDIS_ENABLED,
+    # Without the invalidation channel other workers would keep accepting a
+    # deactivated user or a revoked token_version until the TTL runs out
+    require_redis=True,
+)
+
+
+def _cached_principal(user_id: UUID) -> PrincipalSchema | None:
+    return principal_cache.get(str(user_id))
+
+
+def _principal_query(user_id: UUID):
+    return select(User.id, User.is_active, User.full_name, User.token_version).where(User.id == user_id)
+
+
+def _store_principal(row) -> PrincipalSchema | None:
+    if not row:
+        return None
+
+    principal = PrincipalSchema(
+        id=row.id,
+        is_active=row.is_active,
+        full_name=row.full_name,
+        token_version=row.token_version or 0,
+    )
+    principal_cache.set(str(row.id), principal)
+    return principal
+
+
+def get_principal(user_id: UUID, db: Session) -> PrincipalSchema | None:
+    """
+    Resolve a principal: local LRU first, then Redis, then the database.
+
+    The session is only used on a full miss, so cache hits never check out
+    a connection from the pool.
+    """
+    principal = _cached_principal(user_id)
+    if principal is not None:
+        return principal
+    return _store_principal(db.execute(_principal_query(user_id)).first())
+
+
+async def get_principal_async(user_id: UUID, db: AsyncSession) -> PrincipalSchema | None:
+    """get_principal for the async stack (Redis is only reached from the threadpool)."""
+    principal = await principal_cache.get_async(str(user_id))
+    if principal is not None:
+        return principal
+    row = (await db.execute(_principal_query(user_id))).first()
+    return await run_in_threadpool(_store_principal, row)
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """Drop a user from Redis and every worker's LRU (call after any user update)."""
+    principal_cache.delete(str(user_id))
+
+
+def get_principal_cache_stats() -> dict:
+    return principal_cache.stats()
+
+
+# Any committed change to a User row (deactivation, rename, ...) invalidates
+# its cached principal, whichever code path made the change.
+@event.listens_for(User, "after_update")
+def _mark_principal_stale(mapper, connection, target: User):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("stale_principals", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_principals(session: Session):
+    for user_id in session.info.pop("stale_principals", ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_principals(session: Session):
+    session.info.pop("stale_principals", None)
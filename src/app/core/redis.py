@@ -1,16 +1,19 @@
 # app/core/redis.py
+import time
 import redis
 from app.core.config import settings
 from app.core.logger import logger
 
 redis_client = None
+# After a failed connect, calls return None without retrying until then
+_retry_at = 0.0
 
 
 def get_redis_client():
     """Get or create Redis client singleton"""
-    global redis_client
+    global redis_client, _retry_at
     
-    if redis_client is None:
+    if redis_client is None and time.monotonic() >= _retry_at:
         try:
             redis_client = redis.from_url(
                 settings.REDIS_URL,
@@ -23,10 +26,16 @@ def get_redis_client():
         except redis.ConnectionError as e:
             logger.error(f"Redis connection failed: {e}")
             redis_client = None
+            _retry_at = time.monotonic() + settings.REDIS_RETRY_SECONDS
     
     return redis_client
 
 
+def connected_redis_client():
+    """The client if already connected, else None; never connects (safe on the event loop)."""
+    return redis_client
+
+
 def close_redis():
     """Close Redis connection"""
     global redis_client
@@ -1,50 +1,97 @@
 # app/core/security.py
-from passlib.context import CryptContext
+import hashlib
+import time
+import uuid
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
 from app.core.config import settings
 from app.core.redis import get_redis_client
 from app.core.logger import logger
+from app.core.cache import TTLCache
+from app.core.token_filter import revoked_token_filter
+from app.core.hashing import pwd_context, hash_password, verify_password
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Verified claims keyed by token digest, so repeat requests skip jwt.decode
+token_cache = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS,
+)
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def _build_claims(data: dict, expire: datetime, token_type: str) -> dict:
+    """
+    Common claims. `jti` identifies the token for single-token revocation;
+    callers pass `ver` (the user's token_version) to support revoking all
+    of a user's tokens at once.
+    """
+    to_encode = data.copy()
+    to_encode.update({"exp": expire, "type": token_type, "jti": uuid.uuid4().hex})
+    return to_encode
 
 def create_access_token(data: dict) -> str:
-    to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode = _build_claims(data, expire, "access")
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 def create_refresh_token(data: dict) -> str:
-    to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode = _build_claims(data, expire, "refresh")
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
-def is_token_blacklisted(token: str) -> bool:
-    """Check if token is in blacklist (logout)."""
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def token_identifier(token: str, payload: dict) -> str:
+    """Compact revocation id: the jti claim, or a digest for tokens issued without one."""
+    return payload.get("jti") or token_digest(token)
+
+def is_token_blacklisted(identifier: str) -> bool:
+    """
+    Check if a token identifier is in blacklist (logout).
+
+    The local Bloom filter answers most checks; Redis is only asked when the
+    filter reports a possible revocation or is out of sync.
+    """
     redis_client = get_redis_client()
     if redis_client:
-        blacklist_key = f"token_blacklist:{token}"
-        return redis_client.exists(blacklist_key) > 0
+        if not revoked_token_filter.might_be_revoked(identifier, redis_client):
+            return False
+        blacklist_key = f"token_blacklist:{identifier}"
+        blacklisted = redis_client.exists(blacklist_key) > 0
+        if not blacklisted:
+            revoked_token_filter.record_false_positive()
+        return blacklisted
     return False
 
+def _decode_token(token: str) -> dict:
+    """Decode and verify a token, reusing cached claims when possible."""
+    digest = token_digest(token)
+    payload = token_cache.get(digest)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    # Never keep claims around longer than the token itself is valid
+    exp = payload.get("exp")
+    if exp:
+        token_cache.set(digest, payload, ttl=exp - time.time())
+    return payload
+
+def get_token_cache_stats() -> dict:
+    """Hit/miss counters of the verified claims cache."""
+    return token_cache.stats()
+
 def verify_token(token: str, expected_type: str = "access") -> dict | None:
     try:
-        # Check if token is blacklisted
-        if is_token_blacklisted(token):
-            return None
-        
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token(token)
         if payload.get("type") != expected_type:
             logger.warning(f"Token type mismatch: expected {expected_type}, got {payload.get('type')}")
             return None
-        return payload
+
+        # Check if token is blacklisted
+        if is_token_blacklisted(token_identifier(token, payload)):
+            return None
+        return dict(payload)
     except JWTError as e:
         logger.warning(f"JWT decode error: {e}")
         return None
\ No newline at end of file
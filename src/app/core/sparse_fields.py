@@ -0,0 +1,68 @@
+# app/core/sparse_fields.py
+"""
+Sparse fieldsets: `fields=id,name,position,status` on project/board/task reads.
+
+Lists push the selection down into SQL with load_only(), so unrequested
+columns (a task's description, say) are neither read nor materialized, and
+render through a copy of the response schema trimmed to the requested
+fields. Single objects come from the object cache and are trimmed there.
+`id` is always included.
+"""
+from functools import lru_cache
+from typing import Any
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from app.core.exceptions import ValidationError
+from app.schemas.pagination import CursorPaginatedResponse, PaginatedResponse
+
+Fields = tuple[str, ...]
+
+
+def parse_fields(schema: type[BaseModel], fields: str | None) -> Fields | None:
+    """The `fields` query parameter as schema field names (in schema order), or None for all of them."""
+    if fields is None:
+        return None
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names - schema.model_fields.keys()
+    if unknown:
+        raise ValidationError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. Available: {', '.join(schema.model_fields)}"
+        )
+    # Schema order: equal selections share cache keys and trimmed schemas
+    return tuple(name for name in schema.model_fields if name in names or name == "id")
+
+
+@lru_cache(maxsize=None)
+def sparse_schema(schema: type[BaseModel], fields: Fields) -> type[BaseModel]:
+    """`schema` with only `fields`."""
+    return create_model(
+        f"{schema.__name__}[{','.join(fields)}]",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (field.annotation, field) for name, field in schema.model_fields.items() if name in fields},
+    )
+
+
+def select_schema(schema: type[BaseModel], fields: Fields | None) -> type[BaseModel]:
+    """`schema` trimmed to `fields`, or `schema` itself when no selection was made."""
+    return schema if fields is None else sparse_schema(schema, fields)
+
+
+def sparse_page(schema: type[BaseModel], fields: Fields) -> Any:
+    """Response model of a list page of `schema` trimmed to `fields`."""
+    item = sparse_schema(schema, fields)
+    return PaginatedResponse[item] | CursorPaginatedResponse[item]
+
+
+def trim(payload: dict, fields: Fields | None) -> dict:
+    """A serialized object with only `fields`."""
+    if fields is None:
+        return payload
+    return {name: payload[name] for name in fields}
+
+
+def load_fields(model, fields: Fields, *extra: str | None):
+    """load_only() option for the columns behind `fields`, plus `extra` ones (e.g. sort keys)."""
+    columns = inspect(model).column_attrs.keys()
+    names = sorted({name for name in (*fields, *extra) if name in columns})
+    return load_only(*(getattr(model, name) for name in names))
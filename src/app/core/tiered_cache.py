@@ -0,0 +1,282 @@
+# app/core/tiered_cache.py
+"""
+Two-tier cache: a per-worker LRU (L1) in front of Redis (L2).
+
+Every uvicorn worker keeps its own L1, bounded by entries and by bytes (the
+length of the serialized value), so most hits skip the network hop to
+Redis. Invalidations are published on one Redis pub/sub channel; each worker
+runs a listener thread that drops the keys from its L1, so all workers
+forget a key within milliseconds. If the listener loses its connection it
+clears every L1 once reconnected, since messages may have been missed.
+
+Caches with `require_redis=True` skip both tiers while Redis is down: without
+the channel other workers couldn't be told to drop their copies.
+
+The client is the blocking redis-py one, so coroutines use `get_async` /
+`set_async`: L1 hits are answered on the event loop, everything that may
+reach Redis runs in the threadpool.
+"""
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable
+import redis
+from starlette.concurrency import run_in_threadpool
+from app.core.cache import TTLCache
+from app.core.logger import logger
+from app.core.redis import connected_redis_client, get_redis_client
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# name -> cache, for routing invalidation messages
+_caches: dict[str, "TieredCache"] = {}
+
+_listener_lock = threading.Lock()
+_listener_pid: int | None = None
+
+
+class TieredCache:
+    """
+    L1 (TTLCache) + L2 (Redis strings under `{name}:{key}`) with broadcast invalidation.
+
+    `dumps`/`loads` convert values to and from the string stored in Redis;
+    L1 keeps the decoded value. Subclasses can store L2 differently by
+    overriding the `_l2_*` methods.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        max_bytes: int,
+        ttl: float,
+        dumps: Callable[[Any], str] = json.dumps,
+        loads: Callable[[str], Any] = json.loads,
+        redis_enabled: Callable[[], bool] = lambda: True,
+        require_redis: bool = True,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.local = TTLCache(max_size=max_size, ttl=ttl, max_bytes=max_bytes)
+        self.dumps = dumps
+        self.loads = loads
+        self.redis_enabled = redis_enabled
+        self.require_redis = require_redis
+        self.redis_hits = 0
+        self.misses = 0
+        _caches[name] = self
+
+    def redis_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _redis(self):
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            start_invalidation_listener()
+        return redis_client
+
+    def available(self) -> bool:
+        return not self.require_redis or self._redis() is not None
+
+    # --- L2, one Redis string per key ---
+
+    def _l2_get(self, redis_client, key: str) -> str | None:
+        return redis_client.get(self.redis_key(key))
+
+    def _l2_set(self, redis_client, key: str, raw: str, ttl: float) -> None:
+        redis_client.set(self.redis_key(key), raw, ex=max(int(ttl), 1))
+
+    def _l2_delete(self, redis_client, keys: tuple[str, ...]) -> None:
+        redis_client.delete(*(self.redis_key(key) for key in keys))
+
+    def _l2_delete_prefix(self, redis_client, prefix: str) -> None:
+        # SCAN rather than KEYS: never blocks Redis, whatever the key count
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self.redis_key(prefix)) + "*"
+        keys = list(redis_client.scan_iter(match=pattern, count=500))
+        for start in range(0, len(keys), 500):
+            redis_client.delete(*keys[start:start + 500])
+
+    # --- Reads and writes ---
+
+    def get(self, key: str) -> Any | None:
+        """L1, then Redis (refilling L1); None on a miss or while unavailable."""
+        if not self.available():
+            self.misses += 1
+            return None
+
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        return self._get_l2(key)
+
+    def _get_l2(self, key: str) -> Any | None:
+        redis_client = self._redis() if self.redis_enabled() else None
+        if redis_client:
+            try:
+                raw = self._l2_get(redis_client, key)
+                if raw is not None:
+                    value = self.loads(raw)
+                    self.local.set(key, value, size=len(raw))
+                    self.redis_hits += 1
+                    return value
+            except (redis.RedisError, ValueError) as e:
+                logger.warning(f"{self.name} cache read failed: {e}")
+        self.misses += 1
+        return None
+
+    async def get_async(self, key: str) -> Any | None:
+        """get() for coroutines: an L1 hit never leaves the event loop, Redis is read from the threadpool."""
+        if self.require_redis and connected_redis_client() is None:
+            # available() would have to (re)connect first
+            return await run_in_threadpool(self.get, key)
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        return await run_in_threadpool(self._get_l2, key)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store in both tiers (L1 keeps it at most for its own TTL)."""
+        if not self.available():
+            return
+        ttl = self.ttl if ttl is None else ttl
+        raw = self.dumps(value)
+        self.local.set(key, value, ttl=ttl, size=len(raw))
+
+        redis_client = self._redis() if self.redis_enabled() else None
+        if redis_client:
+            try:
+                self._l2_set(redis_client, key, raw, ttl)
+            except redis.RedisError as e:
+                logger.warning(f"{self.name} cache write failed: {e}")
+
+    async def set_async(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """set() for coroutines (the Redis write runs in the threadpool)."""
+        await run_in_threadpool(self.set, key, value, ttl)
+
+    def set_local(self, key: str, value: Any, size: int = 0) -> None:
+        """Store in L1 only (e.g. a value whose L2 copy is managed elsewhere)."""
+        if self.available():
+            self.local.set(key, value, size=size)
+
+    # --- Invalidation ---
+
+    def delete(self, *keys: str) -> None:
+        """Drop keys from Redis and from the L1 of every worker."""
+        if not keys:
+            return
+        redis_client = self._redis()
+        if redis_client and self.redis_enabled():
+            try:
+                self._l2_delete(redis_client, keys)
+            except redis.RedisError as e:
+                logger.warning(f"{self.name} cache invalidation failed: {e}")
+        self.invalidate_local(*keys)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Drop every key starting with `prefix` from Redis and from every L1."""
+        redis_client = self._redis()
+        if redis_client and self.redis_enabled():
+            try:
+                self._l2_delete_prefix(redis_client, prefix)
+            except redis.RedisError as e:
+                logger.warning(f"{self.name} cache invalidation failed: {e}")
+        self.local.delete_prefix(prefix)
+        self._publish({"prefix": prefix})
+
+    def invalidate_local(self, *keys: str) -> None:
+        """Drop keys from the L1 of every worker (Redis is left alone)."""
+        for key in keys:
+            self.local.delete(key)
+        self._publish({"keys": list(keys)})
+
+    def _publish(self, message: dict) -> None:
+        redis_client = get_redis_client()
+        if redis_client:
+            try:
+                redis_client.publish(INVALIDATION_CHANNEL, json.dumps({"cache": self.name, **message}))
+            except redis.RedisError as e:
+                logger.warning(f"{self.name} cache invalidation broadcast failed: {e}")
+
+    def clear(self) -> None:
+        """Drop this worker's L1 and reset counters."""
+        self.local.clear()
+        self.redis_hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Per-tier counters; the L2 hit ratio is over the lookups L1 missed."""
+        local = self.local.stats()
+        l2_lookups = self.redis_hits + self.misses
+        lookups = local["hits"] + l2_lookups
+        hits = local["hits"] + self.redis_hits
+        return {
+            "size": local["size"],
+            "hits": hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "l1": local,
+            "l2": {
+                "hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.redis_hits / l2_lookups, 4) if l2_lookups else 0.0,
+            },
+        }
+
+
+def _apply_invalidation(data: str) -> None:
+    """Handle one message from INVALIDATION_CHANNEL."""
+    message = json.loads(data)
+    cache = _caches.get(message.get("cache"))
+    if cache is None:
+        return
+    for key in message.get("keys", ()):
+        cache.local.delete(key)
+    if "prefix" in message:
+        cache.local.delete_prefix(message["prefix"])
+
+
+def _listen() -> None:
+    reconnecting = False
+    while True:
+        redis_client = get_redis_client()
+        if redis_client is None:
+            time.sleep(1)
+            continue
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            if reconnecting:
+                # Invalidations published while we were away are lost
+                for cache in _caches.values():
+                    cache.local.delete_prefix("")
+                reconnecting = False
+            while True:
+                # A short poll instead of listen(): idle connections would
+                # otherwise hit the client's socket_timeout
+                message = pubsub.get_message(timeout=1.0)
+                if message and message["type"] == "message":
+                    _apply_invalidation(message["data"])
+        except (redis.RedisError, ValueError) as e:
+            logger.warning(f"Cache invalidation listener error: {e}")
+            reconnecting = True
+            time.sleep(1)
+        finally:
+            pubsub.close()
+
+
+def start_invalidation_listener() -> None:
+    """Start this worker's listener thread (once per process, after fork too)."""
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+        _listener_pid = os.getpid()
+        threading.Thread(target=_listen, name="cache-invalidation", daemon=True).start()
+
+
+def get_tiered_cache_stats() -> dict:
+    return {name: cache.stats() for name, cache in _caches.items()}
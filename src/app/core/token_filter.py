@@ -0,0 +1,205 @@
+# app/core/token_filter.py
+"""
+Per-worker Bloom filter in front of the token blacklist.
+
+Almost no tokens are ever revoked, so instead of asking Redis on every
+authenticated request each worker keeps a Bloom filter of revoked token
+identifiers. A negative answer is definitive; only a positive one (a real
+revocation or a false positive) is confirmed against Redis.
+
+The filter is kept in sync through:
+- a Redis sorted set (`revoked_tokens`, score = token exp) used to rebuild
+  the filter on first use and every TOKEN_FILTER_RESYNC_SECONDS, which also
+  drops identifiers of tokens that already expired;
+- a pub/sub channel that `auth_service.logout` publishes to, so other
+  workers learn about a revocation within milliseconds.
+
+Whenever the filter is not in sync (Redis down, listener died) callers must
+fall back to asking Redis directly.
+"""
+import hashlib
+import math
+import threading
+import time
+import redis
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.redis import get_redis_client
+
+REVOKED_TOKENS_KEY = "revoked_tokens"
+REVOKED_TOKENS_CHANNEL = "revoked_tokens"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for `capacity` items at `error_rate`."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """Theoretical FP rate for the current number of items."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class RevokedTokenFilter:
+    """Bloom filter of revoked token identifiers, synced through Redis."""
+
+    def __init__(self):
+        self._filter = self._new_filter()
+        # The filter being rebuilt by _sync, which add() also writes to
+        self._rebuilding: BloomFilter | None = None
+        self._lock = threading.Lock()
+        # Guards the swap of _filter/_rebuilding against add(); _lock is held across Redis calls
+        self._add_lock = threading.Lock()
+        self._synced_at: float | None = None
+        self._listener = None
+        self.stats = {"negatives": 0, "positives": 0, "false_positives": 0, "unsynced_checks": 0}
+
+    @staticmethod
+    def _new_filter() -> BloomFilter:
+        return BloomFilter(settings.TOKEN_FILTER_CAPACITY, settings.TOKEN_FILTER_ERROR_RATE)
+
+    def _on_message(self, message: dict) -> None:
+        self.add(message["data"])
+
+    def _on_listener_error(self, e, pubsub, thread) -> None:
+        logger.warning(f"Revoked token listener stopped: {e}")
+        self._synced_at = None
+        self._listener = None
+        thread.stop()
+
+    def _sync(self, redis_client) -> None:
+        """(Re)build the filter from Redis and make sure the listener runs."""
+        with self._lock:
+            synced_at = self._synced_at
+            if synced_at is not None and time.monotonic() - synced_at <= settings.TOKEN_FILTER_RESYNC_SECONDS:
+                # Another thread synced while we waited for the lock
+                return
+            try:
+                if self._listener is None:
+                    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(**{REVOKED_TOKENS_CHANNEL: self._on_message})
+                    self._listener = pubsub.run_in_thread(
+                        sleep_time=1.0,
+                        daemon=True,
+                        exception_handler=self._on_listener_error,
+                    )
+
+                now = time.time()
+                redis_client.zremrangebyscore(REVOKED_TOKENS_KEY, "-inf", now)
+                bloom = self._new_filter()
+                # Revocations arriving from now on go to both filters, so
+                # none is lost between the ZRANGE and the swap
+                with self._add_lock:
+                    self._rebuilding = bloom
+                for identifier in redis_client.zrangebyscore(REVOKED_TOKENS_KEY, now, "+inf"):
+                    bloom.add(identifier)
+                with self._add_lock:
+                    self._filter = bloom
+                    self._rebuilding = None
+                self._synced_at = time.monotonic()
+            except redis.RedisError as e:
+                logger.warning(f"Revoked token filter sync failed: {e}")
+                self._synced_at = None
+                with self._add_lock:
+                    self._rebuilding = None
+
+    def _in_sync(self, redis_client) -> bool:
+        synced_at = self._synced_at
+        if synced_at is None or time.monotonic() - synced_at > settings.TOKEN_FILTER_RESYNC_SECONDS:
+            self._sync(redis_client)
+        return self._synced_at is not None
+
+    def might_be_revoked(self, identifier: str, redis_client) -> bool:
+        """
+        False means the token is definitely not revoked.
+        True means Redis has to be asked (possible revocation, or filter unsynced).
+        """
+        if not self._in_sync(redis_client):
+            self.stats["unsynced_checks"] += 1
+            return True
+        if identifier in self._filter:
+            self.stats["positives"] += 1
+            return True
+        self.stats["negatives"] += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        """Redis said 'not revoked' after the filter said 'maybe'."""
+        if self._synced_at is not None:
+            self.stats["false_positives"] += 1
+
+    def add(self, identifier: str) -> None:
+        with self._add_lock:
+            for bloom in (self._filter, self._rebuilding):
+                # The publishing worker also receives its own message
+                if bloom is not None and identifier not in bloom:
+                    bloom.add(identifier)
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            self._filter = self._new_filter()
+            self._synced_at = None
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def metrics(self) -> dict:
+        bloom = self._filter
+        return {
+            **self.stats,
+            "items": bloom.count,
+            "capacity": bloom.capacity,
+            "memory_bytes": bloom.memory_bytes,
+            "num_hashes": bloom.num_hashes,
+            "estimated_false_positive_rate": bloom.estimated_false_positive_rate,
+            "synced": self._synced_at is not None,
+        }
+
+
+revoked_token_filter = RevokedTokenFilter()
+
+
+def publish_revocation(identifier: str, exp: float) -> None:
+    """Record a revoked token identifier and notify every worker."""
+    revoked_token_filter.add(identifier)
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            pipe = redis_client.pipeline()
+            pipe.zadd(REVOKED_TOKENS_KEY, {identifier: exp})
+            pipe.publish(REVOKED_TOKENS_CHANNEL, identifier)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to publish token revocation: {e}")
+
+
+def get_token_filter_metrics() -> dict:
+    return revoked_token_filter.metrics()
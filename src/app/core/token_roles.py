@@ -0,0 +1,134 @@
+# app/core/token_roles.py
+"""
+Roles-in-token mode (opt-in, ROLES_IN_TOKEN_ENABLED).
+
+Access tokens carry a compact `roles` claim (project id -> role letter) and
+`mv`, the user's membership version at issue time. While `mv` still matches
+the version stored in Redis the token's roles are authoritative and
+`require_project_roles` needs no membership lookup at all. Every membership
+change stores a fresh random version, so older tokens fall back to the
+regular (cached) lookup until they are refreshed.
+
+Versions are random tokens rather than counters: if Redis loses the key a
+missing version never matches, so stale roles are never trusted.
+"""
+import uuid
+from uuid import UUID
+import redis
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.redis import get_redis_client
+from app.models.membership import Membership, UserRole
+
+ROLE_CODES = {UserRole.OWNER: "O", UserRole.EDITOR: "E", UserRole.VIEWER: "V"}
+ROLES_BY_CODE = {code: role for role, code in ROLE_CODES.items()}
+
+
+def _version_key(user_id: UUID) -> str:
+    return f"membership_version:{user_id}"
+
+
+def _version_ttl() -> int:
+    # Outlive every token that could carry the version
+    return settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400 + 3600
+
+
+def get_membership_version(user_id: UUID) -> str | None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+    try:
+        return redis_client.get(_version_key(user_id))
+    except redis.RedisError as e:
+        logger.warning(f"Membership version read failed: {e}")
+        return None
+
+
+def bump_membership_version(*user_ids: UUID) -> None:
+    """Invalidate the roles embedded in these users' tokens."""
+    if not settings.ROLES_IN_TOKEN_ENABLED or not user_ids:
+        return
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        pipe = redis_client.pipeline()
+        for user_id in user_ids:
+            pipe.set(_version_key(user_id), uuid.uuid4().hex[:12], ex=_version_ttl())
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Membership version bump failed: {e}")
+
+
+def build_role_claims(user_id: UUID, db: Session) -> dict:
+    """
+    Claims to embed in an access token, or {} when the mode is off, Redis is
+    unavailable or the user is in too many projects.
+    """
+    if not settings.ROLES_IN_TOKEN_ENABLED:
+        return {}
+    redis_client = get_redis_client()
+    if not redis_client:
+        return {}
+
+    try:
+        # Read the version *before* the memberships: a change racing with
+        # this login bumps it again and the token simply starts out stale.
+        key = _version_key(user_id)
+        redis_client.set(key, uuid.uuid4().hex[:12], ex=_version_ttl(), nx=True)
+        version = redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Membership version read failed: {e}")
+        return {}
+    if not version:
+        return {}
+
+    memberships = (
+        db.query(Membership.project_id, Membership.role)
+        .filter(Membership.user_id == user_id)
+        .limit(settings.ROLES_IN_TOKEN_MAX_PROJECTS + 1)
+        .all()
+    )
+    if len(memberships) > settings.ROLES_IN_TOKEN_MAX_PROJECTS:
+        return {}
+
+    return {
+        "roles": {project_id.hex: ROLE_CODES[role] for project_id, role in memberships},
+        "mv": version,
+    }
+
+
+def _claimed_roles(claims: dict) -> tuple[dict, str] | None:
+    """(roles, membership version) carried by the token, if any."""
+    if not settings.ROLES_IN_TOKEN_ENABLED:
+        return None
+    roles, version = claims.get("roles"), claims.get("mv")
+    if roles is None or not version:
+        return None
+    return roles, version
+
+
+def _claimed_role(roles: dict, project_id: UUID) -> tuple[bool, UserRole | None]:
+    code = roles.get(project_id.hex)
+    return True, ROLES_BY_CODE.get(code) if code else None
+
+
+def role_from_claims(claims: dict, user_id: UUID, project_id: UUID) -> tuple[bool, UserRole | None]:
+    """
+    Returns (usable, role). `usable` is False when the token carries no roles
+    or they are stale; the caller must then look the membership up itself.
+    """
+    claimed = _claimed_roles(claims)
+    if claimed is None or get_membership_version(user_id) != claimed[1]:
+        return False, None
+    return _claimed_role(claimed[0], project_id)
+
+
+async def role_from_claims_async(claims: dict, user_id: UUID, project_id: UUID) -> tuple[bool, UserRole | None]:
+    """role_from_claims for the async stack: the version is read from Redis in the threadpool."""
+    claimed = _claimed_roles(claims)
+    if claimed is None or await run_in_threadpool(get_membership_version, user_id) != claimed[1]:
+        return False, None
+    return _claimed_role(claimed[0], project_id)
@@ -0,0 +1,91 @@
+# app/db/pool.py
+"""
+Connection pools that measure how long requests wait for a connection.
+
+With several uvicorn workers every worker has its own pool, so the numbers
+reported by get_pool_metrics() are per worker; multiply pool_size +
+max_overflow by the worker count when sizing against Postgres
+max_connections.
+"""
+import os
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.metrics import Histogram
+
+# Checkout waits are usually sub-millisecond until the pool runs dry
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+        self.timeouts = 0
+
+    def reset(self) -> None:
+        self.checkout_wait.reset()
+        self.timeouts = 0
+
+
+class _TimedCheckout:
+    """Times QueuePool._do_get, i.e. waiting for a free slot (and connecting on overflow)."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started)
+
+
+# Metrics live on the class: engine.dispose() replaces the pool instance
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    metrics = PoolMetrics()
+
+
+class InstrumentedReplicaQueuePool(_TimedCheckout, QueuePool):
+    """Base of the replica pools; use replica_pool_class() so each replica counts on its own."""
+
+
+def replica_pool_class() -> type[InstrumentedReplicaQueuePool]:
+    """A pool class (and so a metrics instance) of its own for one replica engine."""
+    return type("InstrumentedReplicaQueuePool", (InstrumentedReplicaQueuePool,), {"metrics": PoolMetrics()})
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def pool_snapshot(pool) -> dict:
+    """Live gauges of one pool plus its checkout wait histogram."""
+    snapshot = {"status": pool.status()}
+    if isinstance(pool, QueuePool):
+        snapshot.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # QueuePool counts overflow from -pool_size
+            "overflow": max(0, pool.overflow()),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        snapshot["timeouts"] = metrics.timeouts
+        snapshot["checkout_wait_seconds"] = metrics.checkout_wait.snapshot()
+    return snapshot
+
+
+def get_pool_metrics() -> dict:
+    from app.db.session import engine, async_engine, replica_engines
+
+    result = {"pid": os.getpid(), "sync": pool_snapshot(engine.pool)}
+    if replica_engines:
+        result["replicas"] = [pool_snapshot(replica.pool) for replica in replica_engines]
+    if async_engine is not None:
+        result["async"] = pool_snapshot(async_engine.pool)
+    return result
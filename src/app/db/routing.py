@@ -0,0 +1,88 @@
+# app/db/routing.py
+"""
+Read-replica routing (optional, DATABASE_REPLICA_URLS).
+
+Read-only routes get a session whose SELECTs go to one replica, picked
+round-robin per request. Anything flushed still goes to the primary.
+
+Replicas lag, so after a user's write every read of that user goes to the
+primary for REPLICA_STICKINESS_SECONDS (read-your-writes). The window is
+kept in Redis so it holds across workers, and locally for the worker that
+saw the write. Permission checks always use the primary session.
+"""
+from uuid import UUID
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.redis import get_redis_client
+
+_sticky_users = TTLCache(max_size=100_000, ttl=settings.REPLICA_STICKINESS_SECONDS)
+
+
+class RoutingSession(Session):
+    """Session that reads from `info["replica"]` when set and writes to its own bind."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica")
+        if replica is not None and not self._flushing:
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+def _redis_key(user_id: UUID) -> str:
+    return f"db_sticky:{user_id}"
+
+
+def mark_sticky(*user_ids: UUID) -> None:
+    """Send these users' reads to the primary for the stickiness window."""
+    if not settings.DATABASE_REPLICA_URLS or not user_ids:
+        return
+    for user_id in user_ids:
+        _sticky_users.set(user_id, True)
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            pipe = redis_client.pipeline()
+            for user_id in user_ids:
+                pipe.set(_redis_key(user_id), 1, ex=settings.REPLICA_STICKINESS_SECONDS)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Replica stickiness write failed: {e}")
+
+
+def is_sticky(user_id: UUID) -> bool:
+    if _sticky_users.get(user_id):
+        return True
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            return bool(redis_client.exists(_redis_key(user_id)))
+        except redis.RedisError as e:
+            logger.warning(f"Replica stickiness read failed: {e}")
+            # Can't tell whether the user just wrote: play safe
+            return True
+    return False
+
+
+def reset_stickiness() -> None:
+    _sticky_users.clear()
+
+
+# A committed flush on a session that knows its user makes that user sticky
+@event.listens_for(Session, "after_flush")
+def _mark_session_wrote(session: Session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _stick_writer_to_primary(session: Session):
+    if session.info.pop("wrote", False) and session.info.get("user_id"):
+        mark_sticky(session.info["user_id"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_session_writes(session: Session):
+    session.info.pop("wrote", None)
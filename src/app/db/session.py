@@ -1,14 +1,79 @@
 # app/db/session.py
+import itertools
+import threading
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, replica_pool_class
+from app.db.routing import RoutingSession
+
+
+def pool_options() -> dict:
+    """Pool sizing shared by the sync and async engines (per uvicorn worker)."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,  
-    pool_pre_ping=True    
+    echo=settings.DEBUG,
+    poolclass=InstrumentedQueuePool,
+    **pool_options()
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession)
+
+# Read replicas (optional): read-only routes pick one per request, round-robin
+replica_engines = [
+    create_engine(url, echo=settings.DEBUG, poolclass=replica_pool_class(), **pool_options())
+    for url in settings.DATABASE_REPLICA_URLS
+]
+_replica_cycle = itertools.cycle(replica_engines)
+_replica_lock = threading.Lock()
+
+
+def next_replica():
+    """Next replica engine, or None when no replicas are configured."""
+    if not replica_engines:
+        return None
+    with _replica_lock:
+        return next(_replica_cycle)
+
+
+Base = declarative_base()
+
+
+# Async drivers for the sync DATABASE_URL schemes
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> URL:
+    """Same database as `url`, through an async driver (psycopg3 for Postgres)."""
+    parsed = make_url(url)
+    return parsed.set(drivername=ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername))
+
+
+# Only built when the async stack is enabled, so the sync-only setup needs no async driver
+async_engine = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
 
-Base = declarative_base()
\ No newline at end of file
+if settings.ASYNC_DB_ENABLED:
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options()
+    )
+    # expire_on_commit=False: expired attributes would lazy load (i.e. do IO) during serialization
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
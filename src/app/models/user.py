@@ -17,6 +17,8 @@ class User(Base):
     password: so.Mapped[str] = so.mapped_column(sa.String(256), nullable=False)
     full_name: so.Mapped[str] = so.mapped_column(sa.String(64))
     is_active: so.Mapped[bool] = so.mapped_column(sa.Boolean, default=True)
+    # Bumped to revoke every token issued to this user ("log out everywhere")
+    token_version: so.Mapped[int] = so.mapped_column(sa.Integer, default=0, server_default="0")
     created_at: so.Mapped[datetime] = so.mapped_column(
         sa.DateTime, default=lambda: datetime.now(timezone.utc), index=True
     )
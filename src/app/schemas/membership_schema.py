@@ -12,4 +12,10 @@ class MemberResponseSchema(BaseModel):
     user_id: UUID
     role: UserRole
     invited_by: UUID | None
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class ProjectAccessSchema(BaseModel):
+    """Role decision returned by require_project_roles."""
+    user_id: UUID
+    project_id: UUID
+    role: UserRole
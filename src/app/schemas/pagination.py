@@ -1,6 +1,6 @@
 # app/schemas/pagination.py
 from pydantic import BaseModel, Field, field_validator
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 from app.core.config import settings
 
 T = TypeVar('T')
@@ -15,6 +15,21 @@ class PaginationParams(BaseModel):
         le=settings.MAX_PAGE_SIZE,
         description=f"Items per page (max {settings.MAX_PAGE_SIZE})"
     )
+    mode: Literal["page", "cursor"] = Field(default="page", description="page (OFFSET) or cursor (keyset)")
+    cursor: str | None = Field(default=None, description="Opaque cursor from next_cursor/prev_cursor")
+    include_total: bool = Field(default=True, description="Count matching rows (page mode)")
+    total_mode: Literal["exact", "estimate", "cached"] = Field(default="exact", description="How the total is computed")
+
+    @property
+    def use_cursor(self) -> bool:
+        """Cursor (keyset) mode: requested explicitly or implied by a cursor"""
+        return self.mode == "cursor" or self.cursor is not None
+
+    @property
+    def is_first_page(self) -> bool:
+        """Page 1, or a cursor-mode request without a cursor"""
+        return self.cursor is None and self.page == 1
+
     @property
     def offset(self) -> int:
         """Calculate SQL offset"""
@@ -28,23 +43,33 @@ class PaginationParams(BaseModel):
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper"""
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
     has_next: bool
     has_previous: bool
+    total_estimated: bool = False
     
     @classmethod
     def create(
         cls,
         items: list[T],
-        total: int,
+        total: int | None,
         page: int,
-        page_size: int
+        page_size: int,
+        has_next: bool | None = None,
+        total_estimated: bool = False
     ) -> "PaginatedResponse[T]":
-        """Factory method to create paginated response"""
-        total_pages = (total + page_size - 1) // page_size  
+        """
+        Factory method to create paginated response.
+
+        `total` may be None (not counted); `has_next` from a limit+1 fetch is
+        then the only way to know whether there is a next page.
+        """
+        total_pages = (total + page_size - 1) // page_size if total is not None else None
+        if has_next is None:
+            has_next = page < total_pages
         
         return cls(
             items=items,
@@ -52,10 +77,22 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page=page,
             page_size=page_size,
             total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1
+            has_next=has_next,
+            has_previous=page > 1,
+            total_estimated=total_estimated
         )
 
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Keyset page: follow next_cursor/prev_cursor instead of page numbers"""
+    items: list[T]
+    page_size: int
+    next_cursor: str | None
+    prev_cursor: str | None
+    has_next: bool
+    has_previous: bool
+
+
 class SortParams(BaseModel):
     """Query parameters for sorting"""
     sort_by: str | None = Field(default=None, description="Field to sort by")
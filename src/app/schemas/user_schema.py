@@ -33,4 +33,14 @@ class UserResponseSchema(BaseModel):
     full_name: str
     is_active: bool
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PrincipalSchema(BaseModel):
+    """Minimal view of the authenticated user, safe to cache."""
+    id: UUID
+    is_active: bool
+    full_name: str
+    token_version: int = 0
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
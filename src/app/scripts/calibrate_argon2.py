@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# app/scripts/calibrate_argon2.py
+"""
+Pick argon2 parameters for this host.
+
+Benchmarks password verification for a grid of memory/time costs and keeps
+the most expensive combination whose latency at the chosen percentile stays
+under the target. Run it on the deployment host (or an identical one):
+
+    python -m app.scripts.calibrate_argon2 --target-ms 50 --percentile 99
+
+and copy the printed ARGON2_* lines into the environment. Existing hashes are
+upgraded transparently on each user's next successful login.
+"""
+import argparse
+import os
+import time
+from app.core.hashing import build_pwd_context
+
+# KiB; 19 MiB is the OWASP minimum for argon2id
+DEFAULT_MEMORY_COSTS = [19456, 32768, 47104, 65536, 98304, 131072]
+MAX_TIME_COST = 10
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int, samples: int, pct: float) -> float:
+    """Latency (ms) of verify() at the given percentile."""
+    context = build_pwd_context(time_cost, memory_cost, parallelism)
+    hashed = context.hash("calibration-password-123")
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify("calibration-password-123", hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return percentile(timings, pct)
+
+
+def calibrate(target_ms: float, pct: float, samples: int, parallelism: int, memory_costs: list[int]) -> dict | None:
+    best = None
+    for memory_cost in sorted(memory_costs):
+        chosen = None
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            latency = measure(time_cost, memory_cost, parallelism, samples, pct)
+            print(f"m={memory_cost:>7} KiB  t={time_cost:>2}  p{pct:g}={latency:8.1f} ms")
+            if latency > target_ms:
+                break
+            chosen = {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism, "latency_ms": latency}
+
+        if chosen is None:
+            # Even t=1 is too slow, more memory will only be slower
+            break
+        if best is None or chosen["time_cost"] * chosen["memory_cost"] > best["time_cost"] * best["memory_cost"]:
+            best = chosen
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate argon2 cost for a target verification latency")
+    parser.add_argument("--target-ms", type=float, default=50.0, help="Latency budget per verification")
+    parser.add_argument("--percentile", type=float, default=99.0, help="Percentile the budget applies to")
+    parser.add_argument("--samples", type=int, default=30, help="Verifications per candidate")
+    parser.add_argument("--parallelism", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--memory-cost", type=int, action="append", help="Candidate memory cost in KiB (repeatable)")
+    args = parser.parse_args()
+
+    best = calibrate(
+        target_ms=args.target_ms,
+        pct=args.percentile,
+        samples=args.samples,
+        parallelism=args.parallelism,
+        memory_costs=args.memory_cost or DEFAULT_MEMORY_COSTS,
+    )
+    if best is None:
+        print(f"\nNo candidate meets {args.target_ms} ms at p{args.percentile:g}; raise the target or lower --memory-cost.")
+        raise SystemExit(1)
+
+    print(f"\nSelected (p{args.percentile:g} = {best['latency_ms']:.1f} ms):")
+    print(f"ARGON2_TIME_COST={best['time_cost']}")
+    print(f"ARGON2_MEMORY_COST={best['memory_cost']}")
+    print(f"ARGON2_PARALLELISM={best['parallelism']}")
+
+
+if __name__ == "__main__":
+    main()
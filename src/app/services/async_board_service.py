@@ -0,0 +1,225 @@
+# app/services/async_board_service.py
+"""Async (AsyncSession) version of board_service, used when ASYNC_DB_ENABLED."""
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.models.board import Board
+from app.schemas.board_schema import BoardCreateSchema, BoardUpdateSchema, BoardResponseSchema
+from app.core.logger import logger
+from app.core.sparse_fields import Fields, load_fields, select_schema
+from app.core.columnar import columnar_payload, row_columns
+from app.core.exceptions import (
+    BoardNotFoundError,
+    BoardCreationError,
+)
+from app.schemas.pagination import PaginatedResponse, PaginationParams, SortParams
+from app.core.pagination import apply_sorting, paginate_async, paginate_cursor_async
+from app.core.object_cache import (
+    bump_list_generation,
+    list_key_async,
+    object_key,
+    page_payload,
+    read_through_async,
+    to_payload,
+)
+from app.services.board_service import COLUMNAR_DICTIONARY, invalidate_board_cache
+
+
+async def create_board(
+    project_id: UUID,
+    board_data: BoardCreateSchema,
+    db: AsyncSession
+) -> Board:
+    """Create a new board at the end of the project."""
+    try:
+        max_position = (await db.execute(
+            select(func.max(Board.position)).where(Board.project_id == project_id)
+        )).scalar()
+
+        next_position = (max_position + 1) if max_position is not None else 0
+
+        new_board = Board(
+            name=board_data.name,
+            project_id=project_id,
+            position=next_position
+        )
+        db.add(new_board)
+        await db.commit()
+        await db.refresh(new_board)
+        await run_in_threadpool(bump_list_generation, "boards", project_id)
+
+        logger.info(
+            "Board created",
+            extra={
+                "board_id": str(new_board.id),
+                "board_name": new_board.name,
+                "project_id": str(project_id)
+            }
+        )
+
+        return new_board
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error creating board: {str(e)}", exc_info=True)
+        raise BoardCreationError("Failed to create board") from e
+
+
+async def get_boards(
+    project_id: UUID,
+    include_archived: bool,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    name_filter: str | None,
+    db: AsyncSession,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[Board] | dict":
+    """Paginated, sorted and filtered boards of a project (see board_service.get_boards)."""
+    async def query_boards():
+        return await _query_boards(project_id, include_archived, pagination, sort_params, name_filter, db, fields, columnar)
+
+    def serialize(page):
+        if columnar:
+            return columnar_payload(page, fields or tuple(BoardResponseSchema.model_fields), COLUMNAR_DICTIONARY)
+        return page_payload(page, select_schema(BoardResponseSchema, fields))
+
+    if not pagination.is_first_page:
+        page = await query_boards()
+        return serialize(page) if columnar else page
+
+    key = await list_key_async(
+        "boards", project_id,
+        pagination=pagination.model_dump(), sort=sort_params.model_dump(),
+        archived=include_archived, name=name_filter, fields=fields, columnar=columnar,
+    )
+
+    async def load():
+        return serialize(await query_boards())
+
+    return await read_through_async(key, load, list_scope=("boards", project_id))
+
+
+async def _query_boards(
+    project_id: UUID,
+    include_archived: bool,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    name_filter: str | None,
+    db: AsyncSession,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[Board]":
+    if columnar:
+        names = fields or tuple(BoardResponseSchema.model_fields)
+        statement = select(*row_columns(Board, names, sort_params.sort_by, "position"))
+    else:
+        statement = select(Board)
+        if fields is not None:
+            statement = statement.options(load_fields(Board, fields, sort_params.sort_by, "position"))
+    statement = statement.where(Board.project_id == project_id)
+
+    if not include_archived:
+        statement = statement.where(Board.archived == False)
+
+    if name_filter:
+        statement = statement.where(Board.name.ilike(f"%{name_filter}%"))
+
+    allowed_sort_fields = ["name", "position", "created_at", "updated_at"]
+    if pagination.use_cursor:
+        return await paginate_cursor_async(
+            db, statement, pagination, sort_params, Board, allowed_sort_fields, "position", as_rows=columnar,
+        )
+    statement = apply_sorting(statement, sort_params, Board, allowed_sort_fields)
+
+    if not sort_params.sort_by:
+        statement = statement.order_by(Board.position.asc())
+
+    return await paginate_async(db, statement, pagination, Board, as_rows=columnar)
+
+
+async def get_board_by_id(project_id: UUID, board_id: UUID, db: AsyncSession) -> Board:
+    """Get a specific board."""
+    board = (await db.execute(
+        select(Board).where(Board.id == board_id, Board.project_id == project_id)
+    )).scalar_one_or_none()
+
+    if not board:
+        raise BoardNotFoundError(f"Board {board_id} not found in project {project_id}")
+
+    return board
+
+
+async def get_cached_board(project_id: UUID, board_id: UUID, db: AsyncSession) -> dict:
+    """Serialized board, read through the object cache (see board_service.get_cached_board)."""
+    async def load():
+        return to_payload(BoardResponseSchema, await get_board_by_id(project_id, board_id, db))
+
+    board = await read_through_async(object_key("board", board_id), load)
+    if board["project_id"] != str(project_id):
+        raise BoardNotFoundError(f"Board {board_id} not found in project {project_id}")
+    return board
+
+
+async def update_board(
+    project_id: UUID,
+    board_id: UUID,
+    board_data: BoardUpdateSchema,
+    db: AsyncSession,
+    board: Board | None = None
+) -> Board:
+    """Update a board. Pass `board` when it was already loaded by the scope dependency."""
+    if board is None:
+        board = await get_board_by_id(project_id, board_id, db)
+    old_name = board.name
+
+    if board_data.name is not None:
+        board.name = board_data.name
+    if board_data.position is not None:
+        board.position = board_data.position
+    if board_data.archived is not None:
+        board.archived = board_data.archived
+
+    await db.commit()
+    await db.refresh(board)
+    await run_in_threadpool(invalidate_board_cache, project_id, board_id)
+
+    logger.info(
+        "Board updated",
+        extra={
+            "board_id": str(board_id),
+            "old_name": old_name,
+            "new_name": board.name,
+            "board_name": str(board.name),
+            "project_id": str(project_id),
+        }
+    )
+
+    return board
+
+
+async def delete_board(project_id: UUID, board_id: UUID, db: AsyncSession, board: Board | None = None) -> None:
+    """Delete a board (hard delete)."""
+    if board is None:
+        board = await get_board_by_id(project_id, board_id, db)
+    board_name = board.name
+    try:
+        await db.delete(board)
+        await db.commit()
+        await run_in_threadpool(invalidate_board_cache, project_id, board_id)
+        await run_in_threadpool(bump_list_generation, "tasks", board_id)
+
+        logger.info(
+            "Board deleted",
+            extra={
+                "board_id": str(board_id),
+                "board_name": board_name,
+                "project_id": str(project_id)
+            }
+        )
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error deleting board: {str(e)}", exc_info=True)
+        raise
@@ -0,0 +1,212 @@
+# app/services/async_projects_service.py
+"""Async (AsyncSession) version of projects_service, used when ASYNC_DB_ENABLED."""
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import selectinload
+from app.models.project import Project
+from app.models.membership import Membership, UserRole
+from app.schemas.project_schema import ProjectCreateSchema, ProjectUpdateSchema, ProjectResponseSchema
+from app.schemas.pagination import PaginatedResponse, PaginationParams, SortParams
+from app.core.pagination import apply_sorting, paginate_async, paginate_cursor_async
+from app.core.logger import logger
+from app.core.sparse_fields import Fields, load_fields, select_schema
+from app.core.membership_cache import invalidate_project_roles
+from app.core.token_roles import bump_membership_version
+from app.core.object_cache import (
+    bump_list_generation,
+    list_key_async,
+    object_key,
+    page_payload,
+    read_through_async,
+    to_payload,
+)
+from app.services.projects_service import invalidate_project_cache
+from app.core.exceptions import (
+    ProjectNotFoundError,
+    ProjectCreationError,
+    ValidationError
+)
+
+
+async def create_project_membership(
+    project_details: ProjectCreateSchema,
+    user_id: UUID,
+    db: AsyncSession,
+) -> Project:
+    """Create a new project with owner membership (max 20 projects per user)."""
+    user_projects_count = (await db.execute(
+        select(func.count(Project.id))
+        .join(Membership)
+        .where(Membership.user_id == user_id)
+    )).scalar_one()
+
+    if user_projects_count >= 20:
+        logger.warning(
+            "Project creation blocked - max projects reached",
+            extra={"user_id": str(user_id), "projects_count": user_projects_count}
+        )
+
+        raise ValidationError("You have reached the maximum of 20 projects")
+
+    try:
+        new_project = Project(
+            name=project_details.name,
+            owner_id=user_id,
+        )
+        db.add(new_project)
+        await db.flush()
+
+        new_membership = Membership(
+            user_id=user_id,
+            project_id=new_project.id,
+            role=UserRole.OWNER,
+        )
+        db.add(new_membership)
+        await db.commit()
+        new_project = await get_project_by_id(new_project.id, db)
+        await run_in_threadpool(bump_membership_version, user_id)
+        await run_in_threadpool(bump_list_generation, "projects", user_id)
+
+        logger.info(
+            "Project created with owner membership",
+            extra={
+                "project_id": str(new_project.id),
+                "project_name": new_project.name,
+                "owner_id": str(user_id)
+            }
+        )
+
+        return new_project
+
+    except ValidationError:
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error creating project: {str(e)}", exc_info=True)
+        raise ProjectCreationError("Failed to create project") from e
+
+
+async def get_projects(
+    user_id: UUID,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    name_filter: str | None,
+    db: AsyncSession,
+    fields: Fields | None = None
+) -> "PaginatedResponse[Project] | dict":
+    """Paginated, sorted and filtered projects where the user is a member (first pages cached)."""
+    if not pagination.is_first_page:
+        return await _query_projects(user_id, pagination, sort_params, name_filter, db, fields)
+
+    key = await list_key_async(
+        "projects", user_id,
+        pagination=pagination.model_dump(), sort=sort_params.model_dump(), name=name_filter, fields=fields,
+    )
+
+    async def load():
+        return page_payload(
+            await _query_projects(user_id, pagination, sort_params, name_filter, db, fields),
+            select_schema(ProjectResponseSchema, fields),
+        )
+
+    return await read_through_async(key, load, list_scope=("projects", user_id))
+
+
+async def _query_projects(
+    user_id: UUID,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    name_filter: str | None,
+    db: AsyncSession,
+    fields: Fields | None = None
+) -> "PaginatedResponse[Project]":
+    statement = (
+        select(Project)
+        .join(Membership)
+        .where(Membership.user_id == user_id)
+    )
+    if fields is not None:
+        statement = statement.options(load_fields(Project, fields, sort_params.sort_by, "created_at"))
+    if fields is None or "memberships" in fields:
+        statement = statement.options(selectinload(Project.memberships))
+
+    if name_filter:
+        statement = statement.where(Project.name.ilike(f"%{name_filter}%"))
+
+    allowed_sort_fields = ["name", "created_at"]
+    if pagination.use_cursor:
+        return await paginate_cursor_async(db, statement, pagination, sort_params, Project, allowed_sort_fields, "created_at")
+    statement = apply_sorting(statement, sort_params, Project, allowed_sort_fields)
+
+    return await paginate_async(db, statement, pagination, Project)
+
+
+async def get_project_by_id(project_id: UUID, db: AsyncSession) -> Project:
+    """Get project by ID, memberships included (they are part of the response)."""
+    project = (await db.execute(
+        select(Project)
+        .options(selectinload(Project.memberships))
+        .where(Project.id == project_id)
+        .execution_options(populate_existing=True)
+    )).scalar_one_or_none()
+    if not project:
+        raise ProjectNotFoundError(f"Project {project_id} not found")
+    return project
+
+
+async def get_cached_project(project_id: UUID, db: AsyncSession) -> dict:
+    """Serialized project (ProjectResponseSchema), read through the object cache."""
+    async def load():
+        return to_payload(ProjectResponseSchema, await get_project_by_id(project_id, db))
+
+    return await read_through_async(object_key("project", project_id), load)
+
+
+async def update_project(
+    project_id: UUID,
+    project_data: ProjectUpdateSchema,
+    db: AsyncSession
+) -> Project:
+    """Update project name."""
+    project = await get_project_by_id(project_id, db)
+
+    project.name = project_data.name
+    await db.commit()
+    await db.refresh(project, attribute_names=["name"])
+    await run_in_threadpool(invalidate_project_cache, project_id, [membership.user_id for membership in project.memberships])
+
+    logger.info(
+        "Project updated",
+        extra={
+            "project_id": str(project_id),
+            "new_name": project_data.name
+        }
+    )
+
+    return project
+
+
+async def delete_project(project_id: UUID, db: AsyncSession) -> None:
+    """Delete project (hard delete with cascade)."""
+    project = await get_project_by_id(project_id, db)
+    member_ids = [membership.user_id for membership in project.memberships]
+
+    try:
+        # AsyncSession.delete loads the cascaded boards/tasks itself
+        await db.delete(project)
+        await db.commit()
+        await run_in_threadpool(invalidate_project_roles, project_id)
+        await run_in_threadpool(bump_membership_version, *member_ids)
+        await run_in_threadpool(invalidate_project_cache, project_id, member_ids)
+        await run_in_threadpool(bump_list_generation, "boards", project_id)
+        logger.info(
+            "Project deleted",
+            extra={"project_id": str(project_id), "project_name": project.name}
+        )
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error deleting project: {str(e)}", exc_info=True)
+        raise
@@ -0,0 +1,258 @@
+# app/services/async_task_service.py
+"""Async (AsyncSession) version of task_service, used when ASYNC_DB_ENABLED."""
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.models.task import Task, TaskStatus, PriorityLevel
+from app.models.membership import Membership
+from app.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskResponseSchema
+from app.schemas.pagination import PaginationParams, SortParams, PaginatedResponse
+from app.core.pagination import apply_sorting, paginate_async, paginate_cursor_async
+from app.core.logger import logger
+from app.core.sparse_fields import Fields, load_fields, select_schema
+from app.core.columnar import columnar_payload, row_columns
+from app.core.object_cache import (
+    bump_list_generation,
+    list_key_async,
+    object_key,
+    page_payload,
+    read_through_async,
+    to_payload,
+)
+from app.services.task_service import COLUMNAR_DICTIONARY, invalidate_task_cache
+from app.core.exceptions import (
+    TaskNotFoundError,
+    TaskCreationError,
+    InvalidAssigneeError
+)
+
+
+async def _validate_assignee(assignee_id: UUID, project_id: UUID, db: AsyncSession) -> None:
+    """Validate that assignee is a project member."""
+    if assignee_id:
+        assignee_membership = (await db.execute(
+            select(Membership.id).where(
+                Membership.user_id == assignee_id,
+                Membership.project_id == project_id
+            )
+        )).first()
+
+        if not assignee_membership:
+            raise InvalidAssigneeError("Assignee must be a project member")
+
+
+async def create_task(
+    project_id: UUID,
+    board_id: UUID,
+    task_data: TaskCreateSchema,
+    db: AsyncSession
+) -> Task:
+    """Create a new task at the end of the board."""
+    if task_data.assignee_id:
+        await _validate_assignee(task_data.assignee_id, project_id, db)
+
+    try:
+        max_position = (await db.execute(
+            select(func.max(Task.position)).where(Task.board_id == board_id)
+        )).scalar()
+
+        next_position = (max_position + 1) if max_position is not None else 0
+
+        new_task = Task(
+            **task_data.model_dump(exclude={"board_id", "position"}),
+            board_id=board_id,
+            position=next_position
+        )
+        db.add(new_task)
+        await db.commit()
+        await db.refresh(new_task)
+        await run_in_threadpool(bump_list_generation, "tasks", board_id)
+        logger.info(
+            "Task created",
+            extra={
+                "task_id": str(new_task.id),
+                "task_name": new_task.name,
+                "board_id": str(board_id),
+                "project_id": str(project_id),
+                "assignee_id": str(task_data.assignee_id) if task_data.assignee_id else None,
+                "position": next_position
+            }
+        )
+
+        return new_task
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error creating task: {str(e)}", exc_info=True)
+        raise TaskCreationError("Failed to create task") from e
+
+
+async def get_tasks(
+    board_id: UUID,
+    include_archived: bool,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    status_filter: TaskStatus | None,
+    priority_filter: PriorityLevel | None,
+    assignee_filter: UUID | None,
+    db: AsyncSession,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[Task] | dict":
+    """Paginated, sorted and filtered tasks of a board (see task_service.get_tasks)."""
+    async def query_tasks():
+        return await _query_tasks(
+            board_id, include_archived, pagination, sort_params,
+            status_filter, priority_filter, assignee_filter, db, fields, columnar,
+        )
+
+    def serialize(page):
+        if columnar:
+            return columnar_payload(page, fields or tuple(TaskResponseSchema.model_fields), COLUMNAR_DICTIONARY)
+        return page_payload(page, select_schema(TaskResponseSchema, fields))
+
+    if not pagination.is_first_page:
+        page = await query_tasks()
+        return serialize(page) if columnar else page
+
+    key = await list_key_async(
+        "tasks", board_id,
+        pagination=pagination.model_dump(), sort=sort_params.model_dump(), archived=include_archived,
+        status=status_filter, priority=priority_filter, assignee=assignee_filter,
+        fields=fields, columnar=columnar,
+    )
+
+    async def load():
+        return serialize(await query_tasks())
+
+    return await read_through_async(key, load, list_scope=("tasks", board_id))
+
+
+async def _query_tasks(
+    board_id: UUID,
+    include_archived: bool,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    status_filter: TaskStatus | None,
+    priority_filter: PriorityLevel | None,
+    assignee_filter: UUID | None,
+    db: AsyncSession,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[Task]":
+    if columnar:
+        names = fields or tuple(TaskResponseSchema.model_fields)
+        statement = select(*row_columns(Task, names, sort_params.sort_by, "position"))
+    else:
+        statement = select(Task)
+        if fields is not None:
+            statement = statement.options(load_fields(Task, fields, sort_params.sort_by, "position"))
+    statement = statement.where(Task.board_id == board_id)
+
+    if not include_archived:
+        statement = statement.where(Task.archived == False)
+
+    if status_filter:
+        statement = statement.where(Task.status == status_filter)
+
+    if priority_filter:
+        statement = statement.where(Task.priority == priority_filter)
+
+    if assignee_filter:
+        statement = statement.where(Task.assignee_id == assignee_filter)
+
+    allowed_sort_fields = ["name", "position", "created_at", "updated_at", "due_date", "status", "priority"]
+    if pagination.use_cursor:
+        return await paginate_cursor_async(
+            db, statement, pagination, sort_params, Task, allowed_sort_fields, "position", as_rows=columnar,
+        )
+    statement = apply_sorting(statement, sort_params, Task, allowed_sort_fields)
+
+    if not sort_params.sort_by:
+        statement = statement.order_by(Task.position.asc())
+
+    return await paginate_async(db, statement, pagination, Task, as_rows=columnar)
+
+
+async def get_task_by_id(board_id: UUID, task_id: UUID, db: AsyncSession) -> Task:
+    """Get a specific task."""
+    task = (await db.execute(
+        select(Task).where(Task.id == task_id, Task.board_id == board_id)
+    )).scalar_one_or_none()
+
+    if not task:
+        raise TaskNotFoundError(f"Task {task_id} not found in board {board_id}")
+
+    return task
+
+
+async def get_cached_task(board_id: UUID, task_id: UUID, db: AsyncSession) -> dict:
+    """Serialized task, read through the object cache (see task_service.get_cached_task)."""
+    async def load():
+        return to_payload(TaskResponseSchema, await get_task_by_id(board_id, task_id, db))
+
+    task = await read_through_async(object_key("task", task_id), load)
+    if task["board_id"] != str(board_id):
+        raise TaskNotFoundError(f"Task {task_id} not found in board {board_id}")
+    return task
+
+
+async def update_task(
+    project_id: UUID,
+    board_id: UUID,
+    task_id: UUID,
+    task_data: TaskUpdateSchema,
+    db: AsyncSession,
+    task: Task | None = None
+) -> Task:
+    """Update a task. Pass `task` when it was already loaded by the scope dependency."""
+    if task is None:
+        task = await get_task_by_id(board_id, task_id, db)
+
+    if task_data.assignee_id is not None:
+        await _validate_assignee(task_data.assignee_id, project_id, db)
+
+    ALLOWED_FIELDS = {
+        "name", "position", "archived", "status", "priority",
+        "assignee_id", "description", "due_date", "board_id"
+    }
+
+    update_data = task_data.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        if field in ALLOWED_FIELDS:
+            setattr(task, field, value)
+
+    await db.commit()
+    await db.refresh(task)
+    await run_in_threadpool(invalidate_task_cache, task_id, board_id, task.board_id)
+
+    logger.info(
+        "Task updated",
+        extra={
+            "task_id": str(task_id),
+            "board_id": str(board_id),
+            "updated_fields": list(update_data.keys())
+        }
+    )
+
+    return task
+
+
+async def delete_task(board_id: UUID, task_id: UUID, db: AsyncSession, task: Task | None = None) -> None:
+    """Delete a task (hard delete)."""
+    if task is None:
+        task = await get_task_by_id(board_id, task_id, db)
+
+    try:
+        await db.delete(task)
+        await db.commit()
+        await run_in_threadpool(invalidate_task_cache, task_id, board_id)
+        logger.info(
+            "Task deleted",
+            extra={"task_id": str(task_id), "board_id": str(board_id)}
+        )
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error deleting task: {str(e)}", exc_info=True)
+        raise
@@ -1,26 +1,32 @@
 # app/services/auth_service.py
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from uuid import UUID
 from app.models.user import User
 from app.schemas.user_schema import UserRegisterSchema, UserResponseSchema
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, verify_token
+from app.core.security import create_access_token, create_refresh_token, verify_token, token_identifier
+from app.core.principal import get_principal
+from app.core.hashing import hash_password_async, needs_rehash, verify_password_async
+from app.core.login_throttle import login_throttle
+from app.core.token_roles import build_role_claims
 from app.core.logger import logger
 from app.core.redis import get_redis_client
+from app.core.token_filter import publish_revocation
 from app.core.exceptions import (
     UserAlreadyExistsError,
     InvalidCredentialsError,
     InsufficientPermissionsError
 )
 
-def register_user(user_data: UserRegisterSchema, db: Session) -> UserResponseSchema:
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        logger.warning( "User registration attempted with existing email", extra={"email": user_data.email} )
-        raise UserAlreadyExistsError("User already exists")
+def _find_user(email: str, db: Session) -> User | None:
+    return db.query(User).filter(User.email == email).first()
+
+
+def _create_user(user_data: UserRegisterSchema, password_hash: str, db: Session) -> User:
     try:
         new_user = User(
             email=user_data.email,
-            password=hash_password(user_data.password),
+            password=password_hash,
             full_name=user_data.full_name
         )
         
@@ -42,18 +48,44 @@ def register_user(user_data: UserRegisterSchema, db: Session) -> UserResponseSch
         logger.error( "Error registering user", extra={"email": user_data.email}, exc_info=True )
         raise
 
-def authenticate_user(email: str, password: str, db: Session) -> dict:
-    user = db.query(User).filter(User.email == email).first()
-    
-    if not user or not verify_password(password, user.password):
-        logger.warning( "Invalid login attempt", extra={"email": email} )
-        raise InvalidCredentialsError("Invalid email or password")
-    
+
+async def register_user(user_data: UserRegisterSchema, db: Session) -> UserResponseSchema:
+    """
+    Register a user. A coroutine so the argon2 hash is awaited instead of
+    holding a threadpool thread; the DB work still runs in the threadpool.
+    """
+    if await run_in_threadpool(_find_user, user_data.email, db):
+        logger.warning( "User registration attempted with existing email", extra={"email": user_data.email} )
+        raise UserAlreadyExistsError("User already exists")
+    password_hash = await hash_password_async(user_data.password)
+    return await run_in_threadpool(_create_user, user_data, password_hash, db)
+
+
+def _find_login_user(email: str, db: Session, client_ip: str | None) -> User | None:
+    # Refuse throttled emails/IPs before spending any argon2 CPU
+    login_throttle.check(email, client_ip)
+    return _find_user(email, db)
+
+
+def _reject_login(email: str, client_ip: str | None) -> None:
+    logger.warning( "Invalid login attempt", extra={"email": email} )
+    login_throttle.record_failure(email, client_ip)
+    raise InvalidCredentialsError("Invalid email or password")
+
+
+def _accept_login(user: User, email: str) -> None:
     if not user.is_active:
         logger.warning( "Inactive user login attempt", extra={"user_id": str(user.id), "email": user.email} )
         raise InsufficientPermissionsError("User account is inactive")
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+
+    # Only a login that is actually let in clears the email's failures
+    login_throttle.record_success(email)
+
+
+def _issue_tokens(user: User, db: Session) -> dict:
+    claims = {"sub": str(user.id), "ver": user.token_version or 0}
+    access_token = create_access_token(data={**claims, **build_role_claims(user.id, db)})
+    refresh_token = create_refresh_token(data=claims)
     
     logger.info( 
         "User logged in", 
@@ -70,14 +102,62 @@ def authenticate_user(email: str, password: str, db: Session) -> dict:
     }
 
 
-def refresh_access_token(refresh_token: str) -> dict:
+async def authenticate_user(email: str, password: str, db: Session, client_ip: str | None = None) -> dict:
+    """
+    Log a user in. Like register_user, awaits argon2 and runs the DB and
+    Redis steps around it in the threadpool.
+    """
+    user = await run_in_threadpool(_find_login_user, email, db, client_ip)
+    if not user or not await verify_password_async(password, user.password):
+        await run_in_threadpool(_reject_login, email, client_ip)
+    await run_in_threadpool(_accept_login, user, email)
+
+    if needs_rehash(user.password):
+        await _rehash_password(user, password, db)
+
+    return await run_in_threadpool(_issue_tokens, user, db)
+
+
+def _store_password_hash(user: User, password_hash: str, db: Session) -> None:
+    try:
+        user.password = password_hash
+        db.commit()
+        logger.info("Password rehashed with current argon2 parameters", extra={"user_id": str(user.id)})
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Password rehash failed: {str(e)}", extra={"user_id": str(user.id)})
+
+
+async def _rehash_password(user: User, password: str, db: Session) -> None:
+    """
+    Re-hash a password stored with stale argon2 parameters.
+
+    Runs right after a successful login, the only time the plain password is
+    available. A failure here must never fail the login itself.
+    """
+    try:
+        password_hash = await hash_password_async(password)
+    except Exception as e:
+        logger.warning(f"Password rehash failed: {str(e)}", extra={"user_id": str(user.id)})
+        return
+    await run_in_threadpool(_store_password_hash, user, password_hash, db)
+
+
+def refresh_access_token(refresh_token: str, db: Session) -> dict:
     payload = verify_token(refresh_token, expected_type="refresh")
     if not payload:
         logger.warning("Invalid refresh token used")
         raise InvalidCredentialsError("Invalid or expired refresh token")
     
     user_id = payload.get("sub")
-    new_access_token = create_access_token(data={"sub": user_id})
+    principal = get_principal(UUID(user_id), db)
+    if not principal or not principal.is_active or payload.get("ver", 0) != principal.token_version:
+        logger.warning("Revoked refresh token used", extra={"user_id": str(user_id)})
+        raise InvalidCredentialsError("Invalid or expired refresh token")
+
+    new_access_token = create_access_token(
+        data={"sub": user_id, "ver": principal.token_version, **build_role_claims(principal.id, db)}
+    )
     logger.info( "Access token refreshed", extra={"user_id": str(user_id)} )
     return {
         "access_token": new_access_token,
@@ -111,8 +191,10 @@ def logout(token: str) -> None:
         
         if ttl > 0:
             # Add token to blacklist with TTL equal to token expiration
-            blacklist_key = f"token_blacklist:{token[:20]}"
+            identifier = token_identifier(token, payload)
+            blacklist_key = f"token_blacklist:{identifier}"
             redis_client.setex(blacklist_key, ttl, user_id)
+            publish_revocation(identifier, exp)
             logger.info(
                 "User logged out - token blacklisted",
                 extra={"user_id": user_id, "ttl": ttl}
@@ -120,4 +202,28 @@ def logout(token: str) -> None:
         else:
             logger.info("Token already expired", extra={"user_id": user_id})
     else:
-        logger.warning("Redis unavailable - logout without blacklist", extra={"user_id": user_id})
\ No newline at end of file
+        logger.warning("Redis unavailable - logout without blacklist", extra={"user_id": user_id})
+
+
+def logout_all(user_id: UUID, db: Session) -> None:
+    """
+    Revoke every access and refresh token issued to a user.
+
+    Bumps the user's token_version; tokens carrying an older `ver` claim are
+    rejected from then on. No per-token state is stored.
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise InvalidCredentialsError("Invalid or expired token")
+
+    try:
+        user.token_version = (user.token_version or 0) + 1
+        db.commit()
+        logger.info(
+            "User logged out everywhere",
+            extra={"user_id": str(user_id), "token_version": user.token_version}
+        )
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error revoking user tokens: {str(e)}", exc_info=True)
+        raise
@@ -3,12 +3,27 @@ from sqlalchemy.orm import Session
 from app.models.board import Board
 from app.schemas.board_schema import BoardCreateSchema, BoardUpdateSchema, BoardResponseSchema
 from app.core.logger import logger
+from app.core.sparse_fields import Fields, load_fields, select_schema
+from app.core.columnar import columnar_payload, row_columns
 from app.core.exceptions import (
     BoardNotFoundError,
     BoardCreationError,
 )
 from app.schemas.pagination import PaginatedResponse, PaginationParams, SortParams
-from app.core.pagination import apply_sorting, paginate
+from app.core.pagination import apply_sorting, paginate, paginate_cursor
+from app.core.object_cache import (
+    bump_list_generation,
+    fill_ttl,
+    invalidate_objects,
+    list_key,
+    object_key,
+    page_payload,
+    read_through,
+    to_payload,
+)
+
+# Dictionary-encoded columns of format=columnar pages
+COLUMNAR_DICTIONARY = ("project_id",)
 
 def create_board(
     project_id: UUID,
@@ -33,6 +48,7 @@ def create_board(
         db.add(new_board)
         db.commit()
         db.refresh(new_board)
+        bump_list_generation("boards", project_id)
         
         logger.info(
             f"Board created",
@@ -57,8 +73,10 @@ def get_boards(
     pagination: "PaginationParams",
     sort_params: "SortParams",
     name_filter: str | None,
-    db: Session
-) -> "PaginatedResponse[BoardResponseSchema]":
+    db: Session,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[BoardResponseSchema] | dict":
     """
     Get paginated, sorted, and filtered boards for a project.
     
@@ -67,9 +85,51 @@ def get_boards(
     - name_filter: Search by board name (case-insensitive)
     
     Sortable fields: name, position, created_at, updated_at
+
+    `fields` (see sparse_fields) loads and returns only those columns.
+    `columnar` pages (see columnar) are always returned serialized.
+    First pages are served from the object cache as serialized payloads.
     """
-    
-    query = db.query(Board).filter(Board.project_id == project_id)
+    def query_boards():
+        return _query_boards(project_id, include_archived, pagination, sort_params, name_filter, db, fields, columnar)
+
+    def serialize(page):
+        if columnar:
+            return columnar_payload(page, fields or tuple(BoardResponseSchema.model_fields), COLUMNAR_DICTIONARY)
+        return page_payload(page, select_schema(BoardResponseSchema, fields))
+
+    if not pagination.is_first_page:
+        page = query_boards()
+        return serialize(page) if columnar else page
+
+    key = list_key(
+        "boards", project_id,
+        pagination=pagination.model_dump(), sort=sort_params.model_dump(),
+        archived=include_archived, name=name_filter, fields=fields, columnar=columnar,
+    )
+    return read_through(key, lambda: serialize(query_boards()), list_scope=("boards", project_id), ttl=fill_ttl(db))
+
+
+def _query_boards(
+    project_id: UUID,
+    include_archived: bool,
+    pagination: "PaginationParams",
+    sort_params: "SortParams",
+    name_filter: str | None,
+    db: Session,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[BoardResponseSchema]":
+    # Sort columns are loaded too: cursors are built from the last row
+    if columnar:
+        # Plain rows, no ORM instances
+        names = fields or tuple(BoardResponseSchema.model_fields)
+        query = db.query(*row_columns(Board, names, sort_params.sort_by, "position"))
+    else:
+        query = db.query(Board)
+        if fields is not None:
+            query = query.options(load_fields(Board, fields, sort_params.sort_by, "position"))
+    query = query.filter(Board.project_id == project_id)
     
     # Filter archived
     if not include_archived:
@@ -81,6 +141,9 @@ def get_boards(
     
     # Apply sorting
     allowed_sort_fields = ["name", "position", "created_at", "updated_at"]
+    # Cursor mode sorts (and seeks) by itself
+    if pagination.use_cursor:
+        return paginate_cursor(query, pagination, sort_params, Board, allowed_sort_fields, "position")
     query = apply_sorting(query, sort_params, Board, allowed_sort_fields)
     
     # If no sorting specified, default to position
@@ -88,7 +151,7 @@ def get_boards(
         query = query.order_by(Board.position.asc())
     
     # Apply pagination
-    return paginate(query, pagination, Board)
+    return paginate(query, pagination, Board, as_rows=columnar)
 
 
 def get_board_by_id(project_id: UUID, board_id: UUID, db: Session) -> Board:
@@ -104,14 +167,34 @@ def get_board_by_id(project_id: UUID, board_id: UUID, db: Session) -> Board:
     return board
 
 
+def get_cached_board(project_id: UUID, board_id: UUID, db: Session) -> dict:
+    """Serialized board (BoardResponseSchema), read through the object cache."""
+    board = read_through(
+        object_key("board", board_id),
+        lambda: to_payload(BoardResponseSchema, get_board_by_id(project_id, board_id, db)),
+        ttl=fill_ttl(db),
+    )
+    # Keyed by board only: a hit still has to belong to the requested project
+    if board["project_id"] != str(project_id):
+        raise BoardNotFoundError(f"Board {board_id} not found in project {project_id}")
+    return board
+
+
+def invalidate_board_cache(project_id: UUID, board_id: UUID) -> None:
+    invalidate_objects(object_key("board", board_id))
+    bump_list_generation("boards", project_id)
+
+
 def update_board(
     project_id: UUID,
     board_id: UUID,
     board_data: BoardUpdateSchema,
-    db: Session
+    db: Session,
+    board: Board | None = None
 ) -> Board:
-    """Update a board."""
-    board = get_board_by_id(project_id, board_id, db)
+    """Update a board. Pass `board` when it was already loaded by the scope dependency."""
+    if board is None:
+        board = get_board_by_id(project_id, board_id, db)
     old_name = board.name
     
     # Update only provided fields
@@ -124,6 +207,7 @@ def update_board(
     
     db.commit()
     db.refresh(board)
+    invalidate_board_cache(project_id, board_id)
 
     logger.info(
         f"Board updated",
@@ -139,13 +223,16 @@ def update_board(
     return board
 
 
-def delete_board(project_id: UUID, board_id: UUID, db: Session) -> None:
+def delete_board(project_id: UUID, board_id: UUID, db: Session, board: Board | None = None) -> None:
     """Delete a board (hard delete)."""
-    board = get_board_by_id(project_id, board_id, db)
+    if board is None:
+        board = get_board_by_id(project_id, board_id, db)
     board_name = board.name
     try:
         db.delete(board)
         db.commit()
+        invalidate_board_cache(project_id, board_id)
+        bump_list_generation("tasks", board_id)
 
         logger.info(
             f"Board deleted",
@@ -3,6 +3,10 @@ from sqlalchemy.orm import Session
 from app.models.membership import Membership, UserRole
 from app.schemas.membership_schema import MemberResponseSchema
 from app.core.logger import logger
+from app.core.membership_cache import invalidate_member_role
+from app.core.token_roles import bump_membership_version
+from app.db.routing import mark_sticky
+from app.services.projects_service import invalidate_project_cache
 from app.core.exceptions import (
     MemberAlreadyExistsError,
     LastOwnerError,
@@ -10,6 +14,11 @@ from app.core.exceptions import (
     ValidationError
 )
 
+def _invalidate_cached_project(project_id: UUID, user_id: UUID, db: Session) -> None:
+    """The project payload embeds memberships: drop it for every member, including `user_id`."""
+    member_ids = [row.user_id for row in db.query(Membership.user_id).filter_by(project_id=project_id)]
+    invalidate_project_cache(project_id, [*member_ids, user_id])
+
 def add_member(project_id: UUID, user_id: UUID, role: UserRole, invited_by: UUID, db: Session) -> MemberResponseSchema:
     existing = db.query(Membership).filter_by(user_id=user_id, project_id=project_id).first()
     if existing:
@@ -25,6 +34,10 @@ def add_member(project_id: UUID, user_id: UUID, role: UserRole, invited_by: UUID
         db.add(new_member)
         db.commit()
         db.refresh(new_member)
+        invalidate_member_role(user_id, project_id)
+        bump_membership_version(user_id)
+        mark_sticky(user_id)
+        _invalidate_cached_project(project_id, user_id, db)
         logger.info(
             "Member added to project",
             extra={
@@ -60,6 +73,10 @@ def remove_member(project_id: UUID, user_id: UUID, db: Session) -> None:
     try:
         db.delete(member)
         db.commit()
+        invalidate_member_role(user_id, project_id)
+        bump_membership_version(user_id)
+        mark_sticky(user_id)
+        _invalidate_cached_project(project_id, user_id, db)
         logger.info(
             "Member removed from project",
             extra={
@@ -97,6 +114,10 @@ def change_member_role(project_id: UUID, user_id: UUID, new_role: UserRole, db:
         member.role = new_role
         db.commit()
         db.refresh(member)
+        invalidate_member_role(user_id, project_id)
+        bump_membership_version(user_id)
+        mark_sticky(user_id)
+        _invalidate_cached_project(project_id, user_id, db)
         
         logger.info(
             "Member role changed",
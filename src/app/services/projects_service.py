@@ -5,8 +5,21 @@ from app.models.project import Project
 from app.models.membership import Membership, UserRole
 from app.schemas.project_schema import ProjectCreateSchema, ProjectUpdateSchema, ProjectResponseSchema
 from app.schemas.pagination import PaginatedResponse, PaginationParams, SortParams
-from app.core.pagination import apply_sorting, paginate
+from app.core.pagination import apply_sorting, paginate, paginate_cursor
 from app.core.logger import logger
+from app.core.sparse_fields import Fields, load_fields, select_schema
+from app.core.membership_cache import invalidate_project_roles
+from app.core.token_roles import bump_membership_version
+from app.core.object_cache import (
+    bump_list_generation,
+    fill_ttl,
+    invalidate_objects,
+    list_key,
+    object_key,
+    page_payload,
+    read_through,
+    to_payload,
+)
 from sqlalchemy.orm import selectinload
 from app.core.exceptions import (
     ProjectNotFoundError,
@@ -58,6 +71,8 @@ def create_project_membership(
         db.add(new_membership)
         db.commit()
         db.refresh(new_project)
+        bump_membership_version(user_id)
+        bump_list_generation("projects", user_id)
         
         logger.info(
             "Project created with owner membership",
@@ -83,8 +98,9 @@ def get_projects(
     pagination: "PaginationParams",
     sort_params: "SortParams",
     name_filter: str | None,
-    db: Session
-) -> "PaginatedResponse[Project]":
+    db: Session,
+    fields: Fields | None = None
+) -> "PaginatedResponse[Project] | dict":
     """
     Get paginated, sorted, and filtered projects where user is a member.
     
@@ -92,14 +108,48 @@ def get_projects(
     - name_filter: Search by project name (case-insensitive)
     
     Sortable fields: name, created_at
+
+    `fields` (see sparse_fields) loads and returns only those columns, and
+    the memberships only when asked for.
+    First pages are served from the object cache as serialized payloads.
     """
-    #avoid N+1 by eager loading memberships and filtering in Python
+    if not pagination.is_first_page:
+        return _query_projects(user_id, pagination, sort_params, name_filter, db, fields)
+
+    key = list_key(
+        "projects", user_id,
+        pagination=pagination.model_dump(), sort=sort_params.model_dump(), name=name_filter, fields=fields,
+    )
+    return read_through(
+        key,
+        lambda: page_payload(
+            _query_projects(user_id, pagination, sort_params, name_filter, db, fields),
+            select_schema(ProjectResponseSchema, fields),
+        ),
+        list_scope=("projects", user_id),
+        ttl=fill_ttl(db),
+    )
+
+
+def _query_projects(
+    user_id: UUID,
+    pagination: "PaginationParams",
+    sort_params: "SortParams",
+    name_filter: str | None,
+    db: Session,
+    fields: Fields | None = None
+) -> "PaginatedResponse[Project]":
     query = (
         db.query(Project)
-        .options(selectinload(Project.memberships))  
         .join(Membership)
         .filter(Membership.user_id == user_id)
     )
+    if fields is not None:
+        # Sort columns too: cursors are built from the last row
+        query = query.options(load_fields(Project, fields, sort_params.sort_by, "created_at"))
+    if fields is None or "memberships" in fields:
+        #avoid N+1 by eager loading memberships and filtering in Python
+        query = query.options(selectinload(Project.memberships))
     
     # Apply filters
     if name_filter:
@@ -107,6 +157,9 @@ def get_projects(
     
     # Apply sorting
     allowed_sort_fields = ["name", "created_at"]
+    # Cursor mode sorts (and seeks) by itself
+    if pagination.use_cursor:
+        return paginate_cursor(query, pagination, sort_params, Project, allowed_sort_fields, "created_at")
     query = apply_sorting(query, sort_params, Project, allowed_sort_fields)
     
     # Apply pagination
@@ -121,6 +174,21 @@ def get_project_by_id(project_id: UUID, db: Session) -> Project:
     return project
 
 
+def get_cached_project(project_id: UUID, db: Session) -> dict:
+    """Serialized project (ProjectResponseSchema), read through the object cache."""
+    return read_through(
+        object_key("project", project_id),
+        lambda: to_payload(ProjectResponseSchema, get_project_by_id(project_id, db)),
+        ttl=fill_ttl(db),
+    )
+
+
+def invalidate_project_cache(project_id: UUID, member_ids: list[UUID]) -> None:
+    """Drop the cached project and the project lists of its members (memberships are embedded)."""
+    invalidate_objects(object_key("project", project_id))
+    bump_list_generation("projects", *member_ids)
+
+
 def update_project(
     project_id: UUID,
     project_data: ProjectUpdateSchema,
@@ -132,6 +200,7 @@ def update_project(
     project.name = project_data.name
     db.commit()
     db.refresh(project)
+    invalidate_project_cache(project_id, [membership.user_id for membership in project.memberships])
     
     logger.info(
         "Project updated",
@@ -147,10 +216,15 @@ def update_project(
 def delete_project(project_id: UUID, db: Session) -> None:
     """Delete project (hard delete with cascade)."""
     project = get_project_by_id(project_id, db)
+    member_ids = [membership.user_id for membership in project.memberships]
     
     try:
         db.delete(project)
         db.commit()
+        invalidate_project_roles(project_id)
+        bump_membership_version(*member_ids)
+        invalidate_project_cache(project_id, member_ids)
+        bump_list_generation("boards", project_id)
         logger.info(
             "Project deleted",
             extra={"project_id": str(project_id), "project_name": project.name}
@@ -3,17 +3,32 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 from app.models.task import Task
 from app.models.membership import Membership
-from app.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema
+from app.schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskResponseSchema
 from app.schemas.pagination import PaginationParams, SortParams, PaginatedResponse
-from app.core.pagination import apply_sorting, paginate
+from app.core.pagination import apply_sorting, paginate, paginate_cursor
+from app.core.object_cache import (
+    bump_list_generation,
+    fill_ttl,
+    invalidate_objects,
+    list_key,
+    object_key,
+    page_payload,
+    read_through,
+    to_payload,
+)
 from app.models.task import TaskStatus, PriorityLevel
 from app.core.logger import logger
+from app.core.sparse_fields import Fields, load_fields, select_schema
+from app.core.columnar import columnar_payload, row_columns
 from app.core.exceptions import (
     TaskNotFoundError,
     TaskCreationError,
     InvalidAssigneeError
 )
 
+# Dictionary-encoded columns of format=columnar pages
+COLUMNAR_DICTIONARY = ("status", "priority", "board_id", "assignee_id")
+
 
 def _validate_assignee(assignee_id: UUID, project_id: UUID, db: Session) -> None:
     """Validate that assignee is a project member."""
@@ -54,6 +69,7 @@ def create_task(
         db.add(new_task)
         db.commit()
         db.refresh(new_task)
+        bump_list_generation("tasks", board_id)
         logger.info(
             "Task created",
             extra={
@@ -84,8 +100,10 @@ def get_tasks(
     status_filter: "TaskStatus | None",
     priority_filter: "PriorityLevel | None",
     assignee_filter: UUID | None,
-    db: Session
-) -> "PaginatedResponse[Task]":
+    db: Session,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[Task] | dict":
     """
     Get paginated, sorted, and filtered tasks for a board.
     
@@ -96,9 +114,57 @@ def get_tasks(
     - assignee_filter: Filter by assignee user ID
     
     Sortable fields: name, position, created_at, updated_at, due_date, status, priority
+
+    `fields` (see sparse_fields) loads and returns only those columns.
+    `columnar` pages (see columnar) are always returned serialized.
+    First pages are served from the object cache as serialized payloads.
     """
-    
-    query = db.query(Task).filter(Task.board_id == board_id)
+    def query_tasks():
+        return _query_tasks(
+            board_id, include_archived, pagination, sort_params,
+            status_filter, priority_filter, assignee_filter, db, fields, columnar,
+        )
+
+    def serialize(page):
+        if columnar:
+            return columnar_payload(page, fields or tuple(TaskResponseSchema.model_fields), COLUMNAR_DICTIONARY)
+        return page_payload(page, select_schema(TaskResponseSchema, fields))
+
+    if not pagination.is_first_page:
+        page = query_tasks()
+        return serialize(page) if columnar else page
+
+    key = list_key(
+        "tasks", board_id,
+        pagination=pagination.model_dump(), sort=sort_params.model_dump(), archived=include_archived,
+        status=status_filter, priority=priority_filter, assignee=assignee_filter,
+        fields=fields, columnar=columnar,
+    )
+    return read_through(key, lambda: serialize(query_tasks()), list_scope=("tasks", board_id), ttl=fill_ttl(db))
+
+
+def _query_tasks(
+    board_id: UUID,
+    include_archived: bool,
+    pagination: "PaginationParams",
+    sort_params: "SortParams",
+    status_filter: "TaskStatus | None",
+    priority_filter: "PriorityLevel | None",
+    assignee_filter: UUID | None,
+    db: Session,
+    fields: Fields | None = None,
+    columnar: bool = False
+) -> "PaginatedResponse[Task]":
+    # Sort columns are loaded too: cursors are built from the last row
+    if columnar:
+        # Plain rows, no ORM instances
+        names = fields or tuple(TaskResponseSchema.model_fields)
+        query = db.query(*row_columns(Task, names, sort_params.sort_by, "position"))
+    else:
+        query = db.query(Task)
+        if fields is not None:
+            query = query.options(load_fields(Task, fields, sort_params.sort_by, "position"))
+    query = query.filter(Task.board_id == board_id)
     
     # Filter archived
     if not include_archived:
@@ -118,6 +184,9 @@ def get_tasks(
     
     # Apply sorting
     allowed_sort_fields = ["name", "position", "created_at", "updated_at", "due_date", "status", "priority"]
+    # Cursor mode sorts (and seeks) by itself
+    if pagination.use_cursor:
+        return paginate_cursor(query, pagination, sort_params, Task, allowed_sort_fields, "position")
     query = apply_sorting(query, sort_params, Task, allowed_sort_fields)
     
     # If no sorting specified, default to position
@@ -125,7 +194,7 @@ def get_tasks(
         query = query.order_by(Task.position.asc())
     
     # Apply pagination
-    return paginate(query, pagination, Task)
+    return paginate(query, pagination, Task, as_rows=columnar)
 
 
 def get_task_by_id(board_id: UUID, task_id: UUID, db: Session) -> Task:
@@ -141,15 +210,35 @@ def get_task_by_id(board_id: UUID, task_id: UUID, db: Session) -> Task:
     return task
 
 
+def get_cached_task(board_id: UUID, task_id: UUID, db: Session) -> dict:
+    """Serialized task (TaskResponseSchema), read through the object cache."""
+    task = read_through(
+        object_key("task", task_id),
+        lambda: to_payload(TaskResponseSchema, get_task_by_id(board_id, task_id, db)),
+        ttl=fill_ttl(db),
+    )
+    # Keyed by task only: a hit still has to belong to the requested board
+    if task["board_id"] != str(board_id):
+        raise TaskNotFoundError(f"Task {task_id} not found in board {board_id}")
+    return task
+
+
+def invalidate_task_cache(task_id: UUID, *board_ids: UUID) -> None:
+    invalidate_objects(object_key("task", task_id))
+    bump_list_generation("tasks", *set(board_ids))
+
+
 def update_task(
     project_id: UUID,
     board_id: UUID,
     task_id: UUID,
     task_data: TaskUpdateSchema,
-    db: Session
+    db: Session,
+    task: Task | None = None
 ) -> Task:
-    """Update a task."""
-    task = get_task_by_id(board_id, task_id, db)
+    """Update a task. Pass `task` when it was already loaded by the scope dependency."""
+    if task is None:
+        task = get_task_by_id(board_id, task_id, db)
     
     # Validate assignee if being changed
     if task_data.assignee_id is not None:
@@ -176,6 +265,8 @@ def update_task(
     
     db.commit()
     db.refresh(task)
+    # A moved task leaves the old board's lists too
+    invalidate_task_cache(task_id, board_id, task.board_id)
     
     logger.info(
         "Task updated",
@@ -189,13 +280,15 @@ def update_task(
     return task
 
 
-def delete_task(board_id: UUID, task_id: UUID, db: Session) -> None:
+def delete_task(board_id: UUID, task_id: UUID, db: Session, task: Task | None = None) -> None:
     """Delete a task (hard delete)."""
-    task = get_task_by_id(board_id, task_id, db)
+    if task is None:
+        task = get_task_by_id(board_id, task_id, db)
     
     try:
         db.delete(task)
         db.commit()
+        invalidate_task_cache(task_id, board_id)
         logger.info(
             "Task deleted",
             extra={"task_id": str(task_id), "board_id": str(board_id)}
@@ -1,15 +1,29 @@
 # tests/conftest.py
 import pytest
 from fastapi.testclient import TestClient
+from fastapi import FastAPI
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.db.session import Base
+from sqlalchemy.pool import NullPool
+from app.db.session import Base, async_database_url
 from app.app import app
-from app.core.dependencies import get_db
+from app.api import auth, projects, async_projects, async_boards, async_tasks
+from app.core.dependencies import get_db, get_read_db, get_async_db
+from app.core.exceptions_handlers import setup_exception_handlers
+from app.core.msgpack_negotiation import MsgpackMiddleware
 from app.models.user import User
 from app.core.security import hash_password
 import uuid
 from app.core.rate_limit import limiter
+from app.core.security import token_cache
+from app.core.principal import principal_cache
+from app.core.token_filter import revoked_token_filter
+from app.core.login_throttle import login_throttle
+from app.db.routing import reset_stickiness
+from app.core.pagination import reset_count_cache
+from app.core.object_cache import reset_object_cache_stats
+from app.core.membership_cache import role_cache
 
 # Test database URL
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -43,11 +57,41 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def async_client(db_session):
+    """Client for an app wired like ASYNC_DB_ENABLED=True (aiosqlite on the same test DB)"""
+    # NullPool: TestClient runs each app on its own event loop
+    async_engine = create_async_engine(async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+    AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
+    def override_get_db():
+        yield db_session
+
+    async_app = FastAPI()
+    setup_exception_handlers(async_app)
+    async_app.add_middleware(MsgpackMiddleware)
+    async_app.include_router(auth.router, prefix="/auth")
+    async_app.include_router(async_projects.router, prefix="/projects")
+    async_app.include_router(projects.members_router, prefix="/projects")
+    async_app.include_router(async_boards.router, prefix="/projects/{project_id}/boards")
+    async_app.include_router(async_tasks.router, prefix="/projects/{project_id}/boards/{board_id}/tasks")
+    async_app.dependency_overrides[get_db] = override_get_db
+    async_app.dependency_overrides[get_read_db] = override_get_db
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
 def test_user(db_session):
     """Create a test user"""
@@ -130,4 +174,25 @@ def test_board(client, auth_headers, test_project):
 def disable_rate_limit():
     limiter.enabled = False
     yield
-    limiter.enabled = True  
+    limiter.enabled = True
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    token_cache.clear()
+    principal_cache.clear()
+    revoked_token_filter.reset()
+    login_throttle.reset()
+    reset_stickiness()
+    reset_count_cache()
+    reset_object_cache_stats()
+    role_cache.clear()
+    yield
+    token_cache.clear()
+    principal_cache.clear()
+    revoked_token_filter.reset()
+    login_throttle.reset()
+    reset_stickiness()
+    reset_count_cache()
+    reset_object_cache_stats()
+    role_cache.clear()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark response rendering of the read endpoints: FastAPI's response_model
+path (validate with from_attributes, then dump_json) vs. app.core.fast_json.
+
+Each endpoint is rendered from the two inputs a route can return: ORM objects
+(a DB read) and the serialized payload of the object cache. Both paths must
+produce the same bytes; the script stops at the first difference. Nothing
+touches the database, the objects are built in memory:
+
+    python src/app/tests/load/bench_fast_json.py
+    python src/app/tests/load/bench_fast_json.py --page-size 100 --runs 500
+
+The encoder column is orjson when installed (pip install ".[fast-json]"),
+pydantic-core otherwise; --no-orjson forces the fallback.
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from pydantic import TypeAdapter
+
+from app.core import fast_json
+from app.core.object_cache import page_payload, to_payload
+from app.models.board import Board
+from app.models.membership import Membership, UserRole
+from app.models.project import Project
+from app.models.task import PriorityLevel, Task, TaskStatus
+from app.schemas.board_schema import BoardResponseSchema
+from app.schemas.pagination import CursorPaginatedResponse, PaginatedResponse
+from app.schemas.project_schema import ProjectResponseSchema
+from app.schemas.task_schema import TaskResponseSchema
+
+
+def make_project(members: int) -> Project:
+    project_id, owner_id, now = uuid.uuid4(), uuid.uuid4(), datetime.now()
+    memberships = [
+        Membership(
+            id=i, user_id=owner_id if i == 0 else uuid.uuid4(), project_id=project_id,
+            role=UserRole.OWNER if i == 0 else UserRole.EDITOR,
+            joined_at=now, invited_by=None if i == 0 else owner_id,
+        )
+        for i in range(members)
+    ]
+    return Project(id=project_id, name="Bench project", owner_id=owner_id, created_at=now, memberships=memberships)
+
+
+def make_board(i: int) -> Board:
+    now = datetime.now()
+    return Board(
+        id=uuid.uuid4(), name=f"Board {i}", project_id=uuid.uuid4(),
+        created_at=now, updated_at=now, position=i, archived=False,
+    )
+
+
+def make_task(i: int) -> Task:
+    now = datetime.now()
+    return Task(
+        id=uuid.uuid4(), name=f"Task {i}", description="Lorem ipsum dolor sit amet " * 3,
+        assignee_id=uuid.uuid4() if i % 2 else None, due_date=now + timedelta(days=i),
+        board_id=uuid.uuid4(), status=TaskStatus.ACTIVE, priority=list(PriorityLevel)[i % 3],
+        position=i, archived=False, created_at=now, updated_at=now,
+    )
+
+
+def page(items: list) -> PaginatedResponse:
+    return PaginatedResponse.create(items=items, total=len(items) * 10, page=1, page_size=len(items))
+
+
+def fastapi_render(adapter: TypeAdapter, content) -> bytes:
+    # What fastapi.routing.serialize_response does with a response_model
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def timed(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="response_model rendering vs fast_json")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--members", type=int, default=10, help="Memberships embedded in each project")
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--no-orjson", action="store_true")
+    args = parser.parse_args()
+    if args.no_orjson:
+        fast_json.orjson = None
+
+    n = args.page_size
+    project_page = PaginatedResponse[ProjectResponseSchema] | CursorPaginatedResponse[ProjectResponseSchema]
+    board_page = PaginatedResponse[BoardResponseSchema] | CursorPaginatedResponse[BoardResponseSchema]
+    task_page = PaginatedResponse[TaskResponseSchema] | CursorPaginatedResponse[TaskResponseSchema]
+    # endpoint, response_model, ORM content, cached payload
+    endpoints = [
+        ("GET /projects/{id}", ProjectResponseSchema, project := make_project(args.members), to_payload(ProjectResponseSchema, project)),
+        ("GET /projects", project_page, projects := page([make_project(args.members) for _ in range(n)]), page_payload(projects, ProjectResponseSchema)),
+        ("GET /boards/{id}", BoardResponseSchema, board := make_board(0), to_payload(BoardResponseSchema, board)),
+        ("GET /boards", board_page, boards := page([make_board(i) for i in range(n)]), page_payload(boards, BoardResponseSchema)),
+        ("GET /tasks/{id}", TaskResponseSchema, task := make_task(0), to_payload(TaskResponseSchema, task)),
+        ("GET /tasks", task_page, tasks := page([make_task(i) for i in range(n)]), page_payload(tasks, TaskResponseSchema)),
+    ]
+
+    encoder = "orjson" if fast_json.orjson is not None else "pydantic-core"
+    print(f"\nLists of {n} items, {args.runs} runs per case, median µs (cached payloads encoded with {encoder})")
+    print(f"{'endpoint':<20} {'input':<8} {'response_model':>15} {'fast_json':>10} {'speedup':>8} {'bytes':>8}")
+    for name, model, orm, payload in endpoints:
+        adapter = TypeAdapter(model)
+        for source, content in (("orm", orm), ("cached", payload)):
+            expected = fastapi_render(adapter, content)
+            rendered = fast_json.render(model, content)
+            if rendered != expected:
+                raise SystemExit(f"{name} ({source}): fast_json output differs from response_model output")
+            baseline = timed(lambda: fastapi_render(adapter, content), args.runs)
+            fast = timed(lambda: fast_json.render(model, content), args.runs)
+            print(f"{name:<20} {source:<8} {baseline:>15.1f} {fast:>10.1f} {baseline / fast:>7.1f}x {len(rendered):>8}")
+    print("\nOutput identical for every endpoint and input.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark MessagePack against JSON for task list pages (GET /tasks).
+
+For each page size the cached payload of a page (what the object cache and
+fast_json hand to the encoder) is encoded and decoded both ways, plus the
+columnar form of the same page (format=columnar). Also timed: the
+middleware's re-encoding of a JSON response (decode + pack) against packing
+the payload directly, as fast_json does. Nothing touches the database:
+
+    python src/app/tests/load/bench_msgpack.py
+    python src/app/tests/load/bench_msgpack.py --page-sizes 20 100 1000 --runs 500
+
+JSON uses orjson when installed (pip install ".[fast-json]"), pydantic-core
+and the json module otherwise; --no-orjson forces the fallback.
+"""
+import argparse
+import gzip
+import json
+
+import msgpack
+
+from bench_fast_json import make_task, page, timed
+from app.core import fast_json
+from app.core.columnar import columnar_payload
+from app.core.object_cache import page_payload
+from app.schemas.task_schema import TaskResponseSchema
+from app.services.task_service import COLUMNAR_DICTIONARY
+
+
+def columnar_page(tasks: list) -> dict:
+    """The columnar payload of a page of tasks (rows in schema field order)."""
+    names = tuple(TaskResponseSchema.model_fields)
+    rows = page([tuple(getattr(task, name) for name in names) for task in tasks])
+    return columnar_payload(rows, names, COLUMNAR_DICTIONARY)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MessagePack vs JSON for task pages")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100, 500])
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--no-orjson", action="store_true")
+    args = parser.parse_args()
+    if args.no_orjson:
+        fast_json.orjson = None
+    loads = fast_json.orjson.loads if fast_json.orjson is not None else json.loads
+    encoder = "orjson" if fast_json.orjson is not None else "pydantic-core/json"
+
+    print(f"\n{args.runs} runs per case, median µs (JSON via {encoder})")
+    print(
+        f"{'page':<14} {'format':<8} {'encode':>8} {'decode':>8} {'bytes':>8} {'gzip':>7}"
+        f" {'size':>6} {'encode':>7} {'decode':>7}"
+    )
+    for n in args.page_sizes:
+        tasks = [make_task(i) for i in range(n)]
+        for shape, payload in (("items", page_payload(page(tasks), TaskResponseSchema)), ("columnar", columnar_page(tasks))):
+            plain, packed = fast_json.dumps(payload), msgpack.packb(payload)
+            if msgpack.unpackb(packed) != loads(plain):
+                raise SystemExit(f"{n} tasks ({shape}): msgpack and JSON decode to different data")
+            results = {}
+            for name, encode, decode, body in (
+                ("json", lambda: fast_json.dumps(payload), lambda: loads(plain), plain),
+                ("msgpack", lambda: msgpack.packb(payload), lambda: msgpack.unpackb(packed), packed),
+            ):
+                results[name] = (timed(encode, args.runs), timed(decode, args.runs), len(body), len(gzip.compress(body)))
+            for name, (encode, decode, size, zipped) in results.items():
+                json_encode, json_decode, json_size, _ = results["json"]
+                print(
+                    f"{f'{n} {shape}':<14} {name:<8} {encode:>8.1f} {decode:>8.1f} {size:>8} {zipped:>7}"
+                    f" {size / json_size:>5.0%} {json_encode / encode:>6.1f}x {json_decode / decode:>6.1f}x"
+                )
+
+        payload = page_payload(page(tasks), TaskResponseSchema)
+        plain = fast_json.dumps(payload)
+        direct = timed(lambda: msgpack.packb(payload), args.runs)
+        reencoded = timed(lambda: msgpack.packb(loads(plain)), args.runs)
+        print(f"{f'{n} items':<14} re-encoding a JSON response: {reencoded:.1f} µs, packing directly: {direct:.1f} µs")
+    print("\nsize/encode/decode columns are relative to JSON of the same page.")
+
+
+if __name__ == "__main__":
+    main()
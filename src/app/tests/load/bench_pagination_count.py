@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark exact totals on a big board: COUNT(*) + page SELECT (two
+statements, the old paginate()) vs. the page with count(*) OVER () (one
+statement, the current paginate()).
+
+Seeds a throwaway user/project/board with --tasks rows into DATABASE_URL
+(Postgres) unless --board-id is given, then times both strategies for a
+few pages:
+
+    python src/app/tests/load/bench_pagination_count.py --tasks 1000000
+    python src/app/tests/load/bench_pagination_count.py --board-id <uuid> --runs 50
+
+Pass --cleanup to delete the seeded data afterwards.
+"""
+import argparse
+import statistics
+import time
+import uuid
+
+from sqlalchemy import func, select, text
+
+from app.core.pagination import _count_statement, paginate
+from app.db.session import SessionLocal
+from app.models.task import Task
+from app.schemas.pagination import PaginationParams
+
+
+def seed(db, tasks: int) -> tuple[uuid.UUID, uuid.UUID]:
+    user_id, project_id, board_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db.execute(
+        text("INSERT INTO users (id, email, password, full_name, is_active, token_version, created_at, updated_at) "
+             "VALUES (:id, :email, 'x', 'Pagination Bench', true, 0, now(), now())"),
+        {"id": user_id, "email": f"bench-{user_id.hex[:8]}@example.com"},
+    )
+    db.execute(
+        text("INSERT INTO projects (id, name, owner_id, created_at) VALUES (:id, 'Pagination bench', :owner, now())"),
+        {"id": project_id, "owner": user_id},
+    )
+    db.execute(
+        text("INSERT INTO boards (id, name, project_id, created_at, updated_at, position, archived) "
+             "VALUES (:id, 'Bench board', :project, now(), now(), 0, false)"),
+        {"id": board_id, "project": project_id},
+    )
+    started = time.perf_counter()
+    db.execute(
+        text("INSERT INTO tasks (id, status, priority, board_id, created_at, updated_at, name, position, archived) "
+             "SELECT gen_random_uuid(), 'ACTIVE', (ARRAY['LOW','MEDIUM','HIGH'])[1 + g % 3]::prioritylevel, :board, "
+             "now() - g * interval '1 second', now(), 'Task ' || g, g, g % 10 = 0 "
+             "FROM generate_series(1, :n) AS g"),
+        {"board": board_id, "n": tasks},
+    )
+    db.commit()
+    db.execute(text("ANALYZE tasks"))
+    print(f"Seeded {tasks} tasks in {time.perf_counter() - started:.1f}s (board {board_id})")
+    return user_id, board_id
+
+
+def cleanup(db, user_id: uuid.UUID, board_id: uuid.UUID) -> None:
+    db.execute(text("DELETE FROM tasks WHERE board_id = :b"), {"b": board_id})
+    db.execute(text("DELETE FROM boards WHERE id = :b"), {"b": board_id})
+    db.execute(text("DELETE FROM projects WHERE owner_id = :u"), {"u": user_id})
+    db.execute(text("DELETE FROM users WHERE id = :u"), {"u": user_id})
+    db.commit()
+
+
+def two_statements(db, query, pagination: PaginationParams):
+    total = db.execute(_count_statement(query.statement)).scalar_one()
+    items = query.offset(pagination.offset).limit(pagination.limit).all()
+    return total, items
+
+
+def one_statement(db, query, pagination: PaginationParams):
+    result = paginate(query, pagination, Task)
+    return result.total, result.items
+
+
+def timed(fn, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="COUNT + SELECT vs count(*) OVER () pagination")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--board-id", type=uuid.UUID, help="Use an existing board instead of seeding")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    seeded = None
+    try:
+        board_id = args.board_id
+        if board_id is None:
+            seeded = seed(db, args.tasks)
+            board_id = seeded[1]
+
+        # Same filters/sort as the busiest list: GET /tasks (non archived, by position)
+        query = (
+            db.query(Task)
+            .filter(Task.board_id == board_id, Task.archived == False)
+            .order_by(Task.position.asc())
+        )
+        matching = db.execute(select(func.count()).select_from(query.statement.order_by(None).subquery())).scalar_one()
+        last_page = max(1, (matching + args.page_size - 1) // args.page_size)
+
+        print(f"\n{matching} matching rows, {args.runs} runs per case (ms)")
+        print(f"{'page':>8} {'strategy':<16} {'p50':>8} {'p95':>8} {'max':>8}")
+        for page in sorted({1, 10, min(100, last_page), last_page}):
+            pagination = PaginationParams.model_construct(
+                page=page, page_size=args.page_size, mode="page", cursor=None,
+                include_total=True, total_mode="exact",
+            )
+            for name, strategy in (("count + select", two_statements), ("count over ()", one_statement)):
+                strategy(db, query, pagination)  # warm up
+                samples = sorted(timed(lambda: strategy(db, query, pagination), args.runs))
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                print(f"{page:>8} {name:<16} {statistics.median(samples):>8.1f} {p95:>8.1f} {samples[-1]:>8.1f}")
+    finally:
+        if seeded and args.cleanup:
+            cleanup(db, *seeded)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
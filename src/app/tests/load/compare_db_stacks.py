@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Compare the sync and async database stacks under the locust profile.
+
+For each stack it starts uvicorn with ASYNC_DB_ENABLED set accordingly, runs
+load_tests.py headless with identical settings and prints aggregated req/s
+and latency percentiles side by side.
+
+Prerequisites: Postgres (and Redis) from .env, RATE_LIMIT_ENABLED=False and
+the load test users (run setup_users.py once against a running server).
+
+    python src/app/tests/load/compare_db_stacks.py --users 200 --run-time 2m
+"""
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+LOAD_DIR = Path(__file__).resolve().parent
+SRC_DIR = LOAD_DIR.parents[2]
+LOCUSTFILE = LOAD_DIR / "load_tests.py"
+
+
+def wait_until_healthy(host: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{host}/health", timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {host} did not become healthy")
+
+
+def run_stack(async_db: bool, args, workdir: Path) -> dict:
+    name = "async" if async_db else "sync"
+    host = f"http://127.0.0.1:{args.port}"
+    env = {**os.environ, "ASYNC_DB_ENABLED": str(async_db), "RATE_LIMIT_ENABLED": "False"}
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.app:app",
+         "--host", "127.0.0.1", "--port", str(args.port), "--workers", str(args.workers),
+         "--log-level", "warning"],
+        cwd=SRC_DIR,
+        env=env,
+    )
+    try:
+        wait_until_healthy(host)
+        prefix = workdir / name
+        subprocess.run(
+            [sys.executable, "-m", "locust", "-f", str(LOCUSTFILE), "--headless",
+             "--host", host, "--users", str(args.users), "--spawn-rate", str(args.spawn_rate),
+             "--run-time", args.run_time, "--csv", str(prefix), "--only-summary"],
+            check=False,
+        )
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    with open(f"{prefix}_stats.csv", newline="") as f:
+        aggregated = next(row for row in csv.DictReader(f) if row["Name"] == "Aggregated")
+    return {
+        "stack": name,
+        "requests": int(aggregated["Request Count"]),
+        "failures": int(aggregated["Failure Count"]),
+        "rps": float(aggregated["Requests/s"]),
+        "p50": float(aggregated["50%"]),
+        "p95": float(aggregated["95%"]),
+        "p99": float(aggregated["99%"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async DB stack under the locust profile")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--spawn-rate", type=int, default=20)
+    parser.add_argument("--run-time", default="2m")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers per run")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [run_stack(async_db, args, Path(tmp)) for async_db in (False, True)]
+
+    print(f"\n{'stack':<6} {'requests':>9} {'failures':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for r in results:
+        print(f"{r['stack']:<6} {r['requests']:>9} {r['failures']:>9} {r['rps']:>8.1f} "
+              f"{r['p50']:>8.0f} {r['p95']:>8.0f} {r['p99']:>8.0f}")
+    sync, async_ = results
+    if sync["rps"]:
+        print(f"\nasync/sync req/s: {async_['rps'] / sync['rps']:.2f}x, "
+              f"p99: {sync['p99']:.0f} ms -> {async_['p99']:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
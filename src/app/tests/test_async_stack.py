@@ -0,0 +1,255 @@
+# tests/test_async_stack.py
+from fastapi import status
+import asyncio
+import uuid
+import msgpack
+import pytest
+from app.models.user import User
+from app.core.security import hash_password
+
+
+class TestAsyncProjects:
+    """Project routes on the async (AsyncSession) stack"""
+
+    def test_project_crud(self, async_client, auth_headers):
+        response = async_client.post("/projects", json={"name": "Async Project"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        project = response.json()
+        assert project["name"] == "Async Project"
+        assert len(project["memberships"]) == 1
+
+        response = async_client.get("/projects", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 1
+
+        response = async_client.patch(f"/projects/{project['id']}", json={"name": "Renamed"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Renamed"
+
+        response = async_client.delete(f"/projects/{project['id']}", headers=auth_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = async_client.get(f"/projects/{project['id']}", headers=auth_headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_requires_authentication(self, async_client):
+        response = async_client.get("/projects")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_non_member_is_rejected(self, async_client, auth_headers, db_session):
+        project = async_client.post("/projects", json={"name": "Private"}, headers=auth_headers).json()
+        outsider = User(
+            id=uuid.uuid4(),
+            email="outsider@example.com",
+            password=hash_password("Outsider123"),
+            full_name="Outsider",
+            is_active=True
+        )
+        db_session.add(outsider)
+        db_session.commit()
+        token = async_client.post(
+            "/auth/login", data={"username": "outsider@example.com", "password": "Outsider123"}
+        ).json()["access_token"]
+
+        response = async_client.get(f"/projects/{project['id']}", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_membership_routes_stay_available(self, async_client, auth_headers):
+        project = async_client.post("/projects", json={"name": "Members"}, headers=auth_headers).json()
+        response = async_client.get(f"/projects/{project['id']}/members", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+
+
+class TestAsyncBoardsAndTasks:
+    """Board and task routes on the async stack"""
+
+    def test_board_and_task_crud(self, async_client, auth_headers):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+
+        board = async_client.post(f"/projects/{project_id}/boards", json={"name": "Todo"}, headers=auth_headers).json()
+        second = async_client.post(f"/projects/{project_id}/boards", json={"name": "Done"}, headers=auth_headers).json()
+        assert (board["position"], second["position"]) == (0, 1)
+
+        tasks_url = f"/projects/{project_id}/boards/{board['id']}/tasks"
+        response = async_client.post(tasks_url, json={"name": "Write docs", "priority": "high"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        task = response.json()
+
+        response = async_client.get(tasks_url, params={"priority": "high"}, headers=auth_headers)
+        assert response.json()["total"] == 1
+
+        response = async_client.patch(f"{tasks_url}/{task['id']}", json={"status": "completed"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "completed"
+
+        response = async_client.get(f"{tasks_url}/{task['id']}", headers=auth_headers)
+        assert response.json()["status"] == "completed"
+
+        response = async_client.delete(f"/projects/{project_id}/boards/{board['id']}", headers=auth_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = async_client.get(f"/projects/{project_id}/boards", headers=auth_headers)
+        assert [b["name"] for b in response.json()["items"]] == ["Done"]
+
+    def test_task_from_another_board(self, async_client, auth_headers):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+        board_a = async_client.post(f"/projects/{project_id}/boards", json={"name": "A"}, headers=auth_headers).json()
+        board_b = async_client.post(f"/projects/{project_id}/boards", json={"name": "B"}, headers=auth_headers).json()
+        task = async_client.post(
+            f"/projects/{project_id}/boards/{board_a['id']}/tasks", json={"name": "T"}, headers=auth_headers
+        ).json()
+
+        response = async_client.get(
+            f"/projects/{project_id}/boards/{board_b['id']}/tasks/{task['id']}", headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cursor_pagination(self, async_client, auth_headers):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+        for name in ["A", "B", "C"]:
+            async_client.post(f"/projects/{project_id}/boards", json={"name": name}, headers=auth_headers)
+
+        url = f"/projects/{project_id}/boards"
+        params = {"mode": "cursor", "page_size": 2, "sort_by": "name", "sort_order": "desc"}
+        first = async_client.get(url, params=params, headers=auth_headers).json()
+        second = async_client.get(url, params={**params, "cursor": first["next_cursor"]}, headers=auth_headers).json()
+        assert [b["name"] for b in first["items"] + second["items"]] == ["C", "B", "A"]
+        assert second["has_next"] is False and second["prev_cursor"]
+
+    def test_sparse_fields(self, async_client, auth_headers):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+        for name in ["A", "B", "C"]:
+            async_client.post(f"/projects/{project_id}/boards", json={"name": name}, headers=auth_headers)
+
+        url = f"/projects/{project_id}/boards"
+        params = {"fields": "name", "page": 2, "page_size": 2}
+        response = async_client.get(url, params=params, headers=auth_headers)
+        assert [set(b) for b in response.json()["items"]] == [{"id", "name"}]
+
+        response = async_client.get("/projects", params={"fields": "name"}, headers=auth_headers)
+        assert response.json()["items"] == [{"id": project_id, "name": "P"}]
+        response = async_client.get(f"/projects/{project_id}", params={"fields": "name"}, headers=auth_headers)
+        assert response.json() == {"id": project_id, "name": "P"}
+
+    def test_columnar(self, async_client, auth_headers):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+        for name in ["A", "B", "C"]:
+            async_client.post(f"/projects/{project_id}/boards", json={"name": name}, headers=auth_headers)
+
+        url = f"/projects/{project_id}/boards"
+        for page, names in ((1, ["A", "B"]), (2, ["C"])):
+            params = {"format": "columnar", "fields": "name", "page": page, "page_size": 2}
+            data = async_client.get(url, params=params, headers=auth_headers).json()
+            assert data["columns"]["name"] == names and data["total"] == 3
+
+        board_id = async_client.get(url, headers=auth_headers).json()["items"][0]["id"]
+        async_client.post(f"{url}/{board_id}/tasks", json={"name": "T"}, headers=auth_headers)
+        data = async_client.get(f"{url}/{board_id}/tasks", params={"format": "columnar"}, headers=auth_headers).json()
+        assert data["columns"]["name"] == ["T"] and data["dictionaries"]["board_id"] == [board_id]
+
+    def test_msgpack(self, async_client, auth_headers):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+        response = async_client.post(
+            f"/projects/{project_id}/boards", content=msgpack.packb({"name": "Packed"}),
+            headers={**auth_headers, "Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert msgpack.unpackb(response.content)["name"] == "Packed"
+
+        url = f"/projects/{project_id}/boards"
+        response = async_client.get(url, headers={**auth_headers, "Accept": "application/msgpack"})
+        assert msgpack.unpackb(response.content) == async_client.get(url, headers=auth_headers).json()
+
+
+class _LoopCheckingRedis:
+    """In-memory stand-in for the cache tiers' Redis client that records calls made on the event loop."""
+
+    def __init__(self):
+        self.data = {}
+        self.loop_calls = []
+
+    def _call(self, name):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # a worker thread
+        self.loop_calls.append(name)
+
+    def get(self, key):
+        self._call("get")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        self._call("set")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def hget(self, key, field):
+        self._call("hget")
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self._call("hset")
+        self.data.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self._call("hdel")
+        self.data.get(key, {}).pop(field, None)
+
+    def incr(self, key):
+        self._call("incr")
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def expire(self, key, ttl):
+        self._call("expire")
+
+    def delete(self, *keys):
+        self._call("delete")
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def publish(self, channel, message):
+        self._call("publish")
+        return 0
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        self._call("execute")
+
+
+class TestAsyncRedisOffload:
+    """The async stack only reaches the (blocking) Redis client from the threadpool"""
+
+    @pytest.fixture
+    def redis_cache(self, monkeypatch):
+        fake = _LoopCheckingRedis()
+        for module in ("object_cache", "tiered_cache"):
+            monkeypatch.setattr(f"app.core.{module}.get_redis_client", lambda: fake)
+            monkeypatch.setattr(f"app.core.{module}.connected_redis_client", lambda: fake)
+        monkeypatch.setattr("app.core.tiered_cache.start_invalidation_listener", lambda: None)
+        return fake
+
+    def test_cache_tiers_stay_off_the_event_loop(self, async_client, auth_headers, redis_cache):
+        project_id = async_client.post("/projects", json={"name": "P"}, headers=auth_headers).json()["id"]
+        board_id = async_client.post(
+            f"/projects/{project_id}/boards", json={"name": "Todo"}, headers=auth_headers
+        ).json()["id"]
+        tasks_url = f"/projects/{project_id}/boards/{board_id}/tasks"
+        task_id = async_client.post(tasks_url, json={"name": "T"}, headers=auth_headers).json()["id"]
+
+        for _ in range(2):
+            response = async_client.get(tasks_url, headers=auth_headers)
+            assert response.json()["total"] == 1
+            assert async_client.get(f"{tasks_url}/{task_id}", headers=auth_headers).json()["name"] == "T"
+        response = async_client.get(tasks_url, headers={**auth_headers, "If-None-Match": response.headers["ETag"]})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        async_client.patch(f"{tasks_url}/{task_id}", json={"name": "Renamed"}, headers=auth_headers)
+        assert async_client.get(f"{tasks_url}/{task_id}", headers=auth_headers).json()["name"] == "Renamed"
+        async_client.delete(f"/projects/{project_id}", headers=auth_headers)
+
+        assert redis_cache.data
+        assert redis_cache.loop_calls == []
@@ -147,4 +147,361 @@ class TestUserLogout:
         response = client.post("/auth/logout")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-  
+    def test_logout_all_revokes_every_token(self, client, test_user):
+        """Test logout-all revokes access and refresh tokens from every session"""
+        sessions = [
+            client.post(
+                "/auth/login",
+                data={"username": test_user.email, "password": "TestPass123"}
+            ).json()
+            for _ in range(2)
+        ]
+        first_headers = {"Authorization": f"Bearer {sessions[0]['access_token']}"}
+        second_headers = {"Authorization": f"Bearer {sessions[1]['access_token']}"}
+        assert client.get("/projects", headers=second_headers).status_code == status.HTTP_200_OK
+
+        response = client.post("/auth/logout-all", headers=first_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        assert client.get("/projects", headers=first_headers).status_code == status.HTTP_401_UNAUTHORIZED
+        assert client.get("/projects", headers=second_headers).status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.post("/auth/refresh", json={"refresh_token": sessions[1]["refresh_token"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_login_after_logout_all(self, client, test_user, auth_headers):
+        """Test new tokens work after logging out everywhere"""
+        client.post("/auth/logout-all", headers=auth_headers)
+
+        response = client.post(
+            "/auth/login",
+            data={"username": test_user.email, "password": "TestPass123"}
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        assert client.get("/projects", headers=headers).status_code == status.HTTP_200_OK
+
+
+class TestTokenCache:
+    """Test the verified token claims cache"""
+
+    def test_repeat_requests_hit_cache(self, client, auth_headers):
+        """Test the second request with the same token skips jwt.decode"""
+        from app.core.security import get_token_cache_stats
+
+        client.get("/projects", headers=auth_headers)
+        client.get("/projects", headers=auth_headers)
+
+        stats = get_token_cache_stats()
+        assert stats["size"] == 1
+        assert stats["hits"] >= 1
+
+    def test_invalid_token_not_cached(self, client):
+        """Test tokens that fail verification are never cached"""
+        from app.core.security import get_token_cache_stats
+
+        response = client.get("/projects", headers={"Authorization": "Bearer invalid.token.here"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert get_token_cache_stats()["size"] == 0
+
+    def test_refresh_token_rejected_as_access(self, client, test_user):
+        """Test a cached refresh token is still rejected on access routes"""
+        login_response = client.post(
+            "/auth/login",
+            data={"username": test_user.email, "password": "TestPass123"}
+        )
+        refresh_token = login_response.json()["refresh_token"]
+
+        client.post("/auth/refresh", json={"refresh_token": refresh_token})
+        response = client.get("/projects", headers={"Authorization": f"Bearer {refresh_token}"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class _EmptyRedis:
+    """Redis stand-in that stores nothing: the caches' L2 always misses, the invalidation channel is up."""
+
+    def get(self, key):
+        return None
+
+    def hget(self, key, field):
+        return None
+
+    def pipeline(self):
+        return self
+
+    def __getattr__(self, name):
+        # set, hset, expire, delete, publish, execute, ...
+        return lambda *args, **kwargs: None
+
+
+class TestPrincipalCache:
+    """Test the authenticated principal cache"""
+
+    @pytest.fixture
+    def invalidation_channel(self, monkeypatch):
+        monkeypatch.setattr("app.core.tiered_cache.get_redis_client", lambda: _EmptyRedis())
+        monkeypatch.setattr("app.core.tiered_cache.connected_redis_client", lambda: _EmptyRedis())
+        monkeypatch.setattr("app.core.tiered_cache.start_invalidation_listener", lambda: None)
+
+    def test_principal_cached_after_first_request(self, client, auth_headers, test_user, invalidation_channel):
+        """Test repeat requests resolve the user from the cache"""
+        from app.core.principal import get_principal_cache_stats
+
+        client.get("/projects", headers=auth_headers)
+        client.get("/projects", headers=auth_headers)
+
+        stats = get_principal_cache_stats()
+        assert stats["size"] == 1
+        assert stats["hits"] >= 1
+
+    def test_deactivated_user_rejected_immediately(self, client, auth_headers, test_user, db_session):
+        """Test deactivating a user invalidates the cached principal"""
+        response = client.get("/projects", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+        test_user.is_active = False
+        db_session.commit()
+
+        response = client.get("/projects", headers=auth_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_no_local_copies_without_invalidation_channel(self, client, auth_headers, test_user, db_session):
+        """Without Redis a write on another worker can't be broadcast, so nothing is served from the LRU"""
+        from sqlalchemy import text
+        from app.core.principal import get_principal_cache_stats
+
+        assert client.get("/projects", headers=auth_headers).status_code == status.HTTP_200_OK
+        assert get_principal_cache_stats()["size"] == 0
+
+        # Another worker deactivates the user; its invalidation reaches nobody
+        db_session.execute(text("update users set is_active = false where id = :id"), {"id": test_user.id.hex})
+        db_session.commit()
+
+        response = client.get("/projects", headers=auth_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestRevokedTokenFilter:
+    """Test the Bloom filter in front of the token blacklist"""
+
+    def test_added_identifiers_always_match(self):
+        """Test the filter never returns a false negative"""
+        from app.core.token_filter import BloomFilter
+
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        identifiers = [f"token-{i}" for i in range(1000)]
+        for identifier in identifiers:
+            bloom.add(identifier)
+
+        assert all(identifier in bloom for identifier in identifiers)
+        assert bloom.estimated_false_positive_rate <= 0.02
+
+    def test_false_positive_rate_close_to_target(self):
+        """Test unseen identifiers rarely match a full filter"""
+        from app.core.token_filter import BloomFilter
+
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"token-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives / 10000 < 0.03
+        assert bloom.memory_bytes < 2000
+
+    def test_revocation_received_during_resync_is_kept(self):
+        """Test a revocation delivered between the resync's ZRANGE and the swap still matches"""
+        import threading
+        from app.core.token_filter import RevokedTokenFilter
+
+        token_filter = RevokedTokenFilter()
+        token_filter._listener = object()  # no pub/sub in the fake
+
+        class FakeRedis:
+            def zremrangebyscore(self, *args):
+                return 0
+
+            def zrangebyscore(self, *args):
+                # The listener thread delivers a revocation while the filter is rebuilt
+                listener = threading.Thread(target=token_filter.add, args=("revoked-mid-sync",))
+                listener.start()
+                listener.join()
+                return []
+
+        assert token_filter.might_be_revoked("revoked-mid-sync", FakeRedis()) is True
+
+
+class TestHashingPool:
+    """Test the bounded password hashing pool"""
+
+    def test_login_rejected_when_pool_saturated(self, client, test_user, monkeypatch):
+        """Test login fails fast with 503 instead of queueing behind other hashes"""
+        import app.core.hashing as hashing
+
+        saturated = hashing.HashingPool(workers=1, queue_size=0)
+        saturated._slots.acquire()
+        monkeypatch.setattr(hashing, "_pool", saturated)
+
+        response = client.post(
+            "/auth/login",
+            data={"username": test_user.email, "password": "TestPass123"}
+        )
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
+        assert saturated.metrics()["rejected"] == 1
+
+    def test_pool_records_hash_metrics(self):
+        """Test hashing in the pool reports queue wait and hash time"""
+        from app.core.hashing import HashingPool, _timed_hash, _timed_verify
+
+        pool = HashingPool(workers=1, queue_size=1)
+        try:
+            hashed = pool.run(_timed_hash, "Secret123")
+            assert pool.run(_timed_verify, "Secret123", hashed) is True
+        finally:
+            pool.shutdown()
+
+        metrics = pool.metrics()
+        assert metrics["hash_seconds"]["count"] == 2
+        assert metrics["queue_wait_seconds"]["count"] == 2
+        assert metrics["in_flight"] == 0
+
+    def test_pool_is_awaitable(self):
+        """Test run_async awaits the pool without a thread waiting on it"""
+        import asyncio
+        from app.core.hashing import HashingPool, _timed_hash, _timed_verify
+
+        async def hash_and_verify(pool):
+            hashed = await pool.run_async(_timed_hash, "Secret123")
+            return await pool.run_async(_timed_verify, "Secret123", hashed)
+
+        pool = HashingPool(workers=1, queue_size=1)
+        try:
+            assert asyncio.run(hash_and_verify(pool)) is True
+        finally:
+            pool.shutdown()
+        assert pool.metrics()["hash_seconds"]["count"] == 2
+        assert pool.metrics()["in_flight"] == 0
+
+    def test_cancelled_request_keeps_its_slot_until_the_hash_ends(self):
+        """Test a disconnected client's hash still counts against the pool's bound"""
+        import asyncio
+        from concurrent.futures import Future
+        from app.core.exceptions import ServiceUnavailableError
+        from app.core.hashing import HashingPool, _timed_hash
+
+        job = Future()
+
+        class RunningExecutor:
+            def submit(self, fn, *args):
+                job.set_running_or_notify_cancel()
+                return job
+
+        pool = HashingPool(workers=1, queue_size=0)
+        pool._executor = RunningExecutor()
+
+        async def disconnect_midway():
+            request = asyncio.create_task(pool.run_async(_timed_hash, "Secret123"))
+            await asyncio.sleep(0)
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+
+        asyncio.run(disconnect_midway())
+        assert pool.metrics()["in_flight"] == 1
+        with pytest.raises(ServiceUnavailableError):
+            pool.run(_timed_hash, "Secret123")
+
+        job.set_result(("hashed", 0.0, 0.0))
+        assert pool.metrics()["in_flight"] == 0
+
+    def test_hashing_endpoint(self, client, test_user):
+        """Test the pool's metrics are exposed"""
+        client.post("/auth/login", data={"username": test_user.email, "password": "TestPass123"})
+        response = client.get("/health/hashing")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert {"in_flight", "rejected", "queue_wait_seconds", "hash_seconds"} <= data.keys()
+        assert data["hash_seconds"]["count"] >= 1
+
+
+class TestPasswordRehash:
+    """Test transparent rehash of stale argon2 hashes"""
+
+    def test_login_rehashes_stale_hash(self, client, db_session):
+        """Test a hash made with old parameters is upgraded on login"""
+        from app.core.hashing import build_pwd_context, needs_rehash
+        from app.models.user import User
+
+        stale_hash = build_pwd_context(time_cost=1, memory_cost=8192, parallelism=1).hash("OldParams123")
+        user = User(email="stale@example.com", password=stale_hash, full_name="Stale User", is_active=True)
+        db_session.add(user)
+        db_session.commit()
+        assert needs_rehash(user.password)
+
+        response = client.post(
+            "/auth/login",
+            data={"username": "stale@example.com", "password": "OldParams123"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        db_session.refresh(user)
+        assert user.password != stale_hash
+        assert not needs_rehash(user.password)
+
+        response = client.post(
+            "/auth/login",
+            data={"username": "stale@example.com", "password": "OldParams123"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+
+class TestLoginThrottle:
+    """Test the pre-auth login throttle"""
+
+    def test_repeated_failures_block_before_hashing(self, client, test_user):
+        """Test an email is refused, even with the right password, after too many failures"""
+        from app.core.login_throttle import get_login_throttle_metrics
+
+        for _ in range(5):
+            response = client.post(
+                "/auth/login",
+                data={"username": test_user.email, "password": "WrongPass123"}
+            )
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        # 6th failure starts the backoff
+        client.post("/auth/login", data={"username": test_user.email, "password": "WrongPass123"})
+
+        response = client.post(
+            "/auth/login",
+            data={"username": test_user.email, "password": "TestPass123"}
+        )
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) >= 1
+        assert get_login_throttle_metrics()["refused"] == 1
+        assert client.get("/health/login-throttle").json()["refused"] == 1
+
+    def test_successful_login_resets_failures(self, client, test_user):
+        """Test a correct password clears the email's failed attempts"""
+        for _ in range(4):
+            client.post("/auth/login", data={"username": test_user.email, "password": "WrongPass123"})
+        response = client.post("/auth/login", data={"username": test_user.email, "password": "TestPass123"})
+        assert response.status_code == status.HTTP_200_OK
+
+        for _ in range(4):
+            client.post("/auth/login", data={"username": test_user.email, "password": "WrongPass123"})
+        response = client.post("/auth/login", data={"username": test_user.email, "password": "TestPass123"})
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_refused_inactive_login_keeps_failures(self, client, test_user, db_session):
+        """Test a correct password on an inactive account doesn't reset the backoff"""
+        for _ in range(4):
+            client.post("/auth/login", data={"username": test_user.email, "password": "WrongPass123"})
+        test_user.is_active = False
+        db_session.commit()
+        response = client.post("/auth/login", data={"username": test_user.email, "password": "TestPass123"})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        # 5th and 6th failures: the backoff starts as if nothing happened in between
+        for _ in range(2):
+            client.post("/auth/login", data={"username": test_user.email, "password": "WrongPass123"})
+        response = client.post("/auth/login", data={"username": test_user.email, "password": "TestPass123"})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
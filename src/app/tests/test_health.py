@@ -0,0 +1,106 @@
+# tests/test_health.py
+import json
+from fastapi import status
+from app.core.cache import TTLCache
+from app.core.tiered_cache import TieredCache, _apply_invalidation
+from app.db.pool import InstrumentedQueuePool, pool_snapshot, replica_pool_class
+from sqlalchemy import create_engine, text
+
+
+class TestDbPoolMetrics:
+    """Connection pool gauges"""
+
+    def test_pool_endpoint(self, client):
+        response = client.get("/health/db-pool")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["pid"] > 0
+        assert {"pool_size", "checked_out", "overflow", "checkout_wait_seconds"} <= data["sync"].keys()
+
+    def test_gauges_track_checkouts(self):
+        engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=1)
+        InstrumentedQueuePool.metrics.reset()
+
+        first, second = engine.connect(), engine.connect()
+        first.execute(text("select 1"))
+        snapshot = pool_snapshot(engine.pool)
+        assert snapshot["checked_out"] == 2
+        assert snapshot["overflow"] == 1
+        assert snapshot["checkout_wait_seconds"]["count"] == 2
+
+        first.close()
+        second.close()
+        assert pool_snapshot(engine.pool)["checked_out"] == 0
+        engine.dispose()
+
+    def test_replicas_count_separately(self):
+        first, second = (create_engine("sqlite://", poolclass=replica_pool_class()) for _ in range(2))
+        with first.connect() as conn:
+            conn.execute(text("select 1"))
+        # Disposing recreates the pool with the same class, so the counts survive
+        first.dispose()
+        assert pool_snapshot(first.pool)["checkout_wait_seconds"]["count"] == 1
+        assert pool_snapshot(second.pool)["checkout_wait_seconds"]["count"] == 0
+        second.dispose()
+
+
+class TestTieredCache:
+    """Per-worker L1 bounds, broadcast invalidation and per-tier stats"""
+
+    def test_local_tier_is_bounded_by_bytes(self):
+        cache = TTLCache(max_size=10, ttl=60, max_bytes=10)
+        cache.set("a", "first", size=6)
+        cache.set("b", "second", size=6)
+        assert cache.get("a") is None
+        assert cache.get("b") == "second"
+        assert cache.stats()["bytes"] == 6
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidation_message_drops_local_copies(self):
+        cache = TieredCache(
+            "test_tier", max_size=10, max_bytes=1024, ttl=60,
+            redis_enabled=lambda: False, require_redis=False,
+        )
+        cache.set("project:1", {"name": "a"})
+        cache.set("project:2", {"name": "b"})
+        cache.set("other:1", {"name": "c"})
+
+        _apply_invalidation(json.dumps({"cache": "test_tier", "keys": ["project:1"]}))
+        assert cache.get("project:1") is None
+        assert cache.get("project:2") == {"name": "b"}
+
+        _apply_invalidation(json.dumps({"cache": "test_tier", "prefix": "project:"}))
+        assert cache.get("project:2") is None
+        assert cache.get("other:1") == {"name": "c"}
+
+    def test_prefix_delete_reaches_redis(self, monkeypatch):
+        import fnmatch
+
+        class FakeRedis:
+            data = {"test_prefix:project:1": "1", "test_prefix:project:2": "2", "test_prefix:other:1": "3"}
+
+            def scan_iter(self, match, count=None):
+                return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+            def delete(self, *keys):
+                for key in keys:
+                    self.data.pop(key, None)
+
+            def publish(self, channel, message):
+                return 0
+
+        fake = FakeRedis()
+        monkeypatch.setattr("app.core.tiered_cache.get_redis_client", lambda: fake)
+        monkeypatch.setattr("app.core.tiered_cache.start_invalidation_listener", lambda: None)
+        cache = TieredCache("test_prefix", max_size=10, max_bytes=1024, ttl=60)
+
+        cache.delete_prefix("project:")
+        assert list(fake.data) == ["test_prefix:other:1"]
+
+    def test_cache_endpoint_reports_each_tier(self, client, auth_headers):
+        client.get("/projects", headers=auth_headers)
+        data = client.get("/health/cache").json()
+        assert {"objects", "membership", "principal", "token_filter"} <= data.keys()
+        assert {"hit_ratio", "l1", "l2"} <= data["principal"].keys()
+        assert data["principal"]["l1"]["max_bytes"] > 0
+        assert {"memory_bytes", "estimated_false_positive_rate", "false_positives"} <= data["token_filter"].keys()
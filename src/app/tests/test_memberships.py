@@ -364,4 +364,66 @@ class TestMembershipPermissions:
             json={"role": "EDITOR"},
             headers=viewer_headers
         )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
\ No newline at end of file
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_role_change_applies_immediately(self, client, auth_headers, test_project, test_user_mem):
+        """Test promoting and removing a member takes effect on the next request"""
+        project_id = test_project["id"]
+        user_id = test_user_mem.id
+
+        client.post(
+            f"/projects/{project_id}/members/add/{user_id}",
+            json={"role": "VIEWER"},
+            headers=auth_headers
+        )
+        response = client.post(
+            "/auth/login",
+            data={"username": test_user_mem.email, "password": "TestPassMember123"}
+        )
+        member_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        response = client.post(f"/projects/{project_id}/boards", json={"name": "Board"}, headers=member_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        client.patch(
+            f"/projects/{project_id}/members/change-role/{user_id}",
+            json={"role": "EDITOR"},
+            headers=auth_headers
+        )
+        response = client.post(f"/projects/{project_id}/boards", json={"name": "Board"}, headers=member_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        client.delete(f"/projects/{project_id}/members/remove/{user_id}", headers=auth_headers)
+        response = client.get(f"/projects/{project_id}/boards", headers=member_headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestRolesInToken:
+    """Test roles embedded in access tokens (ROLES_IN_TOKEN_ENABLED)"""
+
+    def test_token_roles_used_while_version_current(self, monkeypatch):
+        """Test token roles are authoritative only while the membership version matches"""
+        from app.core import token_roles
+
+        monkeypatch.setattr(token_roles.settings, "ROLES_IN_TOKEN_ENABLED", True)
+        monkeypatch.setattr(token_roles, "get_membership_version", lambda user_id: "v2")
+        user_id = uuid.uuid4()
+        project_id = uuid.uuid4()
+
+        current = {"roles": {project_id.hex: "E"}, "mv": "v2"}
+        assert token_roles.role_from_claims(current, user_id, project_id) == (True, UserRole.EDITOR)
+        # Current roles that don't list the project mean "not a member"
+        assert token_roles.role_from_claims(current, user_id, uuid.uuid4()) == (True, None)
+
+        stale = {"roles": {project_id.hex: "O"}, "mv": "v1"}
+        assert token_roles.role_from_claims(stale, user_id, project_id) == (False, None)
+        assert token_roles.role_from_claims({}, user_id, project_id) == (False, None)
+
+    def test_disabled_mode_ignores_token_roles(self, monkeypatch):
+        """Test token roles are ignored unless the mode is enabled"""
+        from app.core import token_roles
+
+        monkeypatch.setattr(token_roles.settings, "ROLES_IN_TOKEN_ENABLED", False)
+        project_id = uuid.uuid4()
+        claims = {"roles": {project_id.hex: "O"}, "mv": "v1"}
+        assert token_roles.role_from_claims(claims, uuid.uuid4(), project_id) == (False, None)
@@ -155,6 +155,18 @@ class TestProjectOperations:
         data = response.json()
         assert data["name"] == "Updated Project Name"
     
+    def test_project_etag_changes_with_the_project(self, client, auth_headers, test_project):
+        """Test If-None-Match on a project"""
+        url = f"/projects/{test_project['id']}"
+        etag = client.get(url, headers=auth_headers).headers["ETag"]
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        client.patch(url, json={"name": "Updated Project Name"}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+    
     def test_delete_project(self, client, auth_headers, test_project):
         """Test deleting a project"""
         project_id = test_project["id"]
@@ -193,4 +205,70 @@ class TestProjectMaxLimit:
             headers=auth_headers
         )
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
-        assert "maximum" in response.json()["detail"].lower()
\ No newline at end of file
+        assert "maximum" in response.json()["detail"].lower()
+
+class TestReadReplicaRouting:
+    """Read-only sessions go to a replica unless the user just wrote"""
+
+    @pytest.fixture
+    def engines(self):
+        from sqlalchemy import create_engine, text
+        primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+        for engine, rows in ((primary, 1), (replica, 0)):
+            with engine.begin() as conn:
+                conn.execute(text("create table items (id integer primary key)"))
+                for i in range(rows):
+                    conn.execute(text("insert into items (id) values (:id)"), {"id": i})
+        yield primary, replica
+        primary.dispose()
+        replica.dispose()
+
+    @pytest.fixture
+    def replicas_enabled(self, monkeypatch, engines):
+        from app.core import dependencies
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "DATABASE_REPLICA_URLS", ["sqlite://"])
+        monkeypatch.setattr(dependencies, "next_replica", lambda: engines[1])
+
+    def test_routing_session_reads_from_replica(self, engines):
+        from sqlalchemy import text
+        from app.db.routing import RoutingSession
+        primary, replica = engines
+
+        with RoutingSession(bind=primary) as db:
+            assert db.execute(text("select count(*) from items")).scalar() == 1
+        with RoutingSession(bind=primary, info={"replica": replica}) as db:
+            assert db.execute(text("select count(*) from items")).scalar() == 0
+
+    def test_writer_sticks_to_primary(self, replicas_enabled, engines):
+        import uuid
+        from sqlalchemy import text
+        from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+        from app.core.dependencies import get_read_db
+        from app.db.routing import RoutingSession
+
+        class Base(DeclarativeBase):
+            pass
+
+        class Item(Base):
+            __tablename__ = "items"
+            id: Mapped[int] = mapped_column(primary_key=True)
+
+        primary, replica = engines
+        user_id = uuid.uuid4()
+
+        reads = get_read_db({"id": user_id})
+        assert next(reads).info["replica"] is replica
+        reads.close()
+
+        # A committed flush on a session that knows its user
+        with RoutingSession(bind=primary) as db:
+            db.info["user_id"] = user_id
+            db.add(Item(id=10))
+            db.commit()
+        with primary.connect() as conn:
+            assert conn.execute(text("select count(*) from items")).scalar() == 2
+
+        reads = get_read_db({"id": user_id})
+        assert "replica" not in next(reads).info
+        reads.close()
@@ -2,7 +2,13 @@
 import pytest
 from fastapi import status
 from datetime import datetime, timedelta, timezone
+import threading
+import time
 import uuid
+import msgpack
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import event
+from app.core import fast_json, msgpack_negotiation, object_cache
 class TestTasks:
     """Test task operations"""
     
@@ -547,4 +553,556 @@ class TestTaskEdgeCases:
             f"/projects/{project_id}/boards/{board_id}/tasks/{fake_uuid}",
             headers=auth_headers
         )
-        assert response.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_board_from_another_project(self, client, auth_headers, test_project, test_board, test_task):
+        """Test a board cannot be reached through a project it doesn't belong to"""
+        other_project = client.post(
+            "/projects",
+            json={"name": "Other Project"},
+            headers=auth_headers
+        ).json()
+        board_id = test_board["id"]
+        task_id = test_task["id"]
+
+        response = client.get(
+            f"/projects/{other_project['id']}/boards/{board_id}/tasks/{task_id}",
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = client.post(
+            f"/projects/{other_project['id']}/boards/{board_id}/tasks",
+            json={"name": "Sneaky task"},
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestTaskCursorPagination:
+    """Keyset (cursor) pagination of tasks"""
+
+    @pytest.fixture
+    def tasks_url(self, client, auth_headers, test_project, test_board):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        due = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        specs = [
+            ("T0", "low", due), ("T1", "high", None), ("T2", "medium", due + timedelta(days=2)),
+            ("T3", "high", due), ("T4", "low", None), ("T5", "medium", due + timedelta(days=1)),
+            ("T6", "high", None),
+        ]
+        for name, priority, due_date in specs:
+            body = {"name": name, "priority": priority}
+            if due_date:
+                body["due_date"] = due_date.isoformat()
+            assert client.post(url, json=body, headers=auth_headers).status_code == status.HTTP_201_CREATED
+        return url
+
+    def _walk(self, client, auth_headers, url, **params):
+        names, cursor, pages = [], None, 0
+        while True:
+            query = {"mode": "cursor", "page_size": 2, **params}
+            if cursor:
+                query["cursor"] = cursor
+            data = client.get(url, params=query, headers=auth_headers).json()
+            names += [t["name"] for t in data["items"]]
+            pages += 1
+            if not data["has_next"]:
+                return names, data
+            cursor = data["next_cursor"]
+            assert pages < 10
+
+    def test_default_order_matches_page_mode(self, client, auth_headers, tasks_url):
+        names, last = self._walk(client, auth_headers, tasks_url)
+        page_mode = client.get(tasks_url, params={"page_size": 10}, headers=auth_headers).json()
+        assert names == [t["name"] for t in page_mode["items"]]
+        assert last["next_cursor"] is None
+        assert "total" not in last
+
+    def test_every_sort_field_visits_each_task_once(self, client, auth_headers, tasks_url):
+        for sort_by in ["name", "position", "created_at", "updated_at", "due_date", "status", "priority"]:
+            for sort_order in ["asc", "desc"]:
+                names, _ = self._walk(client, auth_headers, tasks_url, sort_by=sort_by, sort_order=sort_order)
+                assert sorted(names) == [f"T{i}" for i in range(7)], (sort_by, sort_order)
+
+    def test_due_date_nulls_sort_last(self, client, auth_headers, tasks_url):
+        names, _ = self._walk(client, auth_headers, tasks_url, sort_by="due_date", sort_order="desc")
+        assert names[:2] == ["T2", "T5"]
+        # T0 and T3 share a due date, the id tiebreaker decides
+        assert sorted(names[2:4]) == ["T0", "T3"]
+        assert sorted(names[4:]) == ["T1", "T4", "T6"]
+
+    def test_prev_cursor_returns_previous_page(self, client, auth_headers, tasks_url):
+        params = {"mode": "cursor", "page_size": 3, "sort_by": "due_date"}
+        first = client.get(tasks_url, params=params, headers=auth_headers).json()
+        assert first["has_previous"] is False and first["prev_cursor"] is None
+        second = client.get(tasks_url, params={**params, "cursor": first["next_cursor"]}, headers=auth_headers).json()
+        third = client.get(tasks_url, params={**params, "cursor": second["next_cursor"]}, headers=auth_headers).json()
+
+        back = client.get(tasks_url, params={**params, "cursor": third["prev_cursor"]}, headers=auth_headers).json()
+        assert [t["id"] for t in back["items"]] == [t["id"] for t in second["items"]]
+        back = client.get(tasks_url, params={**params, "cursor": back["prev_cursor"]}, headers=auth_headers).json()
+        assert [t["id"] for t in back["items"]] == [t["id"] for t in first["items"]]
+        assert back["has_previous"] is False
+
+    def test_inserts_do_not_shift_pages(self, client, auth_headers, tasks_url):
+        params = {"mode": "cursor", "page_size": 3, "sort_by": "name", "sort_order": "desc"}
+        first = client.get(tasks_url, params=params, headers=auth_headers).json()
+        client.post(tasks_url, json={"name": "Z inserted"}, headers=auth_headers)
+        second = client.get(tasks_url, params={**params, "cursor": first["next_cursor"]}, headers=auth_headers).json()
+        assert [t["name"] for t in second["items"]] == ["T3", "T2", "T1"]
+
+    def test_tampered_or_mismatched_cursor_is_rejected(self, client, auth_headers, tasks_url):
+        first = client.get(tasks_url, params={"mode": "cursor", "page_size": 2}, headers=auth_headers).json()
+        body, signature = first["next_cursor"].split(".")
+        tampered = body[:-2] + ("AA" if body[-2:] != "AA" else "BB") + "." + signature
+
+        response = client.get(tasks_url, params={"cursor": tampered}, headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        response = client.get(tasks_url, params={"cursor": first["next_cursor"], "sort_by": "name"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestTaskTotals:
+    """Optional, estimated and cached totals in page mode"""
+
+    @pytest.fixture
+    def tasks_url(self, client, auth_headers, test_project, test_board):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        for i in range(5):
+            client.post(url, json={"name": f"Task {i}"}, headers=auth_headers)
+        return url
+
+    def test_without_total(self, client, auth_headers, tasks_url):
+        params = {"include_total": "false", "page_size": 2}
+        first = client.get(tasks_url, params=params, headers=auth_headers).json()
+        assert first["total"] is None and first["total_pages"] is None
+        assert first["has_next"] is True
+
+        last = client.get(tasks_url, params={**params, "page": 3}, headers=auth_headers).json()
+        assert len(last["items"]) == 1
+        assert last["has_next"] is False and last["has_previous"] is True
+
+    def test_cached_total_is_reused(self, client, auth_headers, tasks_url):
+        params = {"total_mode": "cached", "page_size": 2}
+        assert client.get(tasks_url, params=params, headers=auth_headers).json()["total"] == 5
+
+        client.post(tasks_url, json={"name": "Task 5"}, headers=auth_headers)
+        # Within the TTL the count is served from cache; items are always fresh
+        cached = client.get(tasks_url, params={**params, "page": 3}, headers=auth_headers).json()
+        assert cached["total"] == 5
+        assert len(cached["items"]) == 2
+        assert client.get(tasks_url, params={"page_size": 2}, headers=auth_headers).json()["total"] == 6
+
+        # Other filters are another cache entry
+        filtered = client.get(tasks_url, params={**params, "priority": "medium"}, headers=auth_headers).json()
+        assert filtered["total"] == 6
+
+    def test_estimate_falls_back_to_exact_count(self, client, auth_headers, tasks_url):
+        # SQLite has no planner estimate, small Postgres results are counted exactly too
+        data = client.get(tasks_url, params={"total_mode": "estimate"}, headers=auth_headers).json()
+        assert data["total"] == 5
+        assert data["total_estimated"] is False
+
+    def test_exact_total_past_the_last_page(self, client, auth_headers, tasks_url):
+        # The page query carries the total; an empty page needs a separate count
+        data = client.get(tasks_url, params={"page": 4, "page_size": 2}, headers=auth_headers).json()
+        assert data["items"] == []
+        assert data["total"] == 5 and data["total_pages"] == 3
+        assert data["has_next"] is False
+
+
+class _DictRedis:
+    """Just enough of the Redis client for the object and membership cache tiers."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self.data.get(key, {}).pop(field, None)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def publish(self, channel, message):
+        return 0
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+class TestObjectCache:
+    """Read-through cache of task/board payloads and first list pages"""
+
+    @pytest.fixture
+    def redis_cache(self, monkeypatch):
+        fake = _DictRedis()
+        monkeypatch.setattr("app.core.object_cache.get_redis_client", lambda: fake)
+        monkeypatch.setattr("app.core.tiered_cache.get_redis_client", lambda: fake)
+        # No pub/sub in the fake: this worker's own L1 is dropped directly
+        monkeypatch.setattr("app.core.tiered_cache.start_invalidation_listener", lambda: None)
+        return fake
+
+    @pytest.fixture
+    def task_url(self, test_project, test_board, test_task):
+        return f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks/{test_task['id']}"
+
+    def test_reads_go_to_db_without_redis(self, client, auth_headers, task_url):
+        for _ in range(2):
+            assert client.get(task_url, headers=auth_headers).status_code == status.HTTP_200_OK
+        stats = client.get("/health/cache").json()["objects"]
+        assert stats["hits"] == 0 and stats["misses"] > 0
+        assert stats["redis_available"] is False
+
+    def test_task_read_is_cached_until_updated(self, client, auth_headers, redis_cache, task_url):
+        client.get(task_url, headers=auth_headers)
+        hits = client.get("/health/cache").json()["objects"]["hits"]
+        assert client.get(task_url, headers=auth_headers).json()["name"] == "Test Task"
+        assert client.get("/health/cache").json()["objects"]["hits"] > hits
+
+        client.patch(task_url, json={"name": "Renamed"}, headers=auth_headers)
+        assert client.get(task_url, headers=auth_headers).json()["name"] == "Renamed"
+        assert client.get("/health/cache").json()["objects"]["evictions"] >= 1
+
+    def test_first_pages_are_invalidated_by_create(self, client, auth_headers, redis_cache, test_project, test_board, test_task):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        assert client.get(url, headers=auth_headers).json()["total"] == 1
+        assert client.get(url, params={"sort_by": "name"}, headers=auth_headers).json()["total"] == 1
+        client.post(url, json={"name": "Second"}, headers=auth_headers)
+        # One generation bump covers every cached variant of the board's lists
+        assert client.get(url, headers=auth_headers).json()["total"] == 2
+        assert client.get(url, params={"sort_by": "name"}, headers=auth_headers).json()["total"] == 2
+        assert client.get("/health/cache").json()["objects"]["generation_bumps"] >= 1
+
+    def test_cached_task_is_checked_against_the_board(self, client, auth_headers, redis_cache, test_project, task_url, test_task):
+        other = client.post(f"/projects/{test_project['id']}/boards", json={"name": "Other"}, headers=auth_headers).json()
+        client.get(task_url, headers=auth_headers)
+        response = client.get(
+            f"/projects/{test_project['id']}/boards/{other['id']}/tasks/{test_task['id']}",
+            headers=auth_headers,
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_replica_reads_are_fresh_for_the_stickiness_window(self, redis_cache, db_session, test_board, test_task):
+        from app.core.config import settings
+        from app.services import task_service
+
+        def fresh_for(session) -> float:
+            object_cache.payload_cache.clear()
+            redis_cache.data.clear()
+            task_service.get_cached_task(uuid.UUID(test_board["id"]), uuid.UUID(test_task["id"]), session)
+            entry = object_cache.payload_cache.loads(redis_cache.data[f"cache:task:{test_task['id']}"])
+            return entry["fresh_until"] - time.time()
+
+        assert fresh_for(db_session) > settings.REPLICA_STICKINESS_SECONDS
+        # Other users aren't sticky: a lagging replica's row must not outlive the window
+        db_session.info["replica"] = db_session.get_bind()
+        assert fresh_for(db_session) <= settings.REPLICA_STICKINESS_SECONDS
+
+    def test_concurrent_misses_share_one_load(self):
+        calls, release = [], threading.Event()
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return {"loads": len(calls)}
+
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(object_cache.read_through, "test:coalesce", load) for _ in range(8)]
+            deadline = time.monotonic() + 5
+            while object_cache._flights.coalesced < 7 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert results == [{"loads": 1}] * 8
+
+    def test_stale_entry_is_served_while_one_request_refreshes(self, redis_cache):
+        object_cache.payload_cache.set("test:stale", {"fresh_until": 0, "payload": {"v": "old"}})
+        started, release = threading.Event(), threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            return {"v": "new"}
+
+        with ThreadPoolExecutor(1) as pool:
+            leader = pool.submit(object_cache.read_through, "test:stale", load)
+            started.wait(5)
+            assert object_cache.read_through("test:stale", load) == {"v": "old"}
+            release.set()
+            assert leader.result() == {"v": "new"}
+
+        assert object_cache.read_through("test:stale", load) == {"v": "new"}
+        assert object_cache.get_object_cache_stats()["stale_served"] == 1
+
+    def test_task_list_is_not_modified_until_the_board_changes(self, client, auth_headers, redis_cache, test_project, test_board, test_task):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        etag = client.get(url, headers=auth_headers).headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        # Other parameters, other representation
+        assert client.get(url, params={"sort_by": "name"}, headers={**auth_headers, "If-None-Match": etag}).status_code == status.HTTP_200_OK
+
+        client.post(url, json={"name": "Second"}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 2
+        assert response.headers["ETag"] != etag
+
+    def test_replica_reads_are_never_tagged_with_the_generation(self, client, auth_headers, redis_cache, db_session, test_project, test_board, test_task):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        client.post(url, json={"name": "Second"}, headers=auth_headers)
+        current = client.get(url, headers=auth_headers).headers["ETag"]
+
+        # From now on the list is read through a (possibly lagging) replica session
+        db_session.info["replica"] = db_session.get_bind()
+        response = client.get(url, headers={**auth_headers, "If-None-Match": current})
+        assert response.status_code == status.HTTP_200_OK
+        assert "ETag" not in response.headers
+
+    def test_lists_have_no_etag_without_redis(self, client, auth_headers, test_project, test_board):
+        response = client.get(f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks", headers=auth_headers)
+        assert "ETag" not in response.headers
+
+
+class TestTaskConditionalGet:
+    """ETag/If-None-Match on single tasks"""
+
+    def test_task_is_not_modified_until_updated(self, client, auth_headers, test_project, test_board, test_task):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks/{test_task['id']}"
+        etag = client.get(url, headers=auth_headers).headers["ETag"]
+
+        assert client.get(url, headers={**auth_headers, "If-None-Match": etag}).status_code == status.HTTP_304_NOT_MODIFIED
+        # Weak comparison, and any tag of a list may match
+        strong = etag.removeprefix("W/")
+        response = client.get(url, headers={**auth_headers, "If-None-Match": f'"other", {strong}'})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+        client.patch(url, json={"name": "Renamed"}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+
+class TestFastJson:
+    """FAST_JSON_ENABLED renders the same bytes as the response_model path"""
+
+    def test_read_responses_are_unchanged(self, client, auth_headers, monkeypatch, test_project, test_board, test_task):
+        project_url = f"/projects/{test_project['id']}"
+        board_url = f"{project_url}/boards/{test_board['id']}"
+        client.post(f"{board_url}/tasks", json={"name": "Second"}, headers=auth_headers)
+        urls = [
+            "/projects",
+            project_url,
+            f"{project_url}/boards",
+            board_url,
+            f"{board_url}/tasks",
+            # Past the first page: ORM objects instead of a cached payload
+            f"{board_url}/tasks?page=2&page_size=1",
+            f"{board_url}/tasks/{test_task['id']}",
+        ]
+        expected = [client.get(url, headers=auth_headers) for url in urls]
+
+        monkeypatch.setattr(fast_json.settings, "FAST_JSON_ENABLED", True)
+        for url, before in zip(urls, expected):
+            response = client.get(url, headers=auth_headers)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"] == "application/json"
+            assert response.content == before.content
+            assert response.headers.get("ETag") == before.headers.get("ETag")
+
+        etag = expected[-1].headers["ETag"]
+        response = client.get(urls[-1], headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+class TestSparseFields:
+    """fields= trims responses and the columns read"""
+
+    @pytest.fixture
+    def tasks_url(self, client, auth_headers, test_project, test_board):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        for name in ["A", "B", "C"]:
+            client.post(url, json={"name": name, "description": "Long text"}, headers=auth_headers)
+        return url
+
+    @pytest.fixture
+    def statements(self, db_session):
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        yield captured
+        event.remove(engine, "before_cursor_execute", capture)
+
+    def test_list_returns_only_the_fields(self, client, auth_headers, tasks_url):
+        # First page (cached payload) and past it (ORM rows)
+        for page in (1, 2):
+            response = client.get(
+                tasks_url, params={"fields": "name,position,status", "page": page, "page_size": 2}, headers=auth_headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["total"] == 3
+            assert all(set(task) == {"id", "name", "position", "status"} for task in data["items"])
+
+    def test_unrequested_columns_are_not_selected(self, client, auth_headers, tasks_url, statements):
+        client.get(tasks_url, params={"fields": "name", "page": 2, "page_size": 2}, headers=auth_headers)
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT") and "FROM tasks" in s]
+        assert selects and all("tasks.description" not in s for s in selects)
+
+    def test_cursor_pages_without_the_sort_field(self, client, auth_headers, tasks_url):
+        params = {"fields": "status", "mode": "cursor", "page_size": 2, "sort_by": "name", "sort_order": "desc"}
+        first = client.get(tasks_url, params=params, headers=auth_headers).json()
+        second = client.get(tasks_url, params={**params, "cursor": first["next_cursor"]}, headers=auth_headers).json()
+        assert len(first["items"] + second["items"]) == 3
+        assert set(first["items"][0]) == {"id", "status"}
+
+    def test_detail_and_unknown_fields(self, client, auth_headers, test_project, test_board, test_task):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks/{test_task['id']}"
+        response = client.get(url, params={"fields": "name, due_date"}, headers=auth_headers)
+        assert response.json() == {"id": test_task["id"], "name": "Test Task", "due_date": None}
+        # Each representation has its own ETag
+        assert response.headers["ETag"] != client.get(url, headers=auth_headers).headers["ETag"]
+
+        response = client.get(url, params={"fields": "name,secret"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert "secret" in response.json()["detail"]
+
+
+class TestColumnar:
+    """format=columnar lists"""
+
+    @pytest.fixture
+    def tasks_url(self, client, auth_headers, test_project, test_board):
+        url = f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+        for name, priority in [("A", "high"), ("B", "low"), ("C", "high")]:
+            client.post(url, json={"name": name, "priority": priority}, headers=auth_headers)
+        return url
+
+    def test_page_has_one_array_per_field(self, client, auth_headers, tasks_url, test_board):
+        rows = client.get(tasks_url, headers=auth_headers).json()
+        # First page (cached payload) and past it (plain rows)
+        for page in (1, 2):
+            response = client.get(
+                tasks_url, params={"format": "columnar", "page": page, "page_size": 2}, headers=auth_headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["format"] == "columnar" and data["total"] == 3 and "items" not in data
+            columns, dictionaries = data["columns"], data["dictionaries"]
+            expected = rows["items"][(page - 1) * 2:page * 2]
+            assert columns["name"] == [task["name"] for task in expected]
+            assert columns["description"] == [task["description"] for task in expected]
+            # Dictionary-encoded: indexes into dictionaries[name]
+            assert [dictionaries["priority"][i] for i in columns["priority"]] == [task["priority"] for task in expected]
+            assert dictionaries["board_id"] == [test_board["id"]]
+            assert set(columns["board_id"]) == {0}
+            assert columns["assignee_id"] == [None] * len(expected) and dictionaries["assignee_id"] == []
+
+    def test_cursor_pages_with_fields(self, client, auth_headers, tasks_url):
+        params = {"format": "columnar", "fields": "priority", "mode": "cursor", "page_size": 2, "sort_by": "name"}
+        first = client.get(tasks_url, params=params, headers=auth_headers).json()
+        second = client.get(tasks_url, params={**params, "cursor": first["next_cursor"]}, headers=auth_headers).json()
+        assert set(first["columns"]) == {"id", "priority"}
+        assert first["dictionaries"] == {"priority": ["high", "low"]}
+        assert len(first["columns"]["id"] + second["columns"]["id"]) == 3
+        assert second["next_cursor"] is None
+
+    def test_unknown_format(self, client, auth_headers, tasks_url):
+        response = client.get(tasks_url, params={"format": "csv"}, headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestMsgpack:
+    """Accept / Content-Type: application/msgpack"""
+
+    PACKED = {"Accept": "application/msgpack"}
+
+    @pytest.fixture
+    def tasks_url(self, test_project, test_board):
+        return f"/projects/{test_project['id']}/boards/{test_board['id']}/tasks"
+
+    def test_accept_header(self):
+        prefers = msgpack_negotiation.prefers_msgpack
+        assert prefers("application/msgpack")
+        assert prefers("application/json;q=0.5, application/x-msgpack")
+        assert not prefers("application/msgpack;q=0.5, */*")
+        assert not prefers("*/*") and not prefers(None)
+
+    def test_create_and_update_from_msgpack(self, client, auth_headers, tasks_url):
+        due = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=2)
+        body = msgpack.packb({"name": "Packed", "priority": "high", "due_date": due}, datetime=True)
+        response = client.post(
+            tasks_url, content=body, headers={**auth_headers, **self.PACKED, "Content-Type": "application/msgpack"}
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.headers["content-type"] == "application/msgpack"
+        task = msgpack.unpackb(response.content)
+        assert task["name"] == "Packed" and task["priority"] == "high"
+        assert datetime.fromisoformat(task["due_date"]).replace(tzinfo=timezone.utc) == due
+
+        headers = {**auth_headers, "Content-Type": "application/msgpack"}
+        response = client.patch(f"{tasks_url}/{task['id']}", content=msgpack.packb({"name": "Renamed"}), headers=headers)
+        assert response.json()["name"] == "Renamed"
+        # Validated by the same schema as JSON bodies
+        response = client.patch(f"{tasks_url}/{task['id']}", content=msgpack.packb({"name": " "}), headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        response = client.post(tasks_url, content=b"\xc1", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert response.json() == {"detail": "Invalid MessagePack body"}
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_reads_match_json(self, client, auth_headers, monkeypatch, tasks_url, test_task, fast):
+        # fast: packed by fast_json instead of re-encoded by the middleware
+        monkeypatch.setattr(fast_json.settings, "FAST_JSON_ENABLED", fast)
+        client.post(tasks_url, json={"name": "Second"}, headers=auth_headers)
+        for url in (tasks_url, f"{tasks_url}?page=2&page_size=1", f"{tasks_url}?fields=name", f"{tasks_url}/{test_task['id']}"):
+            plain = client.get(url, headers=auth_headers)
+            packed = client.get(url, headers={**auth_headers, **self.PACKED})
+            assert packed.headers["content-type"] == "application/msgpack"
+            assert "Accept" in packed.headers["vary"] and "Accept" in plain.headers["vary"]
+            assert msgpack.unpackb(packed.content) == plain.json()
+
+    def test_without_msgpack_installed(self, client, auth_headers, monkeypatch, tasks_url):
+        monkeypatch.setattr(msgpack_negotiation, "msgpack", None)
+        response = client.get(tasks_url, headers={**auth_headers, **self.PACKED})
+        assert response.headers["content-type"] == "application/json"
+        response = client.post(
+            tasks_url, content=b"\x80", headers={**auth_headers, "Content-Type": "application/msgpack"}
+        )
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE